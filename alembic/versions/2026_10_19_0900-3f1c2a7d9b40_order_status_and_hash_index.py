@@ -0,0 +1,29 @@
+"""order status and hash index
+
+Revision ID: 3f1c2a7d9b40
+Revises: e68ba9a78dc0
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a7d9b40'
+down_revision = 'e68ba9a78dc0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('limit_orders', sa.Column('status', sa.JSON(), nullable=True))
+    op.add_column('limit_orders', sa.Column('status_updated_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        'ix_limit_orders_blockchain_id_order_hash', 'limit_orders', ['blockchain_id', 'order_hash'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_limit_orders_blockchain_id_order_hash', table_name='limit_orders')
+    op.drop_column('limit_orders', 'status_updated_at')
+    op.drop_column('limit_orders', 'status')
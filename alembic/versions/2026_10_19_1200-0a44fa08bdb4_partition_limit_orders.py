@@ -0,0 +1,87 @@
+"""partition limit_orders by chain and creation month
+
+Revision ID: 0a44fa08bdb4
+Revises: 3f1c2a7d9b40
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from datetime import datetime, timezone
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from inch_mcp_server.database.partitions import create_partition_statements, month_start
+
+# revision identifiers, used by Alembic.
+revision = '0a44fa08bdb4'
+down_revision = '3f1c2a7d9b40'
+branch_labels = None
+depends_on = None
+
+COLUMNS = "id, blockchain_id, address, order_hash, data, status, status_updated_at"
+
+
+def _columns():
+    return [
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('blockchain_id', sa.Integer(), nullable=False),
+        sa.Column('address', sa.String(length=42), nullable=False),
+        sa.Column('order_hash', sa.String(length=66), nullable=False),
+        sa.Column('data', sa.JSON(), nullable=False),
+        sa.Column('status', sa.JSON(), nullable=True),
+        sa.Column('status_updated_at', sa.DateTime(timezone=True), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.rename_table('limit_orders', 'limit_orders_unpartitioned')
+    op.execute('ALTER TABLE limit_orders_unpartitioned RENAME CONSTRAINT limit_orders_pkey TO limit_orders_unpartitioned_pkey')
+    op.drop_index('ix_limit_orders_blockchain_id_order_hash', table_name='limit_orders_unpartitioned')
+
+    op.create_table(
+        'limit_orders',
+        *_columns(),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id', 'blockchain_id', 'created_at'),
+        postgresql_partition_by='RANGE (blockchain_id, created_at)',
+    )
+    op.create_index(
+        'ix_limit_orders_blockchain_id_order_hash', 'limit_orders', ['blockchain_id', 'order_hash'], unique=False
+    )
+    op.create_index(
+        'ix_limit_orders_blockchain_id_address', 'limit_orders', ['blockchain_id', 'address', 'order_hash'], unique=False
+    )
+    op.execute('CREATE TABLE limit_orders_default PARTITION OF limit_orders DEFAULT')
+
+    # Existing rows have no creation time; they start in the current month's partition of their chain
+    month = month_start(datetime.now(timezone.utc))
+    chains = []
+    if not context.is_offline_mode():
+        query = sa.text('SELECT DISTINCT blockchain_id FROM limit_orders_unpartitioned')
+        chains = [row[0] for row in op.get_bind().execute(query)]
+    for chain in chains:
+        for statement in create_partition_statements(chain, month):
+            op.execute(statement)
+    op.execute(
+        'INSERT INTO limit_orders ({columns}, created_at) SELECT {columns}, now() FROM limit_orders_unpartitioned'.format(
+            columns=COLUMNS
+        )
+    )
+    op.drop_table('limit_orders_unpartitioned')
+
+
+def downgrade() -> None:
+    op.rename_table('limit_orders', 'limit_orders_partitioned')
+    op.execute('ALTER INDEX ix_limit_orders_blockchain_id_order_hash RENAME TO ix_limit_orders_partitioned_blockchain_id_order_hash')
+    op.execute('ALTER TABLE limit_orders_partitioned RENAME CONSTRAINT limit_orders_pkey TO limit_orders_partitioned_pkey')
+
+    op.create_table('limit_orders', *_columns(), sa.PrimaryKeyConstraint('id'))
+    op.execute(
+        'INSERT INTO limit_orders ({columns}) SELECT {columns} FROM limit_orders_partitioned'.format(columns=COLUMNS)
+    )
+    op.create_index(
+        'ix_limit_orders_blockchain_id_order_hash', 'limit_orders', ['blockchain_id', 'order_hash'], unique=False
+    )
+    # Drops every partition with it
+    op.drop_table('limit_orders_partitioned')
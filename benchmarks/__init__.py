@@ -0,0 +1 @@
+"""Offline micro-benchmarks for the 1inch MCP server."""
@@ -0,0 +1,73 @@
+"""Run the benchmark suite.
+
+Usage:
+    python -m benchmarks                                  # run everything
+    python -m benchmarks --filter models.                 # run a subset
+    python -m benchmarks --save benchmarks/baseline.json  # refresh the baseline
+    python -m benchmarks --compare benchmarks/baseline.json --tolerance 0.3
+
+Everything runs offline: upstream calls go through ``httpx.MockTransport`` and
+the database defaults to an in-memory SQLite (requires ``aiosqlite``). Pass
+``--database-url postgresql+asyncpg://...`` to benchmark against a local Postgres.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Settings() validates the Postgres fields at import time and the API client sends
+# INCH_API_KEY as a header; benchmarks never reach a real server with either
+for _name in ("POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_HOST", "POSTGRES_PORT", "POSTGRES_DB", "INCH_API_KEY"):
+    os.environ.setdefault(_name, "benchmark")
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="1inch MCP micro-benchmarks")
+    parser.add_argument("--filter", default=None, help="Only run benchmarks whose name contains this substring")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeats per benchmark (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per repeat when calibrating")
+    parser.add_argument("--database-url", default="sqlite+aiosqlite://", help="Database used by service benchmarks")
+    parser.add_argument("--save", type=Path, nargs="?", const=DEFAULT_BASELINE, help="Save results as a baseline")
+    parser.add_argument("--compare", type=Path, nargs="?", const=DEFAULT_BASELINE, help="Compare with a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown ratio before failing")
+    return parser.parse_args(argv)
+
+
+async def run_all(args: argparse.Namespace):
+    from . import bench_handler, bench_models, bench_order_batch, bench_service, bench_validation
+    from .harness import Runner
+
+    runner = Runner(repeat=args.repeat, min_time=args.min_time, name_filter=args.filter)
+    await bench_models.run(runner)
+    await bench_validation.run(runner)
+    await bench_order_batch.run(runner)
+    await bench_service.run(runner, args.database_url)
+    await bench_handler.run(runner, args.database_url)
+    return runner.results
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    # Service and client loggers log every payload at INFO, which would dominate the timings
+    logging.disable(logging.INFO)
+
+    from .harness import compare_results, save_results
+
+    results = asyncio.run(run_all(args))
+    if args.save:
+        save_results(results, args.save)
+    if args.compare:
+        regressions = compare_results(results, args.compare, args.tolerance)
+        if regressions:
+            print(f"\n{regressions} benchmark(s) regressed by more than {args.tolerance:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""Dispatch overhead of ``LimitOrderHandler`` tools through an in-process FastMCP client."""
+
+from fastmcp import Client, FastMCP
+
+from inch_mcp_server.handlers import LimitOrderHandler
+from inch_mcp_server.integrations.services.limit_order_service import LimitOrderService
+
+from .fixtures import MockOrderbook, database, mock_api_client
+from .harness import Runner
+from .payloads import make_orders
+
+CHAIN = 1
+MAKER = "0x00000000000000000000000000000000000000bb"
+
+
+async def run(runner: Runner, database_url: str) -> None:
+    if not runner.wants("handler."):
+        return
+
+    orders = make_orders(100, seed=7, maker=MAKER)
+    order_hash = orders[0]["orderHash"]
+    service = LimitOrderService(api_client=mock_api_client(MockOrderbook({MAKER: orders})))
+
+    mcp = FastMCP("benchmark")
+    LimitOrderHandler(mcp, service)
+
+    # The session scope must be entered before the client starts the in-process
+    # server so that tool calls inherit the same ``db.session`` context.
+    async with database(database_url):
+        async with Client(mcp) as client:
+            await runner.measure_async(
+                "handler.get_1inch_protocol_info.client",
+                lambda: client.call_tool("get_1inch_protocol_info", {"query": "fees"}),
+            )
+            await runner.measure_async(
+                "handler.get_limit_order_by_hash.direct_service",
+                lambda: service.fetch_order_by_hash(CHAIN, order_hash),
+            )
+            await runner.measure_async(
+                "handler.get_limit_order_by_hash.client",
+                lambda: client.call_tool("get_limit_order_by_hash", {"chain": CHAIN, "order_hash": order_hash}),
+            )
+            await runner.measure_async(
+                "handler.get_limit_orders_by_chain_and_address.client",
+                lambda: client.call_tool("get_limit_orders_by_chain_and_address", {"chain": CHAIN, "address": MAKER}),
+            )
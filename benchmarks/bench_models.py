@@ -0,0 +1,29 @@
+"""Parse and dump costs of the Pydantic models in ``core/models.py``."""
+
+from inch_mcp_server.core.models import GetLimitOrdersV4Response, LimitOrderV4Response, PostLimitOrderV4Request
+
+from .harness import Runner
+from .payloads import make_orders
+
+
+async def run(runner: Runner) -> None:
+    orders = make_orders(1000)
+    single = orders[0]
+
+    runner.measure("models.order.validate", lambda: LimitOrderV4Response.model_validate(single))
+    runner.measure("models.order.kwargs_init", lambda: GetLimitOrdersV4Response(**single))
+
+    parsed = LimitOrderV4Response.model_validate(single)
+    runner.measure("models.order.dump", lambda: parsed.model_dump())
+    runner.measure("models.order.dump_json_mode", lambda: parsed.model_dump(mode="json"))
+
+    post = PostLimitOrderV4Request(orderHash=single["orderHash"], signature=single["signature"], data=single["data"])
+    runner.measure("models.post_request.dump_json_mode", lambda: post.model_dump(mode="json"))
+
+    # Same construction style as LimitOrderService.fetch_and_store_orders
+    runner.measure(
+        "models.orders_1000.kwargs_init",
+        lambda: [GetLimitOrdersV4Response(**order) for order in orders],
+    )
+    batch = [GetLimitOrdersV4Response(**order) for order in orders]
+    runner.measure("models.orders_1000.dump", lambda: [order.model_dump() for order in batch])
@@ -0,0 +1,48 @@
+"""Memory footprint and construction cost of ``OrderBatch`` versus Pydantic models."""
+
+import gc
+import tracemalloc
+
+from inch_mcp_server.core.models import GetLimitOrdersV4Response
+from inch_mcp_server.core.order_batch import OrderBatch
+
+from .harness import Runner
+from .payloads import make_orders
+
+BATCH_SIZE = 10_000
+
+
+def _bytes_per_order(build, orders) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = build(orders)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return (after - before) / len(orders)
+
+
+def _build_models(orders):
+    return [GetLimitOrdersV4Response(**order) for order in orders]
+
+
+async def run(runner: Runner) -> None:
+    if not runner.wants("order_batch."):
+        return
+
+    orders = make_orders(BATCH_SIZE, seed=11)
+    # Pydantic models keep references to the input strings, so give each build its own copy
+    model_bytes = _bytes_per_order(_build_models, make_orders(BATCH_SIZE, seed=11))
+    batch_bytes = _bytes_per_order(OrderBatch.from_orders, make_orders(BATCH_SIZE, seed=11))
+    print(f"bytes/order: pydantic {model_bytes:.0f}, OrderBatch {batch_bytes:.0f} ({model_bytes / batch_bytes:.1f}x)")
+
+    runner.measure(f"order_batch.build_{BATCH_SIZE}.pydantic", lambda: _build_models(orders),
+                   extra={"bytes_per_order": model_bytes})
+    runner.measure(f"order_batch.build_{BATCH_SIZE}.order_batch", lambda: OrderBatch.from_orders(orders),
+                   extra={"bytes_per_order": batch_bytes})
+
+    batch = OrderBatch.from_orders(orders)
+    runner.measure(f"order_batch.scan_{BATCH_SIZE}.remaining_amounts",
+                   lambda: sum(view.remaining_maker_amount for view in batch))
+    runner.measure(f"order_batch.to_models_{BATCH_SIZE}", batch.to_models)
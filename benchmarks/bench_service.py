@@ -0,0 +1,41 @@
+"""Sync/diff cost of ``LimitOrderService.fetch_and_store_orders``."""
+
+from sqlalchemy import delete
+
+from inch_mcp_server.database import LimitOrder
+from inch_mcp_server.integrations.services.limit_order_service import LimitOrderService
+
+from .fixtures import MockOrderbook, database, mock_api_client, order_rows
+from .harness import Runner
+from .payloads import make_orders
+
+CHAIN = 1
+MAKER = "0x00000000000000000000000000000000000000aa"
+
+
+async def run(runner: Runner, database_url: str) -> None:
+    if not any(runner.wants(f"service.fetch_and_store_orders.{size}") for size in ("100", "1000")):
+        return
+
+    async with database(database_url) as db:
+        for size in (100, 1000):
+            orders = make_orders(size, seed=size, maker=MAKER)
+            stale = make_orders(size // 10, seed=size + 1, maker=MAKER)
+            service = LimitOrderService(api_client=mock_api_client(MockOrderbook({MAKER: orders})))
+
+            await db.session.execute(delete(LimitOrder))
+            db.session.add_all(order_rows(CHAIN, MAKER, orders))
+            await db.session.commit()
+
+            await runner.measure_async(
+                f"service.fetch_and_store_orders.{size}.steady",
+                lambda: service.fetch_and_store_orders(CHAIN, MAKER),
+            )
+
+            async def with_stale_rows():
+                # Re-seed 10% outdated rows so every call exercises the delete path
+                db.session.add_all(order_rows(CHAIN, MAKER, stale))
+                await db.session.commit()
+                await service.fetch_and_store_orders(CHAIN, MAKER)
+
+            await runner.measure_async(f"service.fetch_and_store_orders.{size}.stale_10pct", with_stale_rows)
@@ -0,0 +1,50 @@
+"""Throughput of ``utils/validation`` over large batches of inputs."""
+
+from inch_mcp_server.core.models import PostLimitOrderV4Request
+from inch_mcp_server.integrations.services.order_verifier import OrderVerifier
+from inch_mcp_server.utils import is_valid_evm_address, is_valid_hash, validate_evm_address
+
+from .harness import Runner
+from .payloads import make_addresses, make_hashes, make_orders
+
+BATCH_SIZE = 100_000
+ORDER_BATCH_SIZE = 512
+
+
+def _validate_all(addresses):
+    failures = 0
+    for address in addresses:
+        try:
+            validate_evm_address(address, "address", required=True)
+        except ValueError:
+            failures += 1
+    return failures
+
+
+async def run(runner: Runner) -> None:
+    addresses = make_addresses(BATCH_SIZE)
+    hashes = make_hashes(BATCH_SIZE)
+
+    runner.measure(
+        f"validation.is_valid_evm_address.batch_{BATCH_SIZE}",
+        lambda: [is_valid_evm_address(address) for address in addresses],
+    )
+    runner.measure(
+        f"validation.validate_evm_address.batch_{BATCH_SIZE}",
+        lambda: _validate_all(addresses),
+    )
+    runner.measure(
+        f"validation.is_valid_hash.batch_{BATCH_SIZE}",
+        lambda: [is_valid_hash(value) for value in hashes],
+    )
+
+    orders = [PostLimitOrderV4Request(**order) for order in make_orders(ORDER_BATCH_SIZE, seed=13)]
+    verifier = OrderVerifier()
+    runner.measure(
+        f"validation.order_hash.one_by_one_{ORDER_BATCH_SIZE}",
+        lambda: [verifier.verify_many(1, [order]) for order in orders],
+    )
+    runner.measure(
+        f"validation.order_hash.verify_many_{ORDER_BATCH_SIZE}",
+        lambda: verifier.verify_many(1, orders),
+    )
@@ -0,0 +1,85 @@
+"""Offline stand-ins for the upstream API and the database used by benchmarks."""
+
+import json
+from contextlib import asynccontextmanager
+from typing import Dict, List
+from uuid import uuid4
+
+import httpx
+from fastapi_async_sqlalchemy import SQLAlchemyMiddleware, db
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from inch_mcp_server.database import Base, LimitOrder
+from inch_mcp_server.integrations.api.limit_order_api_client import LimitOrderAPIClient
+
+
+class MockOrderbook:
+    """In-memory orderbook answering the endpoints used by ``LimitOrderAPIClient``."""
+
+    def __init__(self, orders_by_address: Dict[str, List[dict]]):
+        self.orders_by_address = {address.lower(): orders for address, orders in orders_by_address.items()}
+        self.orders_by_hash = {
+            order["orderHash"]: order for orders in orders_by_address.values() for order in orders
+        }
+        self._encoded_by_address = {
+            address: json.dumps(orders).encode() for address, orders in self.orders_by_address.items()
+        }
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        parts = request.url.path.strip("/").split("/")
+        # /orderbook/v4.0/{chain}/{endpoint}/{arg}
+        endpoint = parts[3] if len(parts) > 3 else ""
+        if endpoint == "address":
+            body = self._encoded_by_address.get(parts[4].lower(), b"[]")
+            return httpx.Response(200, content=body, headers={"content-type": "application/json"})
+        if endpoint == "order":
+            order = self.orders_by_hash.get(parts[4])
+            if order is None:
+                return httpx.Response(404, json={"message": "order not found"})
+            return httpx.Response(200, json=order)
+        if endpoint == "count":
+            return httpx.Response(200, json={"count": len(self.orders_by_hash)})
+        return httpx.Response(404, json={"message": f"unknown endpoint {request.url.path}"})
+
+
+def mock_api_client(orderbook: MockOrderbook) -> LimitOrderAPIClient:
+    """Create an API client whose HTTP transport is served by ``orderbook``."""
+    return LimitOrderAPIClient(transport=httpx.MockTransport(orderbook.handler))
+
+
+async def _noop_app(scope, receive, send):
+    pass
+
+
+@asynccontextmanager
+async def database(database_url: str):
+    """Create the schema on ``database_url`` and open a ``db.session`` scope.
+
+    ``LimitOrderService`` talks to the database through the request-scoped
+    ``fastapi_async_sqlalchemy.db`` proxy, so the middleware is initialised
+    against the benchmark engine and a session is opened for the whole run.
+    """
+    engine = create_async_engine(database_url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+    SQLAlchemyMiddleware(_noop_app, custom_engine=engine)
+    try:
+        async with db():
+            yield db
+    finally:
+        await engine.dispose()
+
+
+def order_rows(chain: int, address: str, orders: List[dict]) -> List[LimitOrder]:
+    """Build ``LimitOrder`` rows the way ``LimitOrderService.post_order`` stores them."""
+    return [
+        LimitOrder(
+            id=uuid4(),
+            blockchain_id=chain,
+            address=address.lower(),
+            order_hash=order["orderHash"],
+            data={"orderHash": order["orderHash"], "signature": order["signature"], "data": order["data"]},
+        )
+        for order in orders
+    ]
@@ -0,0 +1,128 @@
+"""Timing harness and baseline comparison for the benchmark suite."""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+class Runner:
+    """Collects timings for sync and async callables.
+
+    Each benchmark is run ``repeat`` times; every repeat calls the function
+    ``number`` times in a tight loop. When ``number`` is not given it is
+    calibrated so a single repeat takes at least ``min_time`` seconds.
+    """
+
+    def __init__(self, repeat: int = 5, min_time: float = 0.2, name_filter: Optional[str] = None):
+        self.repeat = repeat
+        self.min_time = min_time
+        self.name_filter = name_filter
+        self.results: Dict[str, dict] = {}
+
+    def wants(self, name: str) -> bool:
+        """Return True if ``name`` passes the ``--filter`` substring."""
+        return not self.name_filter or self.name_filter in name
+
+    def _record(self, name: str, samples: List[float], number: int, extra: Optional[dict]) -> None:
+        per_op = [sample / number for sample in samples]
+        result = {
+            "ns_per_op": statistics.median(per_op),
+            "min_ns_per_op": min(per_op),
+            "number": number,
+            "repeat": len(samples),
+        }
+        if extra:
+            result.update(extra)
+        self.results[name] = result
+        print(f"{name:<60} {_format_ns(result['ns_per_op']):>12}/op  (x{number}, {len(samples)} repeats)")
+
+    def measure(self, name: str, func: Callable[[], object], number: Optional[int] = None,
+                extra: Optional[dict] = None) -> None:
+        """Time a synchronous callable."""
+        if not self.wants(name):
+            return
+        if number is None:
+            number = 1
+            while True:
+                start = time.perf_counter_ns()
+                for _ in range(number):
+                    func()
+                if time.perf_counter_ns() - start >= self.min_time * 1e9 or number >= 1 << 20:
+                    break
+                number *= 2
+        samples = []
+        for _ in range(self.repeat):
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                func()
+            samples.append(time.perf_counter_ns() - start)
+        self._record(name, samples, number, extra)
+
+    async def measure_async(self, name: str, func: Callable[[], Awaitable[object]], number: Optional[int] = None,
+                            extra: Optional[dict] = None) -> None:
+        """Time an async callable, awaiting each call sequentially."""
+        if not self.wants(name):
+            return
+        if number is None:
+            number = 1
+            while True:
+                start = time.perf_counter_ns()
+                for _ in range(number):
+                    await func()
+                if time.perf_counter_ns() - start >= self.min_time * 1e9 or number >= 1 << 16:
+                    break
+                number *= 2
+        samples = []
+        for _ in range(self.repeat):
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                await func()
+            samples.append(time.perf_counter_ns() - start)
+        self._record(name, samples, number, extra)
+
+
+def _format_ns(value: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if value >= scale:
+            return f"{value / scale:.2f} {unit}"
+    return f"{value:.0f} ns"
+
+
+def save_results(results: Dict[str, dict], path: Path) -> None:
+    """Write results together with a short description of the machine."""
+    payload = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    print(f"\nSaved {len(results)} results to {path}")
+
+
+def compare_results(results: Dict[str, dict], path: Path, tolerance: float) -> int:
+    """Compare results with a saved baseline.
+
+    Returns:
+        int: Number of benchmarks slower than ``baseline * (1 + tolerance)``
+    """
+    baseline = json.loads(path.read_text())["benchmarks"]
+    regressions = 0
+    print(f"\n{'benchmark':<60} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            print(f"{name:<60} {'-':>12} {_format_ns(result['ns_per_op']):>12} {'new':>7}")
+            continue
+        ratio = result["ns_per_op"] / baseline[name]["ns_per_op"]
+        marker = ""
+        if ratio > 1 + tolerance:
+            regressions += 1
+            marker = "  REGRESSION"
+        print(
+            f"{name:<60} {_format_ns(baseline[name]['ns_per_op']):>12} "
+            f"{_format_ns(result['ns_per_op']):>12} {ratio:>6.2f}x{marker}"
+        )
+    return regressions
@@ -0,0 +1,37 @@
+"""Deterministic batches of synthetic payloads for the benchmarks, built on ``loadtest.payloads``."""
+
+import random
+from typing import List
+
+from loadtest.payloads import make_order, make_token_universe, random_hex
+
+
+def make_orders(count: int, seed: int = 1, maker: str = None) -> List[dict]:
+    """Build ``count`` orders, optionally all owned by the same maker."""
+    rng = random.Random(seed)
+    tokens = make_token_universe(rng)
+    return [make_order(rng, tokens, maker) for _ in range(count)]
+
+
+def make_addresses(count: int, seed: int = 2, invalid_ratio: float = 0.1) -> List[str]:
+    """Build a batch of addresses where roughly ``invalid_ratio`` are malformed."""
+    rng = random.Random(seed)
+    addresses = []
+    for _ in range(count):
+        address = random_hex(rng, 20)
+        if rng.random() < invalid_ratio:
+            address = address[: rng.randint(0, 41)]
+        addresses.append(address)
+    return addresses
+
+
+def make_hashes(count: int, seed: int = 3, invalid_ratio: float = 0.1) -> List[str]:
+    """Build a batch of order hashes where roughly ``invalid_ratio`` are malformed."""
+    rng = random.Random(seed)
+    hashes = []
+    for _ in range(count):
+        value = random_hex(rng, 32)
+        if rng.random() < invalid_ratio:
+            value = value[2:]
+        hashes.append(value)
+    return hashes
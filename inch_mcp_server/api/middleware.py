@@ -0,0 +1,56 @@
+"""ASGI middleware for the REST API."""
+
+import asyncio
+from typing import Sequence
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+
+from inch_mcp_server.config import settings
+from inch_mcp_server.utils.deadline import deadline, requested_budget
+from inch_mcp_server.utils.logger_setup import setup_logger
+
+logger = setup_logger("api.middleware")
+
+
+class RequestDeadlineMiddleware:
+    """Runs each REST request under a time budget.
+
+    The budget is the ``X-Request-Timeout`` header or ``REQUEST_TIMEOUT_SECONDS``.
+    A request that fails on its deadline, or is still running
+    ``DEADLINE_GRACE_SECONDS`` after it, gets a 504 if no response has started.
+    Paths in ``exclude`` (the mounted MCP app, which budgets per tool) are passed through.
+    """
+
+    def __init__(self, app, exclude: Sequence[str] = ()):
+        self.app = app
+        self.exclude = tuple(exclude)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude):
+            await self.app(scope, receive, send)
+            return
+
+        budget = requested_budget(
+            Headers(scope=scope).get("x-request-timeout"), settings.request_timeout_seconds,
+            settings.max_timeout_seconds,
+        )
+        started = False
+
+        async def send_wrapper(message):
+            nonlocal started
+            started = True
+            await send(message)
+
+        try:
+            async with asyncio.timeout(budget + settings.deadline_grace_seconds):
+                with deadline(budget):
+                    await self.app(scope, receive, send_wrapper)
+        except TimeoutError as e:
+            if started:
+                raise
+            logger.warning("{} {} exceeded its {:.1f}s budget: {}".format(scope["method"], scope["path"], budget, e))
+            response = JSONResponse(
+                {"detail": "Request exceeded its time budget of {:.1f}s".format(budget)}, status_code=504
+            )
+            await response(scope, receive, send)
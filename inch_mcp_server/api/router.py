@@ -2,11 +2,12 @@
 
 from fastapi import APIRouter
 
-from inch_mcp_server.api.routes import health, limit_orders
+from inch_mcp_server.api.routes import health, limit_orders, metrics
 
 # Create the main API router
 api_router = APIRouter()
 
 # Include all route modules
 api_router.include_router(limit_orders.router)
-api_router.include_router(health.router)
\ No newline at end of file
+api_router.include_router(health.router)
+api_router.include_router(metrics.router)
\ No newline at end of file
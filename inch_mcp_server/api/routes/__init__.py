@@ -1,5 +1,5 @@
 """Routes package containing all API endpoint routers."""
 
-from . import health, limit_orders
+from . import health, limit_orders, metrics
 
-__all__ = ["health", "limit_orders"]
\ No newline at end of file
+__all__ = ["health", "limit_orders", "metrics"]
\ No newline at end of file
@@ -2,10 +2,16 @@
 
 from fastapi import APIRouter
 
+from inch_mcp_server.database import schema_state, schema_writable
+
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health")
 async def health_check():
-    """Health check endpoint to verify service status."""
-    return {"status": "healthy", "service": "1inch-mcp"}
\ No newline at end of file
+    """Health check endpoint to verify service status; ``degraded`` while serving read-only during a migration."""
+    return {
+        "status": "healthy" if schema_writable() else "degraded",
+        "service": "1inch-mcp",
+        "schema": schema_state(),
+    }
\ No newline at end of file
@@ -1,19 +1,63 @@
 """Limit order API routes."""
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
 
-from inch_mcp_server.dependencies import LimitOrderServiceDep
-from inch_mcp_server.core.models import FeeExtension, PostLimitOrderV4Request
+from inch_mcp_server.config import settings
+from inch_mcp_server.database import SchemaNotReady
+from inch_mcp_server.dependencies import LimitOrderServiceDep, admit_request
+from inch_mcp_server.core.models import (
+    BulkPostOrdersRequest,
+    FeeExtension,
+    FeeQuotesRequest,
+    GetLimitOrdersV4Response,
+    LimitOrderV4Response,
+    OrderCountMatrixRequest,
+    PostLimitOrderV4Request,
+)
+from inch_mcp_server.integrations.services.order_verifier import OrderVerificationError
+from inch_mcp_server.integrations.services.snapshots import InvalidCursorError
+from inch_mcp_server.utils import validate_evm_address
+from inch_mcp_server.utils.projection import project, validate_fields
 
-router = APIRouter(prefix="/orders", tags=["limit-orders"])
+router = APIRouter(prefix="/orders", tags=["limit-orders"], dependencies=[Depends(admit_request)])
+
+
+def _validated_fields(model, fields: Optional[str]):
+    try:
+        return validate_fields(model, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+def _schema_not_ready(error: SchemaNotReady) -> HTTPException:
+    retry_after = str(max(1, round(settings.schema_recheck_seconds)))
+    return HTTPException(status_code=503, detail=str(error), headers={"Retry-After": retry_after})
 
 
 @router.get("")
-async def get_orders(chain: int, address: str, service: LimitOrderServiceDep):
-    """Fetch and store orders for a given chain and address."""
-    return await service.fetch_and_store_orders(chain, address)
+async def get_orders(
+    chain: int, 
+    address: str, 
+    service: LimitOrderServiceDep, 
+    fields: str = None, 
+    limit: int = Query(None, ge=1, le=100), 
+    cursor: str = None
+):
+    """Fetch and store orders for a given chain and address.
+
+    ``fields`` is a comma-separated projection such as ``orderHash,data.makerAsset`` or ``compact``.
+    With ``limit`` or ``cursor`` the response is a page with ``nextCursor``.
+    """
+    fields = _validated_fields(GetLimitOrdersV4Response, fields)
+    if limit is None and not cursor:
+        return project(await service.fetch_and_store_orders(chain, address), fields)
+    try:
+        page = await service.fetch_orders_page(chain, address, limit or 100, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return project(page, fields, items="items")
 
 
 @router.get("/fee/{chain}")
@@ -35,16 +79,50 @@ async def get_fee(
     return await service.retrieve_order_fee(chain, fee_extension)
 
 
+@router.post("/fee/{chain}/quotes")
+async def get_fee_quotes(chain: int, request: FeeQuotesRequest, service: LimitOrderServiceDep):
+    """Compute fees for many order sizes of one pair from cached fee parameters."""
+    try:
+        validate_evm_address(request.makerAsset, "makerAsset", required=True)
+        validate_evm_address(request.takerAsset, "takerAsset", required=True)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return await service.quote_order_fees(chain, request.makerAsset, request.takerAsset, request.amounts)
+
+
 @router.post("")
 async def store_order(chain: int, order: PostLimitOrderV4Request, service: LimitOrderServiceDep):
-    """Store/post a new limit order."""
-    return await service.post_order(chain, order)
+    """Store/post a new limit order; orders whose hash does not match their data are rejected with 422."""
+    try:
+        return await service.post_order(chain, order)
+    except OrderVerificationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except SchemaNotReady as e:
+        raise _schema_not_ready(e)
+
+
+@router.post("/bulk")
+async def store_orders_bulk(chain: int, request: BulkPostOrdersRequest, service: LimitOrderServiceDep):
+    """Post many signed orders at once; the response reports accepted, rejected or failed for each order."""
+    try:
+        return await service.post_orders(chain, request.orders)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except SchemaNotReady as e:
+        raise _schema_not_ready(e)
 
 
 @router.get("/{order_hash}")
-async def get_order_by_hash(chain: int, order_hash: str, service: LimitOrderServiceDep):
-    """Get a specific order by its hash."""
-    return await service.fetch_order_by_hash(chain, order_hash)
+async def get_order_by_hash(
+    chain: int, 
+    order_hash: str, 
+    service: LimitOrderServiceDep, 
+    refresh_status: bool = False,
+    fields: str = None
+):
+    """Get a specific order by its hash, served from the database when we hold it."""
+    fields = _validated_fields(LimitOrderV4Response, fields)
+    return project(await service.fetch_order_by_hash(chain, order_hash, refresh_status), fields)
 
 
 @router.get("/count/{chain}")
@@ -59,12 +137,63 @@ async def get_orders_count(
     return await service.fetch_orders_count(chain, statuses, taker_asset, maker_asset)
 
 
+@router.post("/count/{chain}/matrix")
+async def get_orders_count_matrix(chain: int, request: OrderCountMatrixRequest, service: LimitOrderServiceDep):
+    """Count orders for every combination of asset pairs and status sets."""
+    try:
+        return await service.fetch_orders_count_matrix(chain, request.pairs, request.statusSets)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
 @router.get("/unique-active-pairs/{chain}")
 async def get_unique_active_pairs(
     service: LimitOrderServiceDep, 
     chain: int = 1, 
-    page: int = 1, 
-    limit: int = 100
+    page: int = Query(1, ge=1), 
+    limit: int = Query(100, ge=1, le=100), 
+    cursor: str = None
+):
+    """Get unique active trading pairs for a chain; pass ``nextCursor`` back as ``cursor`` for the next page."""
+    try:
+        return await service.fetch_unique_active_pairs(chain, page, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/pairs/{chain}/search")
+async def search_token_pairs(chain: int, token: str, service: LimitOrderServiceDep):
+    """Find every active trading pair involving a token."""
+    return await service.search_token_pairs(chain, token)
+
+
+@router.get("/depth/{chain}")
+async def get_orderbook_depth(
+    chain: int, 
+    base_asset: str, 
+    quote_asset: str, 
+    service: LimitOrderServiceDep, 
+    top_k: int = Query(10, ge=1, le=100), 
+    base_decimals: int = Query(0, ge=0), 
+    quote_decimals: int = Query(0, ge=0), 
+    max_orders: int = Query(1000, ge=1, le=5000)
+):
+    """Get best rates and cumulative depth for a token pair."""
+    return await service.get_orderbook_depth(
+        chain, base_asset, quote_asset, top_k=top_k, max_orders=max_orders,
+        base_decimals=base_decimals, quote_decimals=quote_decimals,
+    )
+
+
+@router.get("/best/{chain}")
+async def get_best_orders(
+    chain: int, 
+    maker_asset: str, 
+    taker_asset: str, 
+    service: LimitOrderServiceDep, 
+    k: int = Query(10, ge=1, le=100), 
+    fields: str = None
 ):
-    """Get unique active trading pairs for a chain."""
-    return await service.fetch_unique_active_pairs(chain, page, limit)
\ No newline at end of file
+    """Get the k cheapest active orders selling maker_asset for taker_asset."""
+    fields = _validated_fields(GetLimitOrdersV4Response, fields)
+    return project(await service.get_best_orders(chain, maker_asset, taker_asset, k), fields, items="orders")
@@ -0,0 +1,24 @@
+"""Runtime metrics API routes."""
+
+from fastapi import APIRouter
+
+from inch_mcp_server.database import pool_snapshot
+from inch_mcp_server.dependencies import AdmissionControllerDep, APIClientDep, WriteBehindDep
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics")
+async def get_metrics(api_client: APIClientDep, admission: AdmissionControllerDep,
+                      write_behind: WriteBehindDep):
+    """Upstream limits, pools and API key quotas, admission queues, database pool and write-behind backlog."""
+    return {
+        "upstream": {
+            "limiters": api_client.limiters.snapshot(),
+            "pools": api_client.pool_snapshot(),
+            "credentials": api_client.credentials.snapshot(),
+        },
+        "admission": admission.snapshot(),
+        "database": {"pool": pool_snapshot()},
+        "writeBehind": write_behind.snapshot() if write_behind is not None else None,
+    }
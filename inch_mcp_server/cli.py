@@ -2,19 +2,21 @@
 
 import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from inch_mcp_server.config import settings
+from inch_mcp_server.database.connection import close_database_connections, get_database_engine
 from inch_mcp_server.database.migrations import (
     check_migrations_needed,
     get_alembic_config,
     get_current_revision,
     run_migrations_sync,
 )
+from inch_mcp_server.database.partitions import ensure_partitions, list_partitions, purge_partitions
 from inch_mcp_server.utils.logger_setup import setup_logger
 
 # Initialize CLI app and console
@@ -30,6 +32,10 @@ logger = setup_logger("cli")
 db_app = typer.Typer(name="db", help="Database management commands")
 app.add_typer(db_app, name="db")
 
+# Partition command group
+partitions_app = typer.Typer(name="partitions", help="Manage limit_orders partitions")
+db_app.add_typer(partitions_app, name="partitions")
+
 
 @db_app.command("migrate")
 def migrate(
@@ -132,6 +138,96 @@ def init_db():
         raise typer.Exit(1)
 
 
+async def _with_engine(operation):
+    try:
+        return await operation(get_database_engine())
+    finally:
+        await close_database_connections()
+
+
+@partitions_app.command("list")
+def partitions_list():
+    """List limit_orders partitions with their estimated row counts."""
+    try:
+
+        async def load(engine):
+            async with engine.connect() as connection:
+                return await list_partitions(connection)
+
+        partitions = asyncio.run(_with_engine(load))
+
+        table = Table(title="limit_orders Partitions")
+        table.add_column("Partition", style="cyan")
+        table.add_column("Chain", style="magenta")
+        table.add_column("Month", style="magenta")
+        table.add_column("Rows (est.)", style="green", justify="right")
+        for partition in partitions:
+            table.add_row(partition.name, str(partition.chain), partition.month.strftime("%Y-%m"), str(partition.rows))
+        console.print(table)
+
+    except Exception as e:
+        console.print(f"[red]❌ Failed to list partitions: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@partitions_app.command("create")
+def partitions_create(
+    months_ahead: int = typer.Option(
+        settings.partition_months_ahead, "--months-ahead", "-m", help="Months after the current one to create"
+    ),
+    chain: Optional[List[int]] = typer.Option(None, "--chain", "-c", help="Chain ID (repeatable, default: PARTITION_CHAINS)"),
+):
+    """Create partitions from the current month up to --months-ahead months ahead."""
+    try:
+        chains = chain or settings.partition_chains
+        created = asyncio.run(_with_engine(lambda engine: ensure_partitions(engine, chains, months_ahead)))
+
+        if created:
+            console.print(f"[green]✅ Created {len(created)} partitions: {', '.join(created)}[/green]")
+        else:
+            console.print("[green]✅ All partitions already exist![/green]")
+
+    except Exception as e:
+        console.print(f"[red]❌ Failed to create partitions: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@partitions_app.command("purge")
+def partitions_purge(
+    retention_days: int = typer.Option(
+        settings.order_retention_days, "--retention-days", "-r", help="Purge partitions whose month ended this long ago"
+    ),
+    archive_schema: Optional[str] = typer.Option(
+        settings.order_archive_schema, "--archive-schema", help="Move partitions into this schema instead of dropping them"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Only show which partitions would be purged"),
+):
+    """Drop or archive expired partitions, carrying orders that are still live forward."""
+    if retention_days <= 0:
+        console.print("[red]❌ --retention-days must be positive (ORDER_RETENTION_DAYS is not set)[/red]")
+        raise typer.Exit(1)
+    try:
+        purged = asyncio.run(_with_engine(
+            lambda engine: purge_partitions(engine, retention_days, archive_schema, dry_run=dry_run)
+        ))
+
+        table = Table(title="Purged Partitions")
+        table.add_column("Partition", style="cyan")
+        table.add_column("Live Orders Carried", style="magenta", justify="right")
+        table.add_column("Action", style="green")
+        for entry in purged:
+            carried = entry["carried"]
+            table.add_row(entry["partition"], "-" if carried is None else str(carried), entry["action"])
+        console.print(table)
+
+        if not purged:
+            console.print("\n[green]✅ No partitions past retention![/green]")
+
+    except Exception as e:
+        console.print(f"[red]❌ Failed to purge partitions: {e}[/red]")
+        raise typer.Exit(1)
+
+
 @app.command("version")
 def version():
     """Show version information."""
@@ -1,11 +1,29 @@
 """Configuration settings for the 1inch MCP Server using Pydantic Settings."""
 
-from typing import Union
+from pathlib import Path
+from typing import Dict, List, Optional, Union
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class PoolConfig(BaseModel):
+    """Capacity and timeout budget of one upstream connection pool."""
+
+    max_connections: int = Field(20, description="Maximum open connections in the pool")
+    max_keepalive_connections: int = Field(10, description="Idle connections kept alive for reuse")
+    timeout: float = Field(10.0, description="Connect/read/write timeout of a request in seconds")
+    pool_timeout: float = Field(2.0, description="Maximum wait for a free connection in seconds")
+
+
+class AdmissionConfig(BaseModel):
+    """Capacity of one admission class of tool calls and REST requests."""
+
+    concurrency: int = Field(32, description="Calls of this class running at the same time")
+    queue_size: int = Field(64, description="Calls allowed to wait for a slot; further calls are rejected")
+    max_queue_seconds: float = Field(2.0, description="Longest a call may wait for a slot before it is shed")
+
+
 class Settings(BaseSettings):
     """Configuration settings for the 1inch MCP Server.
 
@@ -24,7 +42,263 @@ class Settings(BaseSettings):
     postgres_port: str = Field(None, alias="POSTGRES_PORT")
     postgres_db: str = Field(None, alias="POSTGRES_DB")
 
+    db_pool_size: int = Field(10, alias="DB_POOL_SIZE", description="Connections kept open in the database pool")
+    db_max_overflow: int = Field(
+        20, alias="DB_MAX_OVERFLOW", description="Extra connections opened beyond DB_POOL_SIZE under load"
+    )
+    db_pool_timeout_seconds: float = Field(
+        30.0, alias="DB_POOL_TIMEOUT_SECONDS", description="How long a checkout waits for a free connection"
+    )
+    db_pool_recycle_seconds: int = Field(
+        1800, alias="DB_POOL_RECYCLE_SECONDS", description="Age after which pooled connections are replaced (-1: never)"
+    )
+    db_statement_cache_size: int = Field(
+        100,
+        alias="DB_STATEMENT_CACHE_SIZE",
+        description="Prepared statements cached per asyncpg connection (0 behind transaction-pooling PgBouncer)",
+    )
+    db_command_timeout_seconds: Optional[float] = Field(
+        None, alias="DB_COMMAND_TIMEOUT_SECONDS", description="Server-side statement timeout enforced by asyncpg"
+    )
+    db_echo: bool = Field(False, alias="DB_ECHO", description="Log every SQL statement")
+
+    partition_chains: List[int] = Field(
+        [1, 10, 56, 100, 137, 146, 324, 8453, 42161, 43114, 59144],
+        alias="PARTITION_CHAINS",
+        description="Chains that get monthly limit_orders partitions (JSON); others go to the default partition",
+    )
+    partition_months_ahead: int = Field(
+        2, alias="PARTITION_MONTHS_AHEAD", description="Months of limit_orders partitions created in advance"
+    )
+    order_retention_days: int = Field(
+        0,
+        alias="ORDER_RETENTION_DAYS",
+        description="Purge limit_orders partitions whose month ended this many days ago (0: keep everything)",
+    )
+    order_archive_schema: Union[str, None] = Field(
+        None, alias="ORDER_ARCHIVE_SCHEMA", description="Move purged partitions into this schema instead of dropping them"
+    )
+    partition_maintenance_interval_seconds: float = Field(
+        3600.0,
+        alias="PARTITION_MAINTENANCE_INTERVAL_SECONDS",
+        description="How often partitions are created ahead and purged (0: only via the CLI)",
+    )
+
+    inch_api_base_url: str = Field(
+        "https://api.1inch.dev/orderbook/v4.0/",
+        alias="INCH_API_BASE_URL",
+        description="Base URL of the 1inch orderbook API (point at a local stand-in for load tests)",
+    )
+
+    inch_api_keys: Union[str, None] = Field(
+        None, alias="INCH_API_KEYS", description="Comma-separated API keys used alongside INCH_API_KEY"
+    )
+    inch_api_keys_file: Union[str, None] = Field(
+        None,
+        alias="INCH_API_KEYS_FILE",
+        description="File with one API key per line, re-read when it changes so keys rotate without a restart",
+    )
+    credential_reload_seconds: float = Field(
+        5.0, alias="CREDENTIAL_RELOAD_SECONDS", description="How often the API key file is checked for changes"
+    )
+    credential_cooldown_seconds: float = Field(
+        1.0,
+        alias="CREDENTIAL_COOLDOWN_SECONDS",
+        description="How long a throttled API key is skipped when upstream sends no Retry-After",
+    )
+
+    upstream_initial_concurrency: int = Field(
+        8, alias="UPSTREAM_INITIAL_CONCURRENCY", description="Starting in-flight limit per chain and endpoint"
+    )
+    upstream_min_concurrency: int = Field(
+        1, alias="UPSTREAM_MIN_CONCURRENCY", description="Lowest in-flight limit the adaptive limiter backs off to"
+    )
+    upstream_max_concurrency: int = Field(
+        64, alias="UPSTREAM_MAX_CONCURRENCY", description="Highest in-flight limit the adaptive limiter grows to"
+    )
+    upstream_latency_tolerance: float = Field(
+        1.5,
+        alias="UPSTREAM_LATENCY_TOLERANCE",
+        description="Latency above this multiple of the baseline is treated as congestion",
+    )
+
+    upstream_pool_default: PoolConfig = Field(
+        PoolConfig(),
+        alias="UPSTREAM_POOL_DEFAULT",
+        description="Pool settings for any pool not listed in UPSTREAM_POOLS (JSON)",
+    )
+    upstream_pools: Dict[str, PoolConfig] = Field(
+        {},
+        alias="UPSTREAM_POOLS",
+        description='Pool settings by pool name (JSON), e.g. {"chain-1": {"max_connections": 40}, "bulk": {"timeout": 5}}',
+    )
+    upstream_pool_chains: Dict[int, str] = Field(
+        {},
+        alias="UPSTREAM_POOL_CHAINS",
+        description='Chains sharing a named pool (JSON), e.g. {"137": "bulk", "56": "bulk"}; others get "chain-<id>"',
+    )
+
+    tool_timeout_seconds: float = Field(
+        30.0, alias="TOOL_TIMEOUT_SECONDS", description="Default time budget of an MCP tool call in seconds"
+    )
+    tool_timeouts: Dict[str, float] = Field(
+        {},
+        alias="TOOL_TIMEOUTS",
+        description='Time budgets by tool name (JSON), e.g. {"get_orderbook_depth": 60, "get_fee_info": 5}',
+    )
+    request_timeout_seconds: float = Field(
+        30.0, alias="REQUEST_TIMEOUT_SECONDS", description="Time budget of a REST request in seconds"
+    )
+    max_timeout_seconds: float = Field(
+        120.0, alias="MAX_TIMEOUT_SECONDS", description="Upper bound for budgets requested per call"
+    )
+    deadline_grace_seconds: float = Field(
+        1.0,
+        alias="DEADLINE_GRACE_SECONDS",
+        description="Time past the deadline given to return partial results before the call is cancelled",
+    )
+
+    admission_cheap: AdmissionConfig = Field(
+        AdmissionConfig(concurrency=64, queue_size=256, max_queue_seconds=1.0),
+        alias="ADMISSION_CHEAP",
+        description="Admission limits for cached reads (JSON)",
+    )
+    admission_expensive: AdmissionConfig = Field(
+        AdmissionConfig(concurrency=8, queue_size=32, max_queue_seconds=5.0),
+        alias="ADMISSION_EXPENSIVE",
+        description="Admission limits for syncs and fan-out queries (JSON)",
+    )
+    admission_classes: Dict[str, str] = Field(
+        {},
+        alias="ADMISSION_CLASSES",
+        description='Admission class by tool or route name (JSON), e.g. {"search_token_pairs": "expensive"}',
+    )
+
+    limit_order_router_address: str = Field(
+        "0x111111125421ca6dc452d289314280a0f8842a65",
+        alias="LIMIT_ORDER_ROUTER_ADDRESS",
+        description="verifyingContract of the limit order EIP-712 domain",
+    )
+    limit_order_router_addresses: Dict[int, str] = Field(
+        {324: "0x6fd4383cb451173d5f9304f041c7bcbf27d561ff"},
+        alias="LIMIT_ORDER_ROUTER_ADDRESSES",
+        description="verifyingContract by chain where the router is deployed elsewhere (JSON)",
+    )
+    order_verify_signature: bool = Field(
+        False,
+        alias="ORDER_VERIFY_SIGNATURE",
+        description="Reject posted orders whose recovered signer is not the maker (breaks EIP-1271 contract makers)",
+    )
+
+    bulk_post_max_orders: int = Field(
+        500, alias="BULK_POST_MAX_ORDERS", description="Maximum orders accepted by one bulk submission"
+    )
+    bulk_post_concurrency: int = Field(
+        16, alias="BULK_POST_CONCURRENCY", description="Upstream posts in flight for one bulk submission"
+    )
+
+    write_behind_enabled: bool = Field(
+        False, alias="WRITE_BEHIND_ENABLED", description="Queue limit_orders writes and apply them in batches"
+    )
+    write_behind_max_pending: int = Field(
+        10_000, alias="WRITE_BEHIND_MAX_PENDING", description="Queued writes at which writers wait for a flush"
+    )
+    write_behind_batch_size: int = Field(
+        1_000, alias="WRITE_BEHIND_BATCH_SIZE", description="Maximum writes applied in one flush transaction"
+    )
+    write_behind_flush_seconds: float = Field(
+        0.5, alias="WRITE_BEHIND_FLUSH_SECONDS", description="Interval between write-behind flushes"
+    )
+    write_behind_max_attempts: int = Field(
+        3,
+        alias="WRITE_BEHIND_MAX_ATTEMPTS",
+        description="Failed flushes of a batch before its orders are written one by one and bad ones dropped",
+    )
+
+    pair_index_ttl_seconds: float = Field(
+        60.0, alias="PAIR_INDEX_TTL_SECONDS", description="Age after which the pair index is refreshed in the background"
+    )
+    pair_index_max_stale_seconds: float = Field(
+        600.0, alias="PAIR_INDEX_MAX_STALE_SECONDS", description="Age after which a stale pair index is no longer served"
+    )
+    pair_index_prefetch_concurrency: int = Field(
+        8, alias="PAIR_INDEX_PREFETCH_CONCURRENCY", description="Concurrent page fetches when building the pair index"
+    )
+
+    fee_info_ttl_seconds: float = Field(
+        300.0, alias="FEE_INFO_TTL_SECONDS", description="How long fee parameters of a pair are cached"
+    )
+    fee_info_verify_every: int = Field(
+        50, alias="FEE_INFO_VERIFY_EVERY", description="Re-check cached fee parameters upstream every N hits (0 = never)"
+    )
+    fee_info_cache_size: int = Field(10_000, alias="FEE_INFO_CACHE_SIZE", description="Maximum cached fee pairs")
+
+    data_dir: str = Field(
+        "data",
+        alias="DATA_DIR",
+        description="Directory for local state files (relative to the working directory); relative file settings resolve against it",
+    )
+    order_cache_path: str = Field(
+        "order_cache.sqlite3",
+        alias="ORDER_CACHE_PATH",
+        description="SQLite file for the immutable part of orders fetched by hash (':memory:' to disable persistence)",
+    )
+    order_status_ttl_seconds: float = Field(
+        5.0, alias="ORDER_STATUS_TTL_SECONDS", description="How long the mutable status of an order is cached"
+    )
+    order_cache_memory_size: int = Field(
+        10_000, alias="ORDER_CACHE_MEMORY_SIZE", description="Orders kept in memory in front of the SQLite store"
+    )
+
+    order_sync_batch_size: int = Field(
+        1000, alias="ORDER_SYNC_BATCH_SIZE", description="Outdated stored orders streamed and deleted per batch in a sync"
+    )
+
+    order_status_max_age_seconds: float = Field(
+        30.0,
+        alias="ORDER_STATUS_MAX_AGE_SECONDS",
+        description="Serve stored orders from the database while their status is younger than this",
+    )
+
+    order_count_ttl_seconds: float = Field(
+        10.0, alias="ORDER_COUNT_TTL_SECONDS", description="How long an order count for one filter combination is cached"
+    )
+    order_count_concurrency: int = Field(
+        8, alias="ORDER_COUNT_CONCURRENCY", description="Maximum concurrent upstream /count calls"
+    )
+    order_count_max_cells: int = Field(
+        500, alias="ORDER_COUNT_MAX_CELLS", description="Maximum pair x status set cells in one count matrix request"
+    )
+
+    snapshot_ttl_seconds: float = Field(
+        300.0, alias="SNAPSHOT_TTL_SECONDS", description="How long pagination cursors stay valid"
+    )
+    snapshot_cache_size: int = Field(1024, alias="SNAPSHOT_CACHE_SIZE", description="Maximum result snapshots kept for cursors")
+
+    order_watch_interval_seconds: float = Field(
+        5.0, alias="ORDER_WATCH_INTERVAL_SECONDS", description="Polling interval for subscribed orders and maker addresses"
+    )
+    order_watch_concurrency: int = Field(
+        8, alias="ORDER_WATCH_CONCURRENCY", description="Maximum concurrent upstream calls per polling cycle"
+    )
+
+    best_orders_ttl_seconds: float = Field(
+        60.0, alias="BEST_ORDERS_TTL_SECONDS", description="How long a pair's sorted order book is served before reloading"
+    )
+    best_orders_max_orders: int = Field(
+        2000, alias="BEST_ORDERS_MAX_ORDERS", description="Maximum active orders loaded into one pair's sorted book"
+    )
+    best_orders_max_pairs: int = Field(512, alias="BEST_ORDERS_MAX_PAIRS", description="Maximum pair books kept in memory")
+
     auto_migrate: bool = Field(True, alias="AUTO_MIGRATE", description="Run migrations automatically on startup")
+    migration_wait_seconds: float = Field(
+        30.0,
+        alias="MIGRATION_WAIT_SECONDS",
+        description="How long a replica waits at startup for another replica's migration before serving read-only",
+    )
+    schema_recheck_seconds: float = Field(
+        10.0, alias="SCHEMA_RECHECK_SECONDS", description="Interval of schema re-checks while serving read-only"
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="",  # Keep env var names as-is, no prefix
@@ -37,6 +311,13 @@ class Settings(BaseSettings):
         """Get the effective port to use, prioritizing PORT over MCP_BASE_PORT."""
         return self.port if self.port is not None else self.mcp_base_port
 
+    @property
+    def order_cache_file(self) -> str:
+        """ORDER_CACHE_PATH resolved against DATA_DIR unless it is absolute or ``:memory:``."""
+        if self.order_cache_path == ":memory:":
+            return self.order_cache_path
+        return str(Path(self.data_dir).expanduser().absolute() / Path(self.order_cache_path).expanduser())
+
     @property
     def database_url(self) -> str:
         return f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
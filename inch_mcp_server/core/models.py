@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PositiveInt
 
 
 class LimitOrderV4Data(BaseModel):
@@ -30,6 +30,15 @@ class LimitOrderV4Response(BaseModel):
     id: Optional[int] = None
 
 
+class LimitOrderV4Status(BaseModel):
+    """Fields of an order that change after creation; everything else is immutable."""
+
+    remainingMakerAmount: str
+    makerBalance: str
+    makerAllowance: str
+    orderInvalidReason: Optional[str] = None
+
+
 class GetLimitOrdersV4Response(BaseModel):
     signature: str
     orderHash: str
@@ -65,6 +74,33 @@ class FeeInfoDTO(BaseModel):
     extensionAddress: str
 
 
+class FeeAmounts(BaseModel):
+    makerAmount: PositiveInt
+    takerAmount: PositiveInt
+
+
+class FeeQuote(BaseModel):
+    makerAmount: int
+    takerAmount: int
+    feeBps: int
+    feeAmount: int
+    whitelistedFeeBps: float
+    whitelistedFeeAmount: int
+
+
+class FeeQuotesResponse(BaseModel):
+    makerAsset: str
+    takerAsset: str
+    feeInfo: FeeInfoDTO
+    quotes: list[FeeQuote]
+
+
+class FeeQuotesRequest(BaseModel):
+    makerAsset: str
+    takerAsset: str
+    amounts: list[FeeAmounts] = Field(min_length=1, max_length=1000)
+
+
 class TokenPair(BaseModel):
     makerAsset: str
     takerAsset: str
@@ -80,7 +116,92 @@ class PaginationMeta(BaseModel):
 class GetActiveUniquePairsResponse(BaseModel):
     items: list[TokenPair]
     meta: PaginationMeta
+    nextCursor: Optional[str] = None
 
 
 class GetLimitOrdersCountV4Response(BaseModel):
     count: int
+
+
+class DepthLevel(BaseModel):
+    rate: float
+    amount: float
+    quoteAmount: float
+    orderCount: int
+    cumulativeAmount: float
+    cumulativeQuoteAmount: float
+
+
+class OrderbookSide(BaseModel):
+    bestRate: Optional[float] = None
+    totalAmount: float
+    totalQuoteAmount: float
+    orderCount: int
+    levels: list[DepthLevel]
+
+
+class OrderbookDepthResponse(BaseModel):
+    baseAsset: str
+    quoteAsset: str
+    asks: OrderbookSide
+    bids: OrderbookSide
+    partial: bool = False
+
+
+class BestOrdersResponse(BaseModel):
+    makerAsset: str
+    takerAsset: str
+    activeOrders: int
+    indexAgeSeconds: float
+    orders: list[GetLimitOrdersV4Response]
+
+
+class TokenPairFilter(BaseModel):
+    makerAsset: Optional[str] = None
+    takerAsset: Optional[str] = None
+
+
+class OrderCountMatrixRequest(BaseModel):
+    pairs: list[TokenPairFilter]
+    statusSets: list[list[int]]
+
+
+class OrderCountRow(BaseModel):
+    makerAsset: Optional[str] = None
+    takerAsset: Optional[str] = None
+    counts: list[Optional[int]]
+
+
+class OrderCountMatrixResponse(BaseModel):
+    statusSets: list[list[int]]
+    rows: list[OrderCountRow]
+    distinctQueries: int
+    errors: list[str] = []
+    partial: bool = False
+
+
+class OrdersPage(BaseModel):
+    items: list[GetLimitOrdersV4Response]
+    totalItems: int
+    nextCursor: Optional[str] = None
+
+
+class BulkPostOrdersRequest(BaseModel):
+    orders: list[PostLimitOrderV4Request]
+
+
+class BulkOrderResult(BaseModel):
+    orderHash: str
+    # "accepted" (posted and stored), "rejected" (failed local verification or a 4xx upstream)
+    # or "failed" (throttled, 5xx or deadline; safe to retry)
+    status: str
+    statusCode: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BulkPostOrdersResponse(BaseModel):
+    accepted: int
+    rejected: int
+    failed: int
+    persisted: bool
+    results: list[BulkOrderResult]
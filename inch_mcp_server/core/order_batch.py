@@ -0,0 +1,248 @@
+"""Compact columnar container for large in-memory sets of limit orders."""
+
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .models import GetLimitOrdersV4Response
+
+HASH_WIDTH = 32
+UINT256_WIDTH = 32
+
+
+def _hex_to_bytes(value: Optional[str]) -> bytes:
+    if not value:
+        return b""
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+
+def _to_int(value: Optional[str]) -> int:
+    """Parse a decimal or 0x-prefixed hex uint256 string."""
+    if not value:
+        return 0
+    return int(value, 16) if value.startswith("0x") else int(value)
+
+
+def _parse_date(value: str) -> Optional[int]:
+    """Parse ``2024-01-01T00:00:00.000Z`` into epoch milliseconds, or None for any other format."""
+    if len(value) != 24 or value[19] != "." or value[23] != "Z":
+        return None
+    try:
+        return round(datetime.fromisoformat(value).timestamp() * 1000)
+    except ValueError:
+        return None
+
+
+def _format_date(millis: int) -> str:
+    return datetime.fromtimestamp(millis / 1000, timezone.utc).isoformat(timespec="milliseconds")[:-6] + "Z"
+
+
+class OrderBatch:
+    """Column store for orders in the shape of ``GetLimitOrdersV4Response``.
+
+    Addresses are interned into one table and referenced by ``array('I')`` ids,
+    order hashes and uint256 values (amounts, salt, makerTraits) are packed as
+    fixed-width big-endian bytes, and creation times as epoch milliseconds.
+    Rows are read through ``OrderView`` objects and only turned into Pydantic
+    models by ``to_model``/``to_models`` at the API boundary. Values come back
+    normalized: lowercase addresses, decimal salt and 32-byte makerTraits hex.
+    """
+
+    __slots__ = (
+        "addresses", "_address_ids", "_hash_index",
+        "order_hashes", "maker_asset_ids", "taker_asset_ids", "maker_ids", "receiver_ids",
+        "making_amounts", "taking_amounts", "remaining_amounts", "maker_balances", "maker_allowances",
+        "salts", "maker_traits", "created_at_ms", "is_maker_contract",
+        "signatures", "extensions", "maker_rates", "taker_rates", "invalid_reasons", "_raw_dates",
+    )
+
+    def __init__(self):
+        self.addresses: List[str] = [""]  # id 0 is "no address" (e.g. missing receiver)
+        self._address_ids: Dict[str, int] = {"": 0}
+        self._hash_index: Dict[bytes, int] = {}
+        self.order_hashes = bytearray()
+        self.maker_asset_ids = array("I")
+        self.taker_asset_ids = array("I")
+        self.maker_ids = array("I")
+        self.receiver_ids = array("I")
+        self.making_amounts = bytearray()
+        self.taking_amounts = bytearray()
+        self.remaining_amounts = bytearray()
+        self.maker_balances = bytearray()
+        self.maker_allowances = bytearray()
+        self.salts = bytearray()
+        self.maker_traits = bytearray()
+        self.created_at_ms = array("q")
+        self.is_maker_contract = bytearray()
+        self.signatures: List[bytes] = []
+        self.extensions: List[bytes] = []
+        self.maker_rates: List[str] = []
+        self.taker_rates: List[str] = []
+        self.invalid_reasons: Dict[int, str] = {}
+        self._raw_dates: Dict[int, str] = {}
+
+    @classmethod
+    def from_orders(cls, orders: Iterable[dict]) -> "OrderBatch":
+        """Build a batch from raw API order dicts."""
+        batch = cls()
+        for order in orders:
+            batch.append(order)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.maker_ids)
+
+    def __getitem__(self, index: int) -> "OrderView":
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("order index out of range")
+        return OrderView(self, index)
+
+    def __iter__(self) -> Iterator["OrderView"]:
+        return (OrderView(self, index) for index in range(len(self)))
+
+    def _intern(self, address: Optional[str]) -> int:
+        address = (address or "").lower()
+        address_id = self._address_ids.get(address)
+        if address_id is None:
+            address_id = len(self.addresses)
+            self.addresses.append(address)
+            self._address_ids[address] = address_id
+        return address_id
+
+    def append(self, order: dict) -> int:
+        """Append a raw API order dict and return its row index."""
+        data = order["data"]
+        index = len(self)
+        order_hash = _hex_to_bytes(order["orderHash"]).rjust(HASH_WIDTH, b"\0")
+        self._hash_index[order_hash] = index
+        self.order_hashes += order_hash
+        self.maker_asset_ids.append(self._intern(data["makerAsset"]))
+        self.taker_asset_ids.append(self._intern(data["takerAsset"]))
+        self.maker_ids.append(self._intern(data["maker"]))
+        self.receiver_ids.append(self._intern(data.get("receiver")))
+        self.making_amounts += int(data["makingAmount"]).to_bytes(UINT256_WIDTH, "big")
+        self.taking_amounts += int(data["takingAmount"]).to_bytes(UINT256_WIDTH, "big")
+        self.remaining_amounts += int(order["remainingMakerAmount"]).to_bytes(UINT256_WIDTH, "big")
+        self.maker_balances += int(order["makerBalance"]).to_bytes(UINT256_WIDTH, "big")
+        self.maker_allowances += int(order["makerAllowance"]).to_bytes(UINT256_WIDTH, "big")
+        self.salts += _to_int(data["salt"]).to_bytes(UINT256_WIDTH, "big")
+        self.maker_traits += _to_int(data.get("makerTraits")).to_bytes(UINT256_WIDTH, "big")
+        millis = _parse_date(order["createDateTime"])
+        if millis is None:
+            self._raw_dates[index] = order["createDateTime"]
+            millis = 0
+        self.created_at_ms.append(millis)
+        self.is_maker_contract.append(1 if order["isMakerContract"] else 0)
+        self.signatures.append(_hex_to_bytes(order.get("signature")))
+        self.extensions.append(_hex_to_bytes(data.get("extension")))
+        self.maker_rates.append(order["makerRate"])
+        self.taker_rates.append(order["takerRate"])
+        if order.get("orderInvalidReason") is not None:
+            self.invalid_reasons[index] = order["orderInvalidReason"]
+        return index
+
+    def index_of(self, order_hash: str) -> Optional[int]:
+        """Return the row index of an order hash, or None if it is not in the batch."""
+        return self._hash_index.get(_hex_to_bytes(order_hash).rjust(HASH_WIDTH, b"\0"))
+
+    def update_status(self, index: int, remaining: int, balance: int, allowance: int,
+                      invalid_reason: Optional[str] = None) -> None:
+        """Overwrite the mutable fields of a row in place."""
+        offset = index * UINT256_WIDTH
+        self.remaining_amounts[offset:offset + UINT256_WIDTH] = remaining.to_bytes(UINT256_WIDTH, "big")
+        self.maker_balances[offset:offset + UINT256_WIDTH] = balance.to_bytes(UINT256_WIDTH, "big")
+        self.maker_allowances[offset:offset + UINT256_WIDTH] = allowance.to_bytes(UINT256_WIDTH, "big")
+        if invalid_reason is None:
+            self.invalid_reasons.pop(index, None)
+        else:
+            self.invalid_reasons[index] = invalid_reason
+
+    def to_models(self) -> List[GetLimitOrdersV4Response]:
+        return [view.to_model() for view in self]
+
+
+def _uint(column: bytearray, index: int) -> int:
+    offset = index * UINT256_WIDTH
+    return int.from_bytes(column[offset:offset + UINT256_WIDTH], "big")
+
+
+class OrderView:
+    """Lightweight read-only row of an ``OrderBatch``."""
+
+    __slots__ = ("batch", "index")
+
+    def __init__(self, batch: OrderBatch, index: int):
+        self.batch = batch
+        self.index = index
+
+    @property
+    def order_hash(self) -> str:
+        offset = self.index * HASH_WIDTH
+        return "0x" + self.batch.order_hashes[offset:offset + HASH_WIDTH].hex()
+
+    @property
+    def maker_asset(self) -> str:
+        return self.batch.addresses[self.batch.maker_asset_ids[self.index]]
+
+    @property
+    def taker_asset(self) -> str:
+        return self.batch.addresses[self.batch.taker_asset_ids[self.index]]
+
+    @property
+    def maker(self) -> str:
+        return self.batch.addresses[self.batch.maker_ids[self.index]]
+
+    @property
+    def making_amount(self) -> int:
+        return _uint(self.batch.making_amounts, self.index)
+
+    @property
+    def taking_amount(self) -> int:
+        return _uint(self.batch.taking_amounts, self.index)
+
+    @property
+    def remaining_maker_amount(self) -> int:
+        return _uint(self.batch.remaining_amounts, self.index)
+
+    @property
+    def create_date_time(self) -> str:
+        raw = self.batch._raw_dates.get(self.index)
+        return raw if raw is not None else _format_date(self.batch.created_at_ms[self.index])
+
+    def to_dict(self) -> dict:
+        """Rebuild the raw API dict for this row."""
+        batch, i = self.batch, self.index
+        receiver = batch.addresses[batch.receiver_ids[i]] or None
+        return {
+            "signature": "0x" + batch.signatures[i].hex(),
+            "orderHash": self.order_hash,
+            "createDateTime": self.create_date_time,
+            "remainingMakerAmount": str(self.remaining_maker_amount),
+            "makerBalance": str(_uint(batch.maker_balances, i)),
+            "makerAllowance": str(_uint(batch.maker_allowances, i)),
+            "data": {
+                "makerAsset": self.maker_asset,
+                "takerAsset": self.taker_asset,
+                "maker": self.maker,
+                "receiver": receiver,
+                "makingAmount": str(self.making_amount),
+                "takingAmount": str(self.taking_amount),
+                "salt": str(_uint(batch.salts, i)),
+                "extension": "0x" + batch.extensions[i].hex(),
+                "makerTraits": "0x" + _uint(batch.maker_traits, i).to_bytes(UINT256_WIDTH, "big").hex(),
+            },
+            "makerRate": batch.maker_rates[i],
+            "takerRate": batch.taker_rates[i],
+            "isMakerContract": bool(batch.is_maker_contract[i]),
+            "orderInvalidReason": batch.invalid_reasons.get(i),
+        }
+
+    def to_model(self) -> GetLimitOrdersV4Response:
+        """Convert to the Pydantic response model.
+
+        ``model_validate`` runs in pydantic-core and is faster here than the
+        pure-Python ``model_construct`` for a nested model.
+        """
+        return GetLimitOrdersV4Response.model_validate(self.to_dict())
@@ -7,10 +7,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi_async_sqlalchemy import SQLAlchemyMiddleware
 from fastmcp import FastMCP
 
+from inch_mcp_server.api.middleware import RequestDeadlineMiddleware
 from inch_mcp_server.api.router import api_router
 from inch_mcp_server.config import settings
-from inch_mcp_server.dependencies import create_service_for_mcp
-from inch_mcp_server.handlers import LimitOrderHandler
+from inch_mcp_server.database import close_database_connections, get_database_engine, initialize_database
+from inch_mcp_server.dependencies import create_service_for_mcp, get_admission_controller, get_partition_maintainer
+from inch_mcp_server.handlers import (
+    AdmissionMiddleware,
+    DatabaseSessionMiddleware,
+    DeadlineMiddleware,
+    LimitOrderHandler,
+)
 from inch_mcp_server.utils.logger_setup import setup_logger
 
 logger = setup_logger("server")
@@ -20,6 +27,9 @@ MCP_BASE_PORT = settings.effective_port
 
 # Global reference to the MCP server instance
 mcp = FastMCP("1inch-mcp-server")
+mcp.add_middleware(DeadlineMiddleware())
+mcp.add_middleware(AdmissionMiddleware(get_admission_controller()))
+mcp.add_middleware(DatabaseSessionMiddleware())
 
 _service_for_mcp = create_service_for_mcp()
 LimitOrderHandler(mcp, _service_for_mcp)
@@ -28,25 +38,20 @@ mcp_app = mcp.http_app()
 
 @asynccontextmanager
 async def lifespan(app):
-    """Lifespan context manager for FastAPI app with database initialization."""
+    """Lifespan context manager for FastAPI app, wrapping the MCP session manager's lifespan."""
     logger.info("Starting up 1inch MCP Server...")
-    # try:
-    #     # Initialize database and run migrations if needed
-    #     await initialize_database()
-    #     logger.info("Database initialized successfully")
-    # except Exception as e:
-    #     logger.error(f"Failed to initialize database: {e}")
-    #     logger.warning("Continuing without database initialization. Database may not be available.")
-    # Don't raise - allow server to start even if database is not available
-    # task = create_task()  # TODO: Implement the task to check orders
-    yield
-    logger.info("Shutting down 1inch MCP Server...")
-    # try:
-    #     await close_database_connections()
-    #     logger.info("Database connections closed")
-    # except Exception as e:
-    #     logger.error(f"Error closing database connections: {e}")
-    # task.cancel()
+    # Never raises: a replica whose schema is behind serves read-only, one without a database still starts
+    await initialize_database()
+    if settings.partition_maintenance_interval_seconds > 0:
+        get_partition_maintainer().start()
+    async with mcp_app.lifespan(app):
+        yield
+        logger.info("Shutting down 1inch MCP Server...")
+        await _service_for_mcp.order_watcher.stop()
+        await get_partition_maintainer().stop()
+        if _service_for_mcp.write_behind is not None:
+            await _service_for_mcp.write_behind.close()
+        await close_database_connections()
 
 
 origins = [
@@ -62,20 +67,12 @@ app = FastAPI(
     version="0.0.1",
     redoc_url=None,
     swagger_ui_parameters={"syntaxHighlight.theme": "obsidian"},
-    lifespan=mcp_app.lifespan,
+    lifespan=lifespan,
 )
 
-app.add_middleware(
-    SQLAlchemyMiddleware,
-    db_url=settings.database_url,
-    engine_args={
-        "echo": True,
-        "pool_pre_ping": True,
-        "pool_size": 10,
-        "max_overflow": 20,
-    },
-)
+app.add_middleware(SQLAlchemyMiddleware, custom_engine=get_database_engine())
 
+app.add_middleware(RequestDeadlineMiddleware, exclude=["/mcp-server"])
 
 # Add CORS middleware
 app.add_middleware(
@@ -1,7 +1,16 @@
 """Database package for 1inch MCP Server."""
 
-from .connection import close_database_connections, get_async_session, get_database_engine
-from .migrations import initialize_database, run_migrations, run_migrations_sync
+from .connection import close_database_connections, get_async_session, get_database_engine, pool_snapshot
+from .migrations import (
+    SchemaNotReady,
+    ensure_schema,
+    initialize_database,
+    require_writable_schema,
+    run_migrations,
+    run_migrations_sync,
+    schema_state,
+    schema_writable,
+)
 from .models import Base, LimitOrder
 
 __all__ = [
@@ -10,7 +19,13 @@ __all__ = [
     "get_database_engine",
     "get_async_session",
     "close_database_connections",
+    "pool_snapshot",
     "run_migrations_sync",
     "run_migrations",
     "initialize_database",
+    "ensure_schema",
+    "schema_state",
+    "schema_writable",
+    "require_writable_schema",
+    "SchemaNotReady",
 ]
@@ -1,8 +1,12 @@
 """Database connection management for 1inch MCP Server."""
 
+import time
 from typing import AsyncGenerator, Union
 
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from inch_mcp_server.config import settings
 from inch_mcp_server.utils.logger_setup import setup_logger
@@ -14,18 +18,86 @@ _engine: Union[AsyncEngine, None] = None
 _session_factory: Union[async_sessionmaker[AsyncSession], None] = None
 
 
+class PoolMetrics:
+    """Checkout counts and wait times of a connection pool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, waited: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that times how long each checkout waits for a connection."""
+
+    def __init__(self, *args, metrics: PoolMetrics = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics or PoolMetrics()
+
+    def _do_get(self):
+        started = time.monotonic()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        self.metrics.record(time.monotonic() - started)
+        return entry
+
+    def recreate(self) -> "InstrumentedPool":
+        # Keep the counters when the engine replaces its pool (e.g. after a disconnect)
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def snapshot(self) -> dict:
+        metrics = self.metrics
+        return {
+            "size": self.size(),
+            "maxOverflow": self._max_overflow,
+            "checkedOut": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(0, self.overflow()),
+            "checkouts": metrics.checkouts,
+            "timeouts": metrics.timeouts,
+            "avgWaitMs": round(metrics.wait_seconds_total / metrics.checkouts * 1000, 2) if metrics.checkouts else 0.0,
+            "maxWaitMs": round(metrics.wait_seconds_max * 1000, 2),
+        }
+
+
 def get_database_engine() -> AsyncEngine:
-    """Get or create the database engine."""
+    """Get or create the database engine.
+
+    This is the only engine of the process: the request middleware, MCP tool
+    calls and background writers all share its pool, sized by the ``DB_*``
+    settings.
+    """
     global _engine
 
     if _engine is None:
-        # Configure engine for PostgreSQL
+        # asyncpg has its own statement cache; SQLAlchemy's asyncpg dialect keeps a second one per connection
+        url = make_url(settings.database_url).update_query_dict(
+            {"prepared_statement_cache_size": str(settings.db_statement_cache_size)}
+        )
+        connect_args = {"statement_cache_size": settings.db_statement_cache_size}
+        if settings.db_command_timeout_seconds is not None:
+            connect_args["command_timeout"] = settings.db_command_timeout_seconds
         _engine = create_async_engine(
-            settings.database_url,
-            echo=False,  # Set to True for SQL query logging
+            url,
+            echo=settings.db_echo,
+            poolclass=InstrumentedPool,
             pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            connect_args=connect_args,
         )
 
         logger.info(
@@ -35,6 +107,14 @@ def get_database_engine() -> AsyncEngine:
     return _engine
 
 
+def pool_snapshot() -> Union[dict, None]:
+    """Occupancy and checkout wait of the engine's pool, or None before the engine exists."""
+    if _engine is None:
+        return None
+    pool = _engine.sync_engine.pool
+    return pool.snapshot() if isinstance(pool, InstrumentedPool) else {"status": pool.status()}
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get or create the session factory."""
     global _session_factory
@@ -1,20 +1,41 @@
 """Database migration utilities for 1inch MCP Server."""
 
 import asyncio
+import contextvars
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
 from alembic import command
 from alembic.config import Config
 from alembic.runtime.migration import MigrationContext
 from alembic.script import ScriptDirectory
 from inch_mcp_server.config import settings
+from inch_mcp_server.database.connection import get_database_engine
 from inch_mcp_server.utils.logger_setup import setup_logger
 
 logger = setup_logger("database.migrations")
 
+# Arbitrary key of the advisory lock held by the one replica that migrates
+MIGRATION_LOCK = 0x616C656D6269
+
+# Schema states, cached per process by ensure_schema
+CURRENT = "current"  # at the head revision when checked
+MIGRATED = "migrated"  # this process migrated it to the head revision
+BEHIND = "behind"  # older than the code; served read-only until it catches up
+UNAVAILABLE = "unavailable"  # the database could not be reached
+
+_schema_state: Optional[str] = None
+_recheck_task: Optional[asyncio.Task] = None
+
+
+class SchemaNotReady(RuntimeError):
+    """Raised by writes while the database schema is older than the code."""
+
 
 def get_alembic_config() -> Config:
     """Get Alembic configuration."""
@@ -61,9 +82,12 @@ def get_current_revision() -> Optional[str]:
         sync_url = settings.database_url.replace("+asyncpg", "+psycopg2")
         engine = create_engine(sync_url)
 
-        with engine.connect() as connection:
-            context = MigrationContext.configure(connection)
-            return context.get_current_revision()
+        try:
+            with engine.connect() as connection:
+                context = MigrationContext.configure(connection)
+                return context.get_current_revision()
+        finally:
+            engine.dispose()
     except Exception as e:
         logger.warning(f"Could not get current revision: {e}")
         return None
@@ -72,11 +96,8 @@ def get_current_revision() -> Optional[str]:
 def check_migrations_needed() -> bool:
     """Check if migrations are needed."""
     try:
-        config = get_alembic_config()
-        script = ScriptDirectory.from_config(config)
-
         current_rev = get_current_revision()
-        head_rev = script.get_current_head()
+        head_rev = get_head_revision()
 
         logger.info(f"Current revision: {current_rev}, Head revision: {head_rev}")
 
@@ -86,20 +107,130 @@ def check_migrations_needed() -> bool:
         return True  # Assume migrations are needed if we can't check
 
 
-async def initialize_database() -> None:
-    """Initialize database and run migrations if needed."""
-    try:
-        if settings.auto_migrate:
-            logger.info("Auto-migration enabled, checking if migrations are needed...")
+@lru_cache()
+def get_head_revision() -> Optional[str]:
+    """Head revision of the migration scripts, read from disk once per process."""
+    return ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+
+
+async def read_current_revision(connection: AsyncConnection) -> Optional[str]:
+    """Read ``alembic_version`` over an async connection and end the transaction it opened."""
+    revision = await connection.run_sync(lambda sync: MigrationContext.configure(sync).get_current_revision())
+    await connection.commit()
+    return revision
+
+
+def schema_state() -> Optional[str]:
+    """Cached result of ``ensure_schema``, or None if it has not run."""
+    return _schema_state
+
 
-            if check_migrations_needed():
-                logger.info("Running database migrations...")
-                await run_migrations()
-            else:
-                logger.info("Database is up to date, no migrations needed")
-        else:
-            logger.info("Auto-migration disabled, skipping migration check")
+def schema_writable() -> bool:
+    return _schema_state != BEHIND
 
+
+def require_writable_schema() -> None:
+    """Refuse writes while the schema is behind the code.
+
+    Raises:
+        SchemaNotReady: If ``ensure_schema`` found the schema behind and it has not caught up yet
+    """
+    if _schema_state == BEHIND:
+        raise SchemaNotReady("Database schema is being migrated; writes are unavailable, try again shortly")
+
+
+async def _wait_for_head(engine: AsyncEngine, head: str, seconds: float) -> bool:
+    deadline = time.monotonic() + seconds
+    while True:
+        async with engine.connect() as connection:
+            if await read_current_revision(connection) == head:
+                return True
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
+
+
+async def _check_schema(engine: AsyncEngine, head: str, wait_seconds: float) -> str:
+    """One attempt at reaching the head revision; see ``ensure_schema``."""
+    try:
+        async with engine.connect() as connection:
+            current = await read_current_revision(connection)
+            if current == head:
+                return CURRENT
+            if not settings.auto_migrate:
+                return BEHIND
+            # A session-level lock: it outlives the transactions below and is released explicitly
+            locked = await connection.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": MIGRATION_LOCK})
+            await connection.commit()
+            if locked:
+                try:
+                    if await read_current_revision(connection) == head:
+                        return CURRENT
+                    logger.info(f"Migrating database schema from {current} to {head}")
+                    try:
+                        await run_migrations()
+                    except Exception as e:
+                        logger.error(f"Database migration failed: {e}")
+                        return BEHIND
+                    return MIGRATED
+                finally:
+                    await connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK})
+                    await connection.commit()
+        # Another replica is migrating
+        return CURRENT if await _wait_for_head(engine, head, wait_seconds) else BEHIND
     except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
-        raise
+        logger.error(f"Database schema check failed: {e}")
+        return UNAVAILABLE
+
+
+async def _recheck(engine: AsyncEngine, head: str) -> None:
+    global _schema_state
+    while _schema_state not in (CURRENT, MIGRATED):
+        await asyncio.sleep(settings.schema_recheck_seconds)
+        state = await _check_schema(engine, head, 0)
+        if state != UNAVAILABLE:
+            _schema_state = state
+    logger.info(f"Database schema reached revision {head}, writes enabled")
+
+
+async def ensure_schema(engine: AsyncEngine = None) -> str:
+    """Bring the schema to the head revision once per process, safely across many replicas.
+
+    The revision is read over the shared async engine, so a replica whose
+    schema is current starts after a single query. Otherwise, with
+    ``AUTO_MIGRATE``, the replica that wins a Postgres advisory lock runs the
+    migrations while the others poll the revision for up to
+    ``MIGRATION_WAIT_SECONDS``. A replica still behind after that serves
+    read-only (see ``require_writable_schema``); it and a replica that could
+    not reach the database re-check every ``SCHEMA_RECHECK_SECONDS`` in the
+    background until the schema is current.
+
+    Returns:
+        str: ``current``, ``migrated``, ``behind`` or ``unavailable``; the first two are cached for good
+    """
+    global _schema_state, _recheck_task
+    if _schema_state in (CURRENT, MIGRATED):
+        return _schema_state
+    try:
+        head = get_head_revision()
+    except Exception as e:
+        logger.error(f"Could not read migration scripts: {e}")
+        _schema_state = UNAVAILABLE
+        return _schema_state
+    engine = engine or get_database_engine()
+    _schema_state = await _check_schema(engine, head, settings.migration_wait_seconds)
+
+    if _schema_state in (CURRENT, MIGRATED):
+        logger.info(f"Database schema is at revision {head} ({_schema_state})")
+    else:
+        if _schema_state == BEHIND:
+            logger.warning(f"Database schema is behind revision {head}; serving read-only until it is migrated")
+        if _recheck_task is None or _recheck_task.done():
+            # A fresh context so the loop does not inherit the caller's deadline or database session
+            _recheck_task = asyncio.create_task(_recheck(engine, head), context=contextvars.Context())
+    return _schema_state
+
+
+async def initialize_database() -> None:
+    """Initialize database and run migrations if needed (see ``ensure_schema``)."""
+    await ensure_schema()
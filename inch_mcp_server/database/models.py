@@ -1,6 +1,7 @@
 import uuid
+from datetime import datetime, timezone
 
-from sqlalchemy import JSON, Column, DateTime, Integer, String
+from sqlalchemy import DDL, JSON, Column, DateTime, Index, Integer, String, event, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase
 
@@ -10,15 +11,35 @@ class Base(DeclarativeBase):
 
 
 class LimitOrder(Base):
-    """SQLAlchemy model for 1inch limit orders."""
+    """SQLAlchemy model for 1inch limit orders.
+
+    On Postgres the table is range-partitioned by ``(blockchain_id, created_at)``
+    into one partition per chain and month (see ``database.partitions``), so the
+    partition columns are part of the primary key.
+    """
 
     __tablename__ = "limit_orders"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    blockchain_id = Column(Integer, nullable=False)
+    blockchain_id = Column(Integer, primary_key=True)
     address = Column(String(42), nullable=False)  # Ethereum address length
     order_hash = Column(String(66), nullable=False)  # SHA-256 hash length
     data = Column(JSON, nullable=False)
+    # Last known non-immutable part of the upstream order response (status, balances, rates)
+    status = Column(JSON, nullable=True)
+    status_updated_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+    )
+
+    __table_args__ = (
+        Index("ix_limit_orders_blockchain_id_order_hash", "blockchain_id", "order_hash"),
+        Index("ix_limit_orders_blockchain_id_address", "blockchain_id", "address", "order_hash"),
+        {"postgresql_partition_by": "RANGE (blockchain_id, created_at)"},
+    )
     # src_token_name = Column(String(255), nullable=False)
     # src_token_address = Column(String(42), nullable=False)  # Ethereum address length
     # dst_token_name = Column(String(255), nullable=False)
@@ -28,11 +49,6 @@ class LimitOrder(Base):
     # amount = Column(Numeric(38, 18), nullable=False)  # High precision for token amounts
 
     # # Audit fields
-    # created_at = Column(
-    #     DateTime(timezone=True),
-    #     default=lambda: datetime.now(timezone.utc),
-    #     nullable=False
-    # )
     # updated_at = Column(
     #     DateTime(timezone=True),
     #     default=lambda: datetime.now(timezone.utc),
@@ -49,3 +65,11 @@ class LimitOrder(Base):
     #         f"price={self.price}, "
     #         f"amount={self.amount})>"
     #     )
+
+
+# A partitioned table accepts no rows until it has partitions; the default one catches anything unplanned
+event.listen(
+    LimitOrder.__table__,
+    "after_create",
+    DDL("CREATE TABLE limit_orders_default PARTITION OF limit_orders DEFAULT").execute_if(dialect="postgresql"),
+)
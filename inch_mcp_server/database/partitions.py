@@ -0,0 +1,243 @@
+"""Partitions of ``limit_orders`` by chain and creation month, and partition-level retention.
+
+``limit_orders`` is range-partitioned on ``(blockchain_id, created_at)``; each
+managed partition holds one chain's orders created in one UTC month and is
+named ``limit_orders_c<chain>_<yyyymm>``. Rows of chains or months without a
+partition land in ``limit_orders_default``.
+"""
+
+import asyncio
+import contextvars
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from inch_mcp_server.utils.logger_setup import setup_logger
+
+logger = setup_logger("database.partitions")
+
+TABLE = "limit_orders"
+DEFAULT_PARTITION = "limit_orders_default"
+COLUMNS = "id, blockchain_id, address, order_hash, data, status, status_updated_at"
+
+# Arbitrary key of the advisory lock that keeps maintenance on one instance at a time
+MAINTENANCE_LOCK = 0x6C696D6974
+
+_PARTITION_NAME = re.compile(r"^limit_orders_c(\d+)_(\d{4})(\d{2})$")
+
+# Orders upstream reported as filled or invalid (expired, cancelled, ...)
+TERMINAL = (
+    "status IS NOT NULL AND (status->>'orderInvalidReason' IS NOT NULL OR status->>'remainingMakerAmount' = '0')"
+)
+
+# Expiration timestamp of a stored order: bits 80-119 of its LOP v4 makerTraits (decimal or 0x hex), 0 if none
+_TRAITS = "(data->'data'->>'makerTraits')"
+EXPIRATION = (
+    "COALESCE(CASE "
+    "WHEN {traits} ~* '^0x[0-9a-f]{{1,64}}$' "
+    "THEN ('x' || lpad(substr(lpad(substr({traits}, 3), 64, '0'), 35, 10), 16, '0'))::bit(64)::bigint "
+    "WHEN {traits} ~ '^[0-9]{{1,78}}$' "
+    "THEN mod(div({traits}::numeric, {offset}), {mask})::bigint "
+    "END, 0)"
+).format(traits=_TRAITS, offset=1 << 80, mask=1 << 40)
+
+# Orders that can no longer be filled: terminal by their last status or past their expiration at :now
+FINISHED = "({terminal}) OR ({expiration} BETWEEN 1 AND :now)".format(terminal=TERMINAL, expiration=EXPIRATION)
+
+
+def month_start(moment: datetime) -> datetime:
+    moment = moment.astimezone(timezone.utc)
+    return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(chain: int, month: datetime) -> str:
+    return "{}_c{}_{:04d}{:02d}".format(TABLE, chain, month.year, month.month)
+
+
+def partition_bounds(chain: int, month: datetime) -> str:
+    """``FOR VALUES`` clause of the partition holding ``chain``'s orders created in ``month``."""
+    return "FOR VALUES FROM ({chain}, '{start}') TO ({chain}, '{end}')".format(
+        chain=int(chain), start=month.isoformat(), end=add_months(month, 1).isoformat()
+    )
+
+
+def create_partition_statements(chain: int, month: datetime) -> List[str]:
+    """Statements that create a partition, moving rows it covers out of the default partition first.
+
+    Attaching a partition fails while the default partition holds rows in its
+    range, so the partition is built standalone, filled from the default
+    partition and then attached.
+    """
+    name = partition_name(chain, month)
+    end = add_months(month, 1)
+    return [
+        "CREATE TABLE {} (LIKE {} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)".format(name, TABLE),
+        (
+            "WITH moved AS (DELETE FROM {default} WHERE blockchain_id = {chain} AND created_at >= '{start}' "
+            "AND created_at < '{end}' RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+        ).format(default=DEFAULT_PARTITION, chain=int(chain), start=month.isoformat(), end=end.isoformat(), name=name),
+        "ALTER TABLE {} ATTACH PARTITION {} {}".format(TABLE, name, partition_bounds(chain, month)),
+    ]
+
+
+class Partition:
+    """A managed partition of one chain and month, with the planner's row estimate."""
+
+    def __init__(self, name: str, chain: int, month: datetime, rows: Optional[int] = None):
+        self.name = name
+        self.chain = chain
+        self.month = month
+        self.rows = rows
+
+    @property
+    def end(self) -> datetime:
+        return add_months(self.month, 1)
+
+    @classmethod
+    def parse(cls, name: str, rows: Optional[int] = None) -> Optional["Partition"]:
+        match = _PARTITION_NAME.match(name)
+        if match is None:
+            return None
+        chain, year, month = (int(group) for group in match.groups())
+        return cls(name, chain, datetime(year, month, 1, tzinfo=timezone.utc), rows)
+
+
+async def list_partitions(connection: AsyncConnection) -> List[Partition]:
+    """Managed partitions attached to ``limit_orders``, oldest first per chain."""
+    result = await connection.execute(text(
+        "SELECT c.relname, c.reltuples::bigint FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = :table"
+    ), {"table": TABLE})
+    partitions = [Partition.parse(name, max(rows, 0)) for name, rows in result]
+    return sorted((p for p in partitions if p is not None), key=lambda p: (p.chain, p.month))
+
+
+async def _try_lock(connection: AsyncConnection) -> bool:
+    return bool(await connection.scalar(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": MAINTENANCE_LOCK}))
+
+
+async def ensure_partitions(engine: AsyncEngine, chains: Iterable[int], months_ahead: int = 2,
+                            now: datetime = None) -> List[str]:
+    """Create the partitions of ``chains`` from the current month to ``months_ahead`` months ahead.
+
+    Returns:
+        list: Names of the partitions created, empty if another instance holds the maintenance lock
+    """
+    current = month_start(now or datetime.now(timezone.utc))
+    created = []
+    async with engine.begin() as connection:
+        if not await _try_lock(connection):
+            logger.info("Partition maintenance is running elsewhere, skipping")
+            return created
+        existing = {partition.name for partition in await list_partitions(connection)}
+        for chain in chains:
+            for offset in range(months_ahead + 1):
+                month = add_months(current, offset)
+                if partition_name(chain, month) in existing:
+                    continue
+                for statement in create_partition_statements(chain, month):
+                    await connection.execute(text(statement))
+                created.append(partition_name(chain, month))
+    if created:
+        logger.info("Created partitions {}".format(", ".join(created)))
+    return created
+
+
+async def purge_partitions(engine: AsyncEngine, retention_days: int, archive_schema: Optional[str] = None,
+                           now: datetime = None, dry_run: bool = False) -> List[dict]:
+    """Drop, or move to ``archive_schema``, every partition whose month ended ``retention_days`` ago.
+
+    Live orders in such a partition are first carried forward into the current
+    month (their ``created_at`` is reset), so only finished orders go away with
+    the partition. An order is finished once its last status says it is filled
+    or invalid, or once the expiration in its ``makerTraits`` has passed, so
+    orders whose status was never refreshed still age out; only those that
+    also never expire are kept for lack of evidence. Each partition is handled
+    in its own transaction: one short ``DETACH`` and a ``DROP`` instead of
+    row-level deletes and the vacuum work they leave behind.
+
+    Returns:
+        list: ``{"partition", "carried", "action"}`` per purged (or, with ``dry_run``, purgeable) partition
+    """
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=retention_days)
+    async with engine.connect() as connection:
+        expired = [partition for partition in await list_partitions(connection) if partition.end <= cutoff]
+    action = "archived" if archive_schema else "dropped"
+    purged = []
+    for partition in expired:
+        if dry_run:
+            purged.append({"partition": partition.name, "carried": None, "action": "would be " + action})
+            continue
+        async with engine.begin() as connection:
+            if not await _try_lock(connection):
+                logger.info("Partition maintenance is running elsewhere, skipping")
+                break
+            carried = await connection.execute(text(
+                "INSERT INTO {table} ({columns}, created_at) SELECT {columns}, now() FROM {name} "
+                "WHERE NOT ({finished})".format(table=TABLE, columns=COLUMNS, name=partition.name, finished=FINISHED)
+            ), {"now": int(now.timestamp())})
+            await connection.execute(text("ALTER TABLE {} DETACH PARTITION {}".format(TABLE, partition.name)))
+            if archive_schema:
+                await connection.execute(text('CREATE SCHEMA IF NOT EXISTS "{}"'.format(archive_schema)))
+                await connection.execute(text('ALTER TABLE {} SET SCHEMA "{}"'.format(partition.name, archive_schema)))
+            else:
+                await connection.execute(text("DROP TABLE {}".format(partition.name)))
+        purged.append({"partition": partition.name, "carried": carried.rowcount, "action": action})
+        logger.info("Partition {} {} after carrying {} live orders forward".format(
+            partition.name, action, carried.rowcount))
+    return purged
+
+
+class PartitionMaintainer:
+    """Background job that keeps partitions created ahead of time and purges expired ones.
+
+    Runs every ``interval`` seconds; an advisory lock keeps concurrent
+    instances from doing the same work twice.
+    """
+
+    def __init__(self, engine: AsyncEngine, chains: Iterable[int], months_ahead: int = 2, retention_days: int = 0,
+                 archive_schema: Optional[str] = None, interval: float = 3600.0):
+        self.engine = engine
+        self.chains = list(chains)
+        self.months_ahead = months_ahead
+        self.retention_days = retention_days
+        self.archive_schema = archive_schema
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> None:
+        await ensure_partitions(self.engine, self.chains, self.months_ahead)
+        if self.retention_days > 0:
+            await purge_partitions(self.engine, self.retention_days, self.archive_schema)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            # A fresh context so the job does not inherit the caller's deadline or database session
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error("Partition maintenance failed: {}".format(e))
+            await asyncio.sleep(self.interval)
@@ -1,12 +1,25 @@
 """Dependency injection configuration for the 1inch MCP Server."""
 
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Request
 
+from inch_mcp_server.config import settings
+from inch_mcp_server.database import get_database_engine
+from inch_mcp_server.database.partitions import PartitionMaintainer
 from inch_mcp_server.integrations.api.limit_order_api_client import LimitOrderAPIClient
+from inch_mcp_server.integrations.services.best_orders import BestOrdersIndex
+from inch_mcp_server.integrations.services.fee_engine import FeeEngine
 from inch_mcp_server.integrations.services.limit_order_service import LimitOrderService
+from inch_mcp_server.integrations.services.order_cache import OrderCache
+from inch_mcp_server.integrations.services.order_counter import OrderCounter
+from inch_mcp_server.integrations.services.order_verifier import OrderVerifier
+from inch_mcp_server.integrations.services.order_watcher import OrderWatcher
+from inch_mcp_server.integrations.services.pair_index import PairIndex
+from inch_mcp_server.integrations.services.snapshots import SnapshotStore
+from inch_mcp_server.integrations.services.write_behind import WriteBehindQueue
+from inch_mcp_server.utils.admission import CHEAP, EXPENSIVE, AdmissionController, AdmissionQueue, Rejected
 
 
 @lru_cache()
@@ -19,18 +32,222 @@ def get_api_client() -> LimitOrderAPIClient:
     return LimitOrderAPIClient()
 
 
+@lru_cache()
+def get_pair_index() -> PairIndex:
+    """Get a singleton instance of the pair index.
+
+    Returns:
+        PairIndex: The process-wide pair index sharing the singleton API client
+    """
+    return PairIndex(
+        get_api_client(),
+        ttl=settings.pair_index_ttl_seconds,
+        max_stale=settings.pair_index_max_stale_seconds,
+        prefetch_concurrency=settings.pair_index_prefetch_concurrency,
+    )
+
+
+@lru_cache()
+def get_fee_engine() -> FeeEngine:
+    """Get a singleton instance of the fee engine.
+
+    Returns:
+        FeeEngine: The process-wide fee parameter cache sharing the singleton API client
+    """
+    return FeeEngine(
+        get_api_client(),
+        ttl=settings.fee_info_ttl_seconds,
+        verify_every=settings.fee_info_verify_every,
+        maxsize=settings.fee_info_cache_size,
+    )
+
+
+@lru_cache()
+def get_order_cache() -> OrderCache:
+    """Get a singleton instance of the order-by-hash cache.
+
+    Returns:
+        OrderCache: The process-wide cache backed by the configured SQLite file, opened on first use
+    """
+    return OrderCache(
+        settings.order_cache_file,
+        status_ttl=settings.order_status_ttl_seconds,
+        memory_size=settings.order_cache_memory_size,
+    )
+
+
+@lru_cache()
+def get_best_orders_index() -> BestOrdersIndex:
+    """Get a singleton instance of the best orders index.
+
+    Returns:
+        BestOrdersIndex: The process-wide per-pair sorted order books sharing the singleton API client
+    """
+    return BestOrdersIndex(
+        get_api_client(),
+        ttl=settings.best_orders_ttl_seconds,
+        max_orders=settings.best_orders_max_orders,
+        max_pairs=settings.best_orders_max_pairs,
+    )
+
+
+@lru_cache()
+def get_order_counter() -> OrderCounter:
+    """Get a singleton instance of the order counter.
+
+    Returns:
+        OrderCounter: The process-wide order count cache sharing the singleton API client
+    """
+    return OrderCounter(
+        get_api_client(),
+        ttl=settings.order_count_ttl_seconds,
+        concurrency=settings.order_count_concurrency,
+    )
+
+
+@lru_cache()
+def get_snapshot_store() -> SnapshotStore:
+    """Get a singleton instance of the pagination snapshot store.
+
+    Returns:
+        SnapshotStore: The process-wide store of result snapshots behind cursors
+    """
+    return SnapshotStore(ttl=settings.snapshot_ttl_seconds, maxsize=settings.snapshot_cache_size)
+
+
+@lru_cache()
+def get_order_watcher() -> OrderWatcher:
+    """Get a singleton instance of the order status poller.
+
+    Returns:
+        OrderWatcher: The process-wide poller shared by all resource subscriptions
+    """
+    return OrderWatcher(
+        get_api_client(),
+        order_cache=get_order_cache(),
+        interval=settings.order_watch_interval_seconds,
+        concurrency=settings.order_watch_concurrency,
+    )
+
+
+@lru_cache()
+def get_order_verifier() -> OrderVerifier:
+    """Get a singleton instance of the local order hash verifier.
+
+    Returns:
+        OrderVerifier: The process-wide verifier with per-chain cached domain separators
+    """
+    return OrderVerifier(
+        router_address=settings.limit_order_router_address,
+        router_addresses=settings.limit_order_router_addresses,
+        check_signature=settings.order_verify_signature,
+    )
+
+
+@lru_cache()
+def get_admission_controller() -> AdmissionController:
+    """Get a singleton instance of the admission controller.
+
+    Returns:
+        AdmissionController: The process-wide queues shared by MCP tool calls and REST requests
+    """
+    return AdmissionController(
+        {
+            CHEAP: AdmissionQueue.from_config(CHEAP, settings.admission_cheap),
+            EXPENSIVE: AdmissionQueue.from_config(EXPENSIVE, settings.admission_expensive),
+        },
+        classes=settings.admission_classes,
+    )
+
+
+@lru_cache()
+def get_write_behind() -> Optional[WriteBehindQueue]:
+    """Get a singleton instance of the write-behind queue.
+
+    Returns:
+        Optional[WriteBehindQueue]: The process-wide queue, or None when writes go to the database inline
+    """
+    if not settings.write_behind_enabled:
+        return None
+    return WriteBehindQueue(
+        max_pending=settings.write_behind_max_pending,
+        batch_size=settings.write_behind_batch_size,
+        flush_interval=settings.write_behind_flush_seconds,
+        max_attempts=settings.write_behind_max_attempts,
+    )
+
+
+@lru_cache()
+def get_partition_maintainer() -> PartitionMaintainer:
+    """Get a singleton instance of the ``limit_orders`` partition maintenance job.
+
+    Returns:
+        PartitionMaintainer: The job creating partitions ahead and purging expired ones
+    """
+    return PartitionMaintainer(
+        get_database_engine(),
+        chains=settings.partition_chains,
+        months_ahead=settings.partition_months_ahead,
+        retention_days=settings.order_retention_days,
+        archive_schema=settings.order_archive_schema,
+        interval=settings.partition_maintenance_interval_seconds,
+    )
+
+
+async def admit_request(request: Request):
+    """Hold an admission slot for the matched route while it runs.
+
+    Raises:
+        HTTPException: 503 with a ``Retry-After`` header when the request is shed
+    """
+    try:
+        async with get_admission_controller().admit(request.scope["endpoint"].__name__):
+            yield
+    except Rejected as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+
 def get_limit_order_service(
-    api_client: Annotated[LimitOrderAPIClient, Depends(get_api_client)]
+    api_client: Annotated[LimitOrderAPIClient, Depends(get_api_client)],
+    pair_index: Annotated[PairIndex, Depends(get_pair_index)],
+    fee_engine: Annotated[FeeEngine, Depends(get_fee_engine)],
+    order_cache: Annotated[OrderCache, Depends(get_order_cache)],
+    best_orders: Annotated[BestOrdersIndex, Depends(get_best_orders_index)],
+    order_counter: Annotated[OrderCounter, Depends(get_order_counter)],
+    snapshots: Annotated[SnapshotStore, Depends(get_snapshot_store)],
+    order_watcher: Annotated[OrderWatcher, Depends(get_order_watcher)],
+    order_verifier: Annotated[OrderVerifier, Depends(get_order_verifier)],
+    write_behind: Annotated[Optional[WriteBehindQueue], Depends(get_write_behind)],
 ) -> LimitOrderService:
     """Get a limit order service instance with injected API client.
     
     Args:
         api_client: The injected API client instance
+        pair_index: The injected pair index instance
+        fee_engine: The injected fee engine instance
+        order_cache: The injected order cache instance
+        best_orders: The injected best orders index instance
+        order_counter: The injected order counter instance
+        snapshots: The injected pagination snapshot store
+        order_watcher: The injected order status poller
+        order_verifier: The injected local order hash verifier
+        write_behind: The injected write-behind queue, None when disabled
         
     Returns:
         LimitOrderService: The service instance with injected dependencies
     """
-    return LimitOrderService(api_client=api_client)
+    return LimitOrderService(
+        api_client=api_client,
+        pair_index=pair_index,
+        fee_engine=fee_engine,
+        order_cache=order_cache,
+        best_orders=best_orders,
+        order_counter=order_counter,
+        snapshots=snapshots,
+        order_watcher=order_watcher,
+        order_verifier=order_verifier,
+        write_behind=write_behind,
+    )
 
 
 def create_service_for_mcp() -> LimitOrderService:
@@ -43,9 +260,22 @@ def create_service_for_mcp() -> LimitOrderService:
         LimitOrderService: Service instance with properly injected dependencies
     """
     api_client = get_api_client()
-    return LimitOrderService(api_client=api_client)
+    return LimitOrderService(
+        api_client=api_client,
+        pair_index=get_pair_index(),
+        fee_engine=get_fee_engine(),
+        order_cache=get_order_cache(),
+        best_orders=get_best_orders_index(),
+        order_counter=get_order_counter(),
+        snapshots=get_snapshot_store(),
+        order_watcher=get_order_watcher(),
+        order_verifier=get_order_verifier(),
+        write_behind=get_write_behind(),
+    )
 
 
 # Type aliases for dependency injection
 APIClientDep = Annotated[LimitOrderAPIClient, Depends(get_api_client)]
-LimitOrderServiceDep = Annotated[LimitOrderService, Depends(get_limit_order_service)]
\ No newline at end of file
+AdmissionControllerDep = Annotated[AdmissionController, Depends(get_admission_controller)]
+LimitOrderServiceDep = Annotated[LimitOrderService, Depends(get_limit_order_service)]
+WriteBehindDep = Annotated[Optional[WriteBehindQueue], Depends(get_write_behind)]
\ No newline at end of file
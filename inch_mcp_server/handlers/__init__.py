@@ -1,5 +1,6 @@
 """MCP handlers package for 1inch integration."""
 
 from .limit_order_handler import LimitOrderHandler
+from .middleware import AdmissionMiddleware, DatabaseSessionMiddleware, DeadlineMiddleware
 
-__all__ = ["LimitOrderHandler"]
\ No newline at end of file
+__all__ = ["LimitOrderHandler", "DeadlineMiddleware", "AdmissionMiddleware", "DatabaseSessionMiddleware"]
\ No newline at end of file
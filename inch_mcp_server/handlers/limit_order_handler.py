@@ -1,9 +1,21 @@
 """Tool handler for the 1inch Limit Order Protocol MCP Server."""
-from typing import List
+from typing import Annotated, List, Union
+
+from pydantic import Field
 
 from inch_mcp_server.integrations.services.limit_order_service import LimitOrderService
-from ..core.models import FeeExtension
+from ..core.models import (
+    FeeAmounts,
+    FeeExtension,
+    GetLimitOrdersV4Response,
+    LimitOrderV4Response,
+    PostLimitOrderV4Request,
+    TokenPairFilter,
+)
 from ..utils import validate_evm_address, validate_hash
+from ..integrations.services.order_watcher import MAKER, ORDER
+from ..utils.projection import project, validate_fields
+from .subscriptions import MAKER_URI, ORDER_URI, ResourceSubscriptions
 
 
 class LimitOrderHandler:
@@ -41,22 +53,38 @@ class LimitOrderHandler:
             """
 
         @mcp.tool
-        async def get_limit_orders_by_chain_and_address(chain: int, address: str) -> List[dict]:
+        async def get_limit_orders_by_chain_and_address(chain: int, address: str, fields: List[str] = None,
+                                                        limit: int = None,
+                                                        cursor: str = None) -> Union[List[dict], dict]:
             """Get all limit orders for a specific chain and address.
 
+            Pass limit to page through the orders: the response then holds items, totalItems and
+            nextCursor, and calling again with cursor=nextCursor returns the next page from a
+            server-side snapshot without re-fetching.
+
             Args:
                 chain: The blockchain chain ID (e.g., 1 for Ethereum, 137 for Polygon). Optional parameter, 1 by default
                 address: The wallet address to get orders for. Required parameter
+                fields: Order fields to return, e.g. ["orderHash", "data.makerAsset"], or ["compact"] for everything except the signature, extension and makerTraits blobs. Optional parameter, defaults to all fields
+                limit: Page size (1-100). Optional parameter, defaults to returning every order in one list
+                cursor: nextCursor from a previous page of the same chain and address. Optional parameter
 
             Returns:
-                Dictionary containing the limit orders data
+                List of limit orders, or a page dictionary when limit or cursor is given
             """
             if not chain or chain <= 0:
                 raise ValueError("Chain ID must be a positive integer")
             validate_evm_address(address, "address", required=True)
+            validate_fields(GetLimitOrdersV4Response, fields)
+            if limit is not None and (limit <= 0 or limit > 100):
+                raise ValueError("Limit must be a positive integer between 1 and 100")
             
             try:
-                return await self.limit_order_service.fetch_and_store_orders(chain, address)
+                if limit is None and not cursor:
+                    orders = await self.limit_order_service.fetch_and_store_orders(chain, address)
+                    return project(orders, fields)
+                page = await self.limit_order_service.fetch_orders_page(chain, address, limit or 100, cursor)
+                return project(page, fields, items="items")
             except Exception as e:
                 raise ValueError(f"Failed to fetch orders: {str(e)}")
 
@@ -99,12 +127,45 @@ class LimitOrderHandler:
                 raise ValueError(f"Failed to retrieve fee info: {str(e)}")
 
         @mcp.tool
-        async def get_limit_order_by_hash(chain: int, order_hash: str) -> dict:
+        async def get_limit_order_fee_quotes(chain: int, maker_asset: str, taker_asset: str,
+                                             amounts: Annotated[List[FeeAmounts], Field(min_length=1, max_length=1000)]) -> dict:
+            """Get fee quotes for many order sizes of one token pair in a single call.
+
+            Fee parameters are fetched once per pair and cached; fee amounts for every
+            size are computed locally, so sweeping order sizes costs one call.
+
+            Args:
+                chain: The blockchain chain ID (e.g., 1 for Ethereum, 137 for Polygon). Required parameter
+                maker_asset: The token address that the maker wants to sell. Required parameter
+                taker_asset: The token address that the maker wants to buy. Required parameter
+                amounts: List of {makerAmount, takerAmount} objects to quote. Required parameter, at most 1000 items
+
+            Returns:
+                Dictionary with the pair's feeInfo and one quote (feeBps, feeAmount, whitelistedFeeBps,
+                whitelistedFeeAmount) per requested amount
+            """
+            if not chain or chain <= 0:
+                raise ValueError("Chain ID must be a positive integer")
+
+            validate_evm_address(maker_asset, "makerAsset", required=True)
+            validate_evm_address(taker_asset, "takerAsset", required=True)
+
+            try:
+                quotes = await self.limit_order_service.quote_order_fees(chain, maker_asset, taker_asset, amounts)
+                return quotes.model_dump()
+            except Exception as e:
+                raise ValueError(f"Failed to quote fees: {str(e)}")
+
+        @mcp.tool
+        async def get_limit_order_by_hash(chain: int, order_hash: str, refresh_status: bool = False,
+                                          fields: List[str] = None) -> dict:
             """Get a specific limit order by its order hash on a specific chain.
 
             Args:
                 chain: The blockchain chain ID (e.g., 1 for Ethereum, 137 for Polygon). Optional parameter, 1 by default
                 order_hash: The unique order hash to retrieve. Required parameter
+                refresh_status: Fetch live fill/balance status from 1inch instead of a recently stored one. Optional parameter, defaults to false
+                fields: Order fields to return, e.g. ["orderHash", "remainingMakerAmount"], or ["compact"] for everything except the signature, extension and makerTraits blobs. Optional parameter, defaults to all fields
 
             Returns:
                 Dictionary containing the limit order data
@@ -112,10 +173,11 @@ class LimitOrderHandler:
             if not chain or chain <= 0:
                 raise ValueError("Chain ID must be a positive integer")
             validate_hash(order_hash, "Order hash", expected_length=66, required=True)
+            validate_fields(LimitOrderV4Response, fields)
             
             try:
-                order = await self.limit_order_service.fetch_order_by_hash(chain, order_hash)
-                return order.model_dump()
+                order = await self.limit_order_service.fetch_order_by_hash(chain, order_hash, refresh_status)
+                return project(order, fields)
             except Exception as e:
                 raise ValueError(f"Failed to fetch order: {str(e)}")
 
@@ -153,16 +215,52 @@ class LimitOrderHandler:
                 raise ValueError(f"Failed to fetch order count: {str(e)}")
 
         @mcp.tool
-        async def get_unique_active_token_pairs(chain: int = 1, page: int = 1, limit: int = 100) -> dict:
+        async def get_limit_orders_count_matrix(chain: int, pairs: List[TokenPairFilter],
+                                                status_sets: List[List[int]]) -> dict:
+            """Count limit orders for every combination of token pairs and status sets in one call.
+
+            Use this instead of calling get_limit_orders_count_by_filters repeatedly. Duplicate
+            combinations are fetched once, requests run concurrently and results are cached briefly.
+
+            Args:
+                chain: The blockchain chain ID (e.g., 1 for Ethereum, 137 for Polygon). Required parameter
+                pairs: List of {makerAsset, takerAsset} filters; either address may be omitted to match any token. Required parameter
+                status_sets: List of status lists to count, e.g. [[1], [2, 3]]. Valid statuses: 1 - Valid orders, 2 - Temporarily invalid orders, 3 - Invalid orders. Required parameter
+
+            Returns:
+                Dictionary with statusSets and one row per pair whose counts follow the order of statusSets
+                (null where a count failed, with the reason listed in errors)
+            """
+            if not chain or chain <= 0:
+                raise ValueError("Chain ID must be a positive integer")
+            if not pairs or not status_sets:
+                raise ValueError("pairs and status_sets must both be non-empty")
+            if any(not statuses or any(status not in [1, 2, 3] for status in statuses) for statuses in status_sets):
+                raise ValueError("Each status set must be a non-empty list of integers (1, 2, or 3)")
+            for pair in pairs:
+                validate_evm_address(pair.makerAsset, "makerAsset", required=False)
+                validate_evm_address(pair.takerAsset, "takerAsset", required=False)
+
+            try:
+                matrix = await self.limit_order_service.fetch_orders_count_matrix(chain, pairs, status_sets)
+                return matrix.model_dump()
+            except Exception as e:
+                raise ValueError(f"Failed to fetch order count matrix: {str(e)}")
+
+        @mcp.tool
+        async def get_unique_active_token_pairs(chain: int = 1, page: int = 1, limit: int = 100,
+                                                cursor: str = None) -> dict:
             """Get unique active token pairs available for limit orders on a specific chain.
 
             Args:
                 chain: The blockchain chain ID (e.g., 1 for Ethereum, 137 for Polygon). Optional parameter, defaults to 1
-                page: Page number for pagination. Optional parameter, defaults to 1
+                page: Page number for pagination. Optional parameter, defaults to 1, ignored when cursor is given
                 limit: Number of pairs per page (1-100). Optional parameter, defaults to 100
+                cursor: nextCursor from a previous response; continues the same stable snapshot. Optional parameter
 
             Returns:
-                Dictionary containing the list of unique active token pairs and pagination metadata
+                Dictionary containing the list of unique active token pairs, pagination metadata and nextCursor
+                (null on the last page)
             """
             if not chain or chain <= 0:
                 raise ValueError("Chain ID must be a positive integer")
@@ -172,7 +270,164 @@ class LimitOrderHandler:
                 raise ValueError("Limit must be a positive integer between 1 and 100")
             
             try:
-                pairs_data = await self.limit_order_service.fetch_unique_active_pairs(chain, page, limit)
+                pairs_data = await self.limit_order_service.fetch_unique_active_pairs(chain, page, limit, cursor)
                 return pairs_data.model_dump()
             except Exception as e:
                 raise ValueError(f"Failed to fetch unique active pairs: {str(e)}")
+
+        @mcp.tool
+        async def search_token_pairs(chain: int, token: str) -> dict:
+            """Find every active trading pair involving a token on a specific chain.
+
+            Answers "what trades against token X" from a cached index of all unique active
+            pairs, so there is no need to page through get_unique_active_token_pairs.
+
+            Args:
+                chain: The blockchain chain ID (e.g., 1 for Ethereum, 137 for Polygon). Required parameter
+                token: The token address to search for. Required parameter
+
+            Returns:
+                Dictionary with asMakerAsset (tokens makers want in exchange for the token),
+                asTakerAsset (tokens offered by makers who want the token) and index metadata
+            """
+            if not chain or chain <= 0:
+                raise ValueError("Chain ID must be a positive integer")
+            validate_evm_address(token, "token", required=True)
+
+            try:
+                return await self.limit_order_service.search_token_pairs(chain, token)
+            except Exception as e:
+                raise ValueError(f"Failed to search token pairs: {str(e)}")
+
+        @mcp.tool
+        async def get_orderbook_depth(chain: int, base_asset: str, quote_asset: str, top_k: int = 10,
+                                      base_decimals: int = 0, quote_decimals: int = 0,
+                                      max_orders: int = 1000) -> dict:
+            """Get the best available rates and cumulative depth for a token pair.
+
+            Active orders in both directions are aggregated server-side into price levels, so
+            there is no need to pull raw orders and compute rates manually.
+
+            Args:
+                chain: The blockchain chain ID (e.g., 1 for Ethereum, 137 for Polygon). Required parameter
+                base_asset: The token being bought or sold. Required parameter
+                quote_asset: The token rates are expressed in (quote units per base unit). Required parameter
+                top_k: Number of price levels to return per side (1-100). Optional parameter, defaults to 10
+                base_decimals: Decimals of base_asset to scale amounts to token units. Optional parameter, defaults to 0 (raw units)
+                quote_decimals: Decimals of quote_asset to scale amounts to token units. Optional parameter, defaults to 0 (raw units)
+                max_orders: Maximum active orders read per side (1-5000). Optional parameter, defaults to 1000
+
+            Returns:
+                Dictionary with asks (makers selling base) and bids (makers buying base), each with bestRate,
+                totals and levels carrying per-level and cumulative base/quote amounts
+            """
+            if not chain or chain <= 0:
+                raise ValueError("Chain ID must be a positive integer")
+            validate_evm_address(base_asset, "base_asset", required=True)
+            validate_evm_address(quote_asset, "quote_asset", required=True)
+            if top_k <= 0 or top_k > 100:
+                raise ValueError("top_k must be a positive integer between 1 and 100")
+            if max_orders <= 0 or max_orders > 5000:
+                raise ValueError("max_orders must be a positive integer between 1 and 5000")
+            if base_decimals < 0 or quote_decimals < 0:
+                raise ValueError("Decimals must be non-negative integers")
+
+            try:
+                depth = await self.limit_order_service.get_orderbook_depth(
+                    chain, base_asset, quote_asset, top_k=top_k, max_orders=max_orders,
+                    base_decimals=base_decimals, quote_decimals=quote_decimals,
+                )
+                return depth.model_dump()
+            except Exception as e:
+                raise ValueError(f"Failed to compute orderbook depth: {str(e)}")
+
+        @mcp.tool
+        async def get_best_orders(chain: int, maker_asset: str, taker_asset: str, k: int = 10,
+                                  fields: List[str] = None) -> dict:
+            """Get the k cheapest active orders selling maker_asset for taker_asset.
+
+            Orders are ranked by price (taker_asset paid per maker_asset unit, i.e. lowest makerRate
+            first) from a sorted per-pair index kept up to date server-side, so there is no need to
+            fetch every order and sort it.
+
+            Args:
+                chain: The blockchain chain ID (e.g., 1 for Ethereum, 137 for Polygon). Required parameter
+                maker_asset: The token the orders sell. Required parameter
+                taker_asset: The token the orders want in return. Required parameter
+                k: Number of orders to return (1-100). Optional parameter, defaults to 10
+                fields: Fields of each order to return, or ["compact"] to drop the signature, extension and makerTraits blobs. Optional parameter, defaults to all fields
+
+            Returns:
+                Dictionary with the best orders (cheapest first), the number of active orders in
+                the pair and the age of the index in seconds
+            """
+            if not chain or chain <= 0:
+                raise ValueError("Chain ID must be a positive integer")
+            validate_evm_address(maker_asset, "maker_asset", required=True)
+            validate_evm_address(taker_asset, "taker_asset", required=True)
+            if k <= 0 or k > 100:
+                raise ValueError("k must be a positive integer between 1 and 100")
+            validate_fields(GetLimitOrdersV4Response, fields)
+
+            try:
+                best = await self.limit_order_service.get_best_orders(chain, maker_asset, taker_asset, k)
+                return project(best, fields, items="orders")
+            except Exception as e:
+                raise ValueError(f"Failed to get best orders: {str(e)}")
+
+        @mcp.tool
+        async def post_limit_orders(chain: int, orders: List[PostLimitOrderV4Request]) -> dict:
+            """Submit many signed limit orders in one call, e.g. to re-quote a market maker's whole book.
+
+            Each order's hash is verified locally first, then orders are posted to the 1inch
+            orderbook concurrently and the accepted ones are stored together.
+
+            Args:
+                chain: The blockchain chain ID (e.g., 1 for Ethereum, 137 for Polygon). Required parameter
+                orders: Signed orders as {orderHash, signature, data}, where data holds makerAsset, takerAsset, maker, receiver, makingAmount, takingAmount, salt, extension and makerTraits. Required parameter
+
+            Returns:
+                Dictionary with accepted/rejected/failed counts and one result per order in input order;
+                "failed" orders hit throttling, an upstream error or the deadline and can be resubmitted
+            """
+            if not chain or chain <= 0:
+                raise ValueError("Chain ID must be a positive integer")
+            if not orders:
+                raise ValueError("orders must be a non-empty list")
+            for order in orders:
+                validate_hash(order.orderHash, "orderHash")
+                validate_evm_address(order.data.maker, "maker", required=True)
+
+            try:
+                response = await self.limit_order_service.post_orders(chain, orders)
+                return response.model_dump()
+            except Exception as e:
+                raise ValueError(f"Failed to post limit orders: {str(e)}")
+
+        # Subscribable resources; updates come from the shared order watcher
+        self.subscriptions = ResourceSubscriptions(mcp, limit_order_service.order_watcher)
+
+        @mcp.resource(ORDER_URI, mime_type="application/json")
+        async def order_status(chain: int, order_hash: str) -> dict:
+            """Live fill and balance status of one limit order.
+
+            Subscribe to this resource to be notified when remainingMakerAmount, makerBalance,
+            makerAllowance or orderInvalidReason change instead of polling get_limit_order_by_hash.
+            The content carries the current status, a version counter and lastChange with the
+            old and new value of every field that changed.
+            """
+            validate_hash(order_hash, "Order hash", expected_length=66, required=True)
+            watcher = self.limit_order_service.order_watcher
+            return await watcher.read(watcher.target(ORDER, int(chain), order_hash))
+
+        @mcp.resource(MAKER_URI, mime_type="application/json")
+        async def maker_orders_status(chain: int, address: str) -> dict:
+            """Live status of every order of a maker address, keyed by order hash.
+
+            Subscribe to this resource to be notified when orders of the address are added,
+            removed or change status. lastChange lists added and removed hashes and the changed
+            fields per order.
+            """
+            validate_evm_address(address, "address", required=True)
+            watcher = self.limit_order_service.order_watcher
+            return await watcher.read(watcher.target(MAKER, int(chain), address))
@@ -0,0 +1,86 @@
+"""FastMCP middleware applied to every tool call."""
+
+import asyncio
+
+from fastapi_async_sqlalchemy import db
+from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import Middleware
+
+from inch_mcp_server.config import settings
+from inch_mcp_server.utils.admission import AdmissionController, Rejected
+from inch_mcp_server.utils.deadline import deadline, requested_budget
+from inch_mcp_server.utils.logger_setup import setup_logger
+
+logger = setup_logger("handlers.middleware")
+
+TIMEOUT_HEADER = "x-request-timeout"
+TIMEOUT_META = "timeoutSeconds"
+
+
+class DeadlineMiddleware(Middleware):
+    """Runs each tool call under a time budget.
+
+    The budget is ``_meta.timeoutSeconds`` of the call, else the
+    ``X-Request-Timeout`` header, else ``TOOL_TIMEOUTS[name]`` or
+    ``TOOL_TIMEOUT_SECONDS``. It is set as the current deadline, so upstream
+    requests and database statements are cut short and tools can return the
+    partial result they have; a call still running ``DEADLINE_GRACE_SECONDS``
+    after the deadline is cancelled.
+    """
+
+    @staticmethod
+    def budget(name: str, meta) -> float:
+        default = settings.tool_timeouts.get(name, settings.tool_timeout_seconds)
+        requested = getattr(meta, TIMEOUT_META, None) if meta is not None else None
+        if requested is None:
+            requested = get_http_headers().get(TIMEOUT_HEADER)
+        return requested_budget(requested, default, settings.max_timeout_seconds)
+
+    async def on_call_tool(self, context, call_next):
+        name = context.message.name
+        budget = self.budget(name, context.message.meta)
+        try:
+            async with asyncio.timeout(budget + settings.deadline_grace_seconds) as hard_limit:
+                with deadline(budget):
+                    return await call_next(context)
+        except TimeoutError:
+            if not hard_limit.expired():
+                raise
+            logger.warning("Tool {} cancelled after exceeding its {:.1f}s budget".format(name, budget))
+            raise ValueError("Tool {} exceeded its time budget of {:.1f}s".format(name, budget))
+
+
+class AdmissionMiddleware(Middleware):
+    """Admits each tool call through the admission queue of its class.
+
+    Registered inside ``DeadlineMiddleware`` so queueing counts against the
+    call's budget and calls that cannot finish in time are shed before they
+    start work. A shed call fails fast with a retry hint.
+    """
+
+    def __init__(self, controller: AdmissionController):
+        self.controller = controller
+
+    async def on_call_tool(self, context, call_next):
+        name = context.message.name
+        try:
+            async with self.controller.admit(name):
+                return await call_next(context)
+        except Rejected as e:
+            logger.info("Shed tool call {}: {}".format(name, e.reason))
+            raise ValueError(str(e))
+
+
+class DatabaseSessionMiddleware(Middleware):
+    """Gives each tool call its own database session.
+
+    Tool calls run in the MCP session manager's tasks rather than inside the
+    HTTP request, so the session opened by ``SQLAlchemyMiddleware`` is not
+    visible to them. Registered innermost, so only admitted calls get one;
+    the session takes a pooled connection only once it runs a statement and
+    returns it when the call ends.
+    """
+
+    async def on_call_tool(self, context, call_next):
+        async with db():
+            return await call_next(context)
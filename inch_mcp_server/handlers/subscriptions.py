@@ -0,0 +1,115 @@
+"""MCP resource subscriptions for order and maker status changes."""
+
+import re
+import weakref
+from typing import Dict, Optional
+
+from mcp import types
+from pydantic import AnyUrl
+
+from inch_mcp_server.integrations.services.order_watcher import MAKER, ORDER, OrderWatcher, WatchTarget
+from inch_mcp_server.utils.logger_setup import setup_logger
+
+logger = setup_logger("handlers.subscriptions")
+
+ORDER_URI = "limit-order://{chain}/order/{order_hash}"
+MAKER_URI = "limit-order://{chain}/maker/{address}"
+
+_URI_PATTERN = re.compile(r"^limit-order://(?P<chain>\d+)/(?P<kind>order|maker)/(?P<value>0x[0-9a-fA-F]+)$")
+
+
+def parse_resource_uri(uri: str) -> Optional[WatchTarget]:
+    """Map a subscribable resource URI to its watch target, or None if it is not one."""
+    match = _URI_PATTERN.match(uri)
+    if match is None:
+        return None
+    return OrderWatcher.target(ORDER if match["kind"] == "order" else MAKER, int(match["chain"]), match["value"])
+
+
+def resource_uri(target: WatchTarget) -> str:
+    kind, chain, value = target
+    template = ORDER_URI if kind == ORDER else MAKER_URI
+    return template.format(chain=chain, order_hash=value, address=value)
+
+
+def low_level_server(mcp):
+    """The mcp SDK server behind a FastMCP instance, whose handlers and capabilities we extend.
+
+    FastMCP 2.10.6 keeps it in the private ``_mcp_server`` attribute; fail at
+    startup rather than silently stop advertising subscriptions if an upgrade
+    moves it.
+
+    Raises:
+        RuntimeError: If the server or its ``get_capabilities`` is not where this version keeps them
+    """
+    server = getattr(mcp, "_mcp_server", None)
+    if server is None or not callable(getattr(server, "get_capabilities", None)):
+        raise RuntimeError(
+            "FastMCP no longer exposes _mcp_server.get_capabilities; resource subscriptions were written "
+            "against fastmcp 2.10.6 and need updating"
+        )
+    return server
+
+
+class ResourceSubscriptions:
+    """Wires ``resources/subscribe`` to the shared ``OrderWatcher``.
+
+    Sessions are held weakly per target; the watcher tracks a target while at
+    least one live session is subscribed and each change is pushed as a
+    ``notifications/resources/updated`` to every subscriber, which then reads
+    the resource for the new state and the diff.
+    """
+
+    def __init__(self, mcp, watcher: OrderWatcher):
+        self.watcher = watcher
+        self._server = low_level_server(mcp)
+        self._subscribers: Dict[WatchTarget, "weakref.WeakSet"] = {}
+
+        self._server.subscribe_resource()(self.subscribe)
+        self._server.unsubscribe_resource()(self.unsubscribe)
+        watcher.add_listener(self.notify)
+
+        # The low-level server always advertises subscribe=False and offers no hook to change it
+        # (mcp 1.12 under fastmcp 2.10.6, pinned in pyproject.toml), so its get_capabilities is
+        # wrapped; low_level_server() and tests/test_subscriptions.py fail if that stops working
+        get_capabilities = self._server.get_capabilities
+
+        def capabilities_with_subscribe(*args, **kwargs) -> types.ServerCapabilities:
+            capabilities = get_capabilities(*args, **kwargs)
+            if capabilities.resources is not None:
+                capabilities.resources.subscribe = True
+            return capabilities
+
+        self._server.get_capabilities = capabilities_with_subscribe
+
+    async def subscribe(self, uri: AnyUrl) -> None:
+        target = parse_resource_uri(str(uri))
+        if target is None:
+            raise ValueError("Resource {} does not support subscriptions".format(uri))
+        for stale in [key for key, sessions in self._subscribers.items() if not sessions]:
+            self._release_if_unused(stale)
+        await self.watcher.watch(target)
+        self._subscribers.setdefault(target, weakref.WeakSet()).add(self._server.request_context.session)
+        logger.info("Subscribed to {} ({} subscribers)".format(uri, len(self._subscribers[target])))
+
+    async def unsubscribe(self, uri: AnyUrl) -> None:
+        target = parse_resource_uri(str(uri))
+        sessions = self._subscribers.get(target)
+        if sessions is not None:
+            sessions.discard(self._server.request_context.session)
+            self._release_if_unused(target)
+
+    def _release_if_unused(self, target: WatchTarget) -> None:
+        if not self._subscribers.get(target):
+            self._subscribers.pop(target, None)
+            self.watcher.unwatch(target)
+
+    async def notify(self, target: WatchTarget, change: dict) -> None:
+        uri = AnyUrl(resource_uri(target))
+        for session in list(self._subscribers.get(target, ())):
+            try:
+                await session.send_resource_updated(uri)
+            except Exception as e:
+                logger.info("Dropping subscriber of {}: {}".format(uri, e))
+                self._subscribers[target].discard(session)
+        self._release_if_unused(target)
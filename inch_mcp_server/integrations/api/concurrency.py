@@ -0,0 +1,133 @@
+"""Adaptive limits on concurrent upstream calls per chain and endpoint."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+
+class AdaptiveLimiter:
+    """Concurrency limit adjusted by AIMD with a latency gradient.
+
+    Every successful call while the smoothed latency stays below ``tolerance``
+    times the baseline grows the limit by ``1 / limit`` (about +1 per round
+    trip at full utilisation). A 429, a 5xx, a transport error or a smoothed
+    latency above the tolerance cuts the limit by ``backoff``, at most once per
+    smoothed round trip so a burst of failures counts as one congestion signal.
+    The baseline is the lowest latency seen, drifting towards the current
+    average over ``baseline_window`` seconds so it follows lasting changes
+    upstream. Callers above the limit wait in FIFO order.
+    """
+
+    def __init__(self, initial: float = 8, min_limit: float = 1, max_limit: float = 64, backoff: float = 0.7,
+                 tolerance: float = 1.5, smoothing: float = 0.2, baseline_window: float = 60.0):
+        self.limit = float(initial)
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.baseline_window = baseline_window
+        self.in_flight = 0
+        self.baseline_latency = 0.0
+        self.avg_latency = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.decreases = 0
+        self._last_decrease = 0.0
+        self._last_release = time.monotonic()
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < max(1, math.floor(self.limit))
+
+    async def acquire(self) -> None:
+        if self._has_capacity() and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.in_flight -= 1  # slot was handed over just before cancellation
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def cancel(self) -> None:
+        """Return a slot without feeding a measurement back, e.g. when the caller's deadline ran out."""
+        self.in_flight -= 1
+        self._wake()
+
+    def release(self, latency: float, failed: bool = False) -> None:
+        """Return a slot and feed the call's latency and outcome into the limit."""
+        self.in_flight -= 1
+        self.requests += 1
+        now = time.monotonic()
+        elapsed, self._last_release = now - self._last_release, now
+        if failed:
+            self.failures += 1
+        else:
+            if not self.baseline_latency or latency < self.baseline_latency:
+                self.baseline_latency = latency
+            self.avg_latency = latency if not self.avg_latency else (
+                self.avg_latency + self.smoothing * (latency - self.avg_latency))
+            drift = min(1.0, elapsed / self.baseline_window)
+            self.baseline_latency += drift * (self.avg_latency - self.baseline_latency)
+
+        if failed or self.avg_latency > self.tolerance * self.baseline_latency:
+            if now - self._last_decrease >= self.avg_latency:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self.decreases += 1
+                self._last_decrease = now
+        elif self.in_flight + 1 >= self.limit / 2:  # only grow when the limit is actually being used
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": round(self.limit, 2),
+            "inFlight": self.in_flight,
+            "queued": self.queued,
+            "baselineLatencyMs": round(self.baseline_latency * 1000, 2),
+            "avgLatencyMs": round(self.avg_latency * 1000, 2),
+            "requests": self.requests,
+            "failures": self.failures,
+            "limitDecreases": self.decreases,
+        }
+
+
+class LimiterRegistry:
+    """Lazily created ``AdaptiveLimiter`` per (chain, endpoint)."""
+
+    def __init__(self, **limiter_options):
+        self.limiter_options = limiter_options
+        self._limiters: Dict[Tuple[int, str], AdaptiveLimiter] = {}
+
+    def get(self, chain: int, endpoint: str) -> AdaptiveLimiter:
+        key = (chain, endpoint)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = self._limiters[key] = AdaptiveLimiter(**self.limiter_options)
+        return limiter
+
+    def snapshot(self) -> List[dict]:
+        return [
+            dict(chain=chain, endpoint=endpoint, **limiter.snapshot())
+            for (chain, endpoint), limiter in sorted(self._limiters.items())
+        ]
@@ -0,0 +1,187 @@
+"""Pool of upstream API keys with per-key quota accounting and hot reload."""
+
+import os
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional
+
+import httpx
+
+from inch_mcp_server.utils.logger_setup import setup_logger
+
+logger = setup_logger("api.credentials")
+
+_REMAINING_HEADERS = ("x-ratelimit-remaining", "ratelimit-remaining")
+_RESET_HEADERS = ("x-ratelimit-reset", "ratelimit-reset")
+
+
+def parse_keys(text: Optional[str]) -> List[str]:
+    """Split a comma- or newline-separated key list, dropping blanks and ``#`` comments."""
+    keys = []
+    for line in (text or "").replace(",", "\n").splitlines():
+        key = line.split("#", 1)[0].strip()
+        if key and key not in keys:
+            keys.append(key)
+    return keys
+
+
+def _seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds until a ``Retry-After``/reset header value: delta seconds, epoch seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    # Large values are absolute epoch timestamps rather than deltas
+    return max(0.0, number - time.time()) if number > 1e9 else max(0.0, number)
+
+
+class Credential:
+    """One API key with its in-flight count and the quota reported by upstream."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.rejected = 0
+        self.remaining: Optional[int] = None
+        self.cooldown_until = 0.0
+
+    @property
+    def label(self) -> str:
+        return "…" + self.key[-4:]
+
+    def healthy(self, now: float) -> bool:
+        return now >= self.cooldown_until
+
+    def snapshot(self, now: float) -> dict:
+        return {
+            "key": self.label,
+            "inFlight": self.in_flight,
+            "requests": self.requests,
+            "remaining": self.remaining,
+            "throttled": self.throttled,
+            "rejected": self.rejected,
+            "cooldownSeconds": round(max(0.0, self.cooldown_until - now), 2),
+        }
+
+
+class CredentialPool:
+    """Spreads upstream requests over several API keys.
+
+    Each request goes to the healthy key with the fewest requests in flight,
+    preferring the one with the most remaining quota. ``X-RateLimit-Remaining``
+    and ``X-RateLimit-Reset`` headers update a key's quota; a 429 parks the key
+    until ``Retry-After`` (or ``cooldown`` seconds) and a 401/403 parks it for
+    ``rejected_cooldown``. When every key is parked the one freed soonest is used.
+
+    Keys come from ``keys`` and, when ``keys_file`` is set, from that file
+    (one per line or comma-separated). The file is re-read when its mtime
+    changes, checked at most every ``reload_interval`` seconds, so keys can be
+    added or revoked without a restart; surviving keys keep their accounting.
+    """
+
+    def __init__(self, keys: Iterable[str] = (), keys_file: Optional[str] = None, reload_interval: float = 5.0,
+                 cooldown: float = 1.0, rejected_cooldown: float = 300.0):
+        self.keys_file = keys_file
+        self.reload_interval = reload_interval
+        self.cooldown = cooldown
+        self.rejected_cooldown = rejected_cooldown
+        self._static_keys = [key for key in keys if key]
+        self._credentials: Dict[str, Credential] = {}
+        self._file_mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self.set_keys(self._static_keys + self._read_file())
+
+    def __len__(self) -> int:
+        return len(self._credentials)
+
+    def set_keys(self, keys: Iterable[str]) -> None:
+        """Replace the key set, keeping the accounting of keys that stay."""
+        keys = list(dict.fromkeys(keys))
+        added = [key for key in keys if key not in self._credentials]
+        removed = [key for key in self._credentials if key not in keys]
+        self._credentials = {key: self._credentials.get(key) or Credential(key) for key in keys}
+        if added or removed:
+            logger.info("API key pool now holds {} keys ({} added, {} removed)".format(
+                len(self._credentials), len(added), len(removed)))
+
+    def _read_file(self) -> List[str]:
+        if not self.keys_file:
+            return []
+        try:
+            self._file_mtime = os.stat(self.keys_file).st_mtime
+            with open(self.keys_file) as f:
+                return parse_keys(f.read())
+        except OSError as e:
+            logger.warning("Could not read API keys from {}: {}".format(self.keys_file, e))
+            return []
+
+    def maybe_reload(self, now: float) -> None:
+        if not self.keys_file or now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+        try:
+            mtime = os.stat(self.keys_file).st_mtime
+        except OSError:
+            return
+        if mtime != self._file_mtime:
+            keys = self._read_file()
+            if keys or self._static_keys:
+                self.set_keys(self._static_keys + keys)
+
+    def has_healthy(self, now: float = None) -> bool:
+        now = time.monotonic() if now is None else now
+        return any(credential.healthy(now) for credential in self._credentials.values())
+
+    def acquire(self) -> Optional[Credential]:
+        """Pick the key for the next request, or None when the pool is empty."""
+        now = time.monotonic()
+        self.maybe_reload(now)
+        if not self._credentials:
+            return None
+        healthy = [credential for credential in self._credentials.values() if credential.healthy(now)]
+        if healthy:
+            credential = min(
+                healthy, key=lambda c: (c.in_flight, -(c.remaining if c.remaining is not None else 1 << 30))
+            )
+        else:
+            credential = min(self._credentials.values(), key=lambda c: c.cooldown_until)
+        credential.in_flight += 1
+        credential.requests += 1
+        return credential
+
+    def release(self, credential: Optional[Credential], response: Optional[httpx.Response]) -> None:
+        """Return a key and record the quota and throttling reported in ``response``."""
+        if credential is None:
+            return
+        credential.in_flight -= 1
+        if response is None:
+            return
+        now = time.monotonic()
+        headers = response.headers
+        remaining = next((headers[name] for name in _REMAINING_HEADERS if name in headers), None)
+        if remaining is not None and remaining.isdigit():
+            credential.remaining = int(remaining)
+            if credential.remaining == 0:
+                reset = _seconds(next((headers[name] for name in _RESET_HEADERS if name in headers), None))
+                credential.cooldown_until = max(credential.cooldown_until, now + (reset or self.cooldown))
+        if response.status_code == 429:
+            credential.throttled += 1
+            wait = _seconds(headers.get("retry-after"))
+            wait = wait if wait is not None else self.cooldown
+            credential.cooldown_until = max(credential.cooldown_until, now + wait)
+            logger.info("API key {} throttled for {:.1f}s".format(credential.label, credential.cooldown_until - now))
+        elif response.status_code in (401, 403):
+            credential.rejected += 1
+            credential.cooldown_until = now + self.rejected_cooldown
+            logger.warning("API key {} was rejected with {}".format(credential.label, response.status_code))
+
+    def snapshot(self) -> List[dict]:
+        now = time.monotonic()
+        return [credential.snapshot(now) for credential in self._credentials.values()]
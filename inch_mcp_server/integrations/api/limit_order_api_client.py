@@ -1,61 +1,136 @@
 import os
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional
 
 import httpx
 from starlette.exceptions import HTTPException
 
+from inch_mcp_server.config import settings
+from inch_mcp_server.integrations.api.concurrency import LimiterRegistry
+from inch_mcp_server.integrations.api.credentials import CredentialPool, parse_keys
+from inch_mcp_server.integrations.api.pools import UpstreamPool
+from inch_mcp_server.utils.deadline import DeadlineExceeded, remaining, within_deadline
+
 
 class LimitOrderAPIClient:
-    def __init__(self):
-        self.base_url = "https://api.1inch.dev/orderbook/v4.0/"
-        self.api_key = os.getenv("INCH_API_KEY")
-        self._client = httpx.AsyncClient(base_url=self.base_url)
-        self.headers = {"Accepts": "application/json", "Authorization": self.api_key}
+    def __init__(self, base_url: str = None, limiters: LimiterRegistry = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None, credentials: CredentialPool = None):
+        self.base_url = (base_url or settings.inch_api_base_url).rstrip("/") + "/"
+        self.transport = transport
+        self._pools: Dict[str, UpstreamPool] = {}
+        self.headers = {"Accepts": "application/json"}
+        self.credentials = credentials or CredentialPool(
+            [os.getenv("INCH_API_KEY"), *parse_keys(settings.inch_api_keys)],
+            keys_file=settings.inch_api_keys_file,
+            reload_interval=settings.credential_reload_seconds,
+            cooldown=settings.credential_cooldown_seconds,
+        )
+        self.limiters = limiters or LimiterRegistry(
+            initial=settings.upstream_initial_concurrency,
+            min_limit=settings.upstream_min_concurrency,
+            max_limit=settings.upstream_max_concurrency,
+            tolerance=settings.upstream_latency_tolerance,
+        )
 
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(base_url=self.base_url)
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        if self._client:
-            await self._client.aclose()
+        await self.aclose()
 
-    async def get_orders_by_address(self, chain: int, address: str):
-        if not self._client:
-            self._client = httpx.AsyncClient(base_url=self.base_url)
-        endpoint = f"{chain}/address/{address}"
-        params = {"page": 1, "limit": 100, "statuses": "1,2,3"}
-        url = f"{self.base_url}{endpoint}"
-        response = await self._client.get(url, params=params, headers=self.headers)
+    async def aclose(self) -> None:
+        for pool in self._pools.values():
+            await pool.aclose()
+        self._pools.clear()
+
+    def pool_for(self, chain: int) -> UpstreamPool:
+        """Return the connection pool serving ``chain``, creating it from Settings on first use."""
+        name = settings.upstream_pool_chains.get(chain) or f"chain-{chain}"
+        pool = self._pools.get(name)
+        if pool is None:
+            config = settings.upstream_pools.get(name, settings.upstream_pool_default)
+            pool = self._pools[name] = UpstreamPool(name, config, self.base_url, self.transport)
+        return pool
+
+    def pool_snapshot(self) -> List[dict]:
+        return [pool.snapshot() for _, pool in sorted(self._pools.items())]
+
+    async def _send(self, method: str, chain: int, endpoint: str, path: str, retry_throttled: bool = True,
+                    **kwargs) -> httpx.Response:
+        """Send a request within the adaptive concurrency limit of ``(chain, endpoint)`` on the chain's pool.
+
+        Each request is signed with a key from the credential pool; a 429 is retried once on
+        another key while one has quota left. 5xx responses,
+        transport errors and 429s once no API key has quota left count as congestion signals. Under a
+        deadline, waiting for a slot, the httpx timeouts and the whole call are capped by
+        the time left, and running out raises ``DeadlineExceeded``.
+        """
+        pool = self.pool_for(chain)
+        limiter = self.limiters.get(chain, endpoint)
+        await within_deadline(limiter.acquire())
+        left = remaining()
+        if left is not None:
+            if left <= 0:
+                limiter.cancel()
+                raise DeadlineExceeded(f"Deadline exceeded before calling {endpoint} for chain {chain}")
+            kwargs["timeout"] = httpx.Timeout(min(pool.config.timeout, left), pool=min(pool.config.pool_timeout, left))
+        credential = self.credentials.acquire()
+        headers = self.headers if credential is None else {**self.headers, "Authorization": credential.key}
+        started = time.monotonic()
+        try:
+            response = await within_deadline(
+                pool.request(method, f"{self.base_url}{path}", headers=headers, **kwargs)
+            )
+        except (httpx.TimeoutException, DeadlineExceeded):
+            self.credentials.release(credential, None)
+            if left is not None and left < pool.config.timeout:
+                # Our own budget ran out, which says nothing about upstream congestion
+                limiter.cancel()
+                raise DeadlineExceeded(f"Deadline exceeded calling {endpoint} for chain {chain}")
+            limiter.release(time.monotonic() - started, failed=True)
+            raise
+        except BaseException:
+            self.credentials.release(credential, None)
+            limiter.release(time.monotonic() - started, failed=True)
+            raise
+        self.credentials.release(credential, response)
+        # A 429 on one key is that key's quota, not congestion, while other keys can still take traffic
+        throttled = response.status_code == 429 and not self.credentials.has_healthy()
+        limiter.release(time.monotonic() - started, throttled or response.status_code >= 500)
+        if response.status_code == 429 and retry_throttled and not throttled and len(self.credentials) > 1:
+            return await self._send(method, chain, endpoint, path, retry_throttled=False, **kwargs)
+        return response
+
+    async def _request(self, method: str, chain: int, endpoint: str, path: str, error: str, **kwargs):
+        response = await self._send(method, chain, endpoint, path, **kwargs)
         if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=f"Error fetching orders: {response.text}")
+            raise HTTPException(status_code=response.status_code, detail=f"{error}: {response.text}")
         return response.json()
 
+    async def get_orders_by_address(self, chain: int, address: str):
+        params = {"page": 1, "limit": 100, "statuses": "1,2,3"}
+        return await self._request("GET", chain, "address", f"{chain}/address/{address}", "Error fetching orders",
+                                   params=params)
+
+    async def get_orders_by_pair(self, chain: int, maker_asset: str, taker_asset: str, page: int = 1,
+                                 limit: int = 100, statuses: List[int] = None):
+        params = {
+            "page": page,
+            "limit": limit,
+            "statuses": ",".join(map(str, statuses or [1])),
+            "makerAsset": maker_asset,
+            "takerAsset": taker_asset,
+        }
+        return await self._request("GET", chain, "all", f"{chain}/all", "Error fetching orders by pair", params=params)
+
     async def get_fee_info(self, chain: int, params: dict):
-        if not self._client:
-            self._client = httpx.AsyncClient(base_url=self.base_url)
-        endpoint = f"{chain}/fee-info"
-        url = f"{self.base_url}{endpoint}"
-        response = await self._client.get(url, params=params, headers=self.headers)
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=f"Error fetching fee: {response.text}")
-        return response.json()
+        return await self._request("GET", chain, "fee-info", f"{chain}/fee-info", "Error fetching fee", params=params)
 
     async def get_order_by_hash(self, chain: int, order_hash: str):
-        if not self._client:
-            self._client = httpx.AsyncClient(base_url=self.base_url)
-        endpoint = f"{chain}/order/{order_hash}"
-        url = f"{self.base_url}{endpoint}"
-        response = await self._client.get(url, headers=self.headers)
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=f"Error fetching order: {response.text}")
-        return response.json()
+        return await self._request("GET", chain, "order", f"{chain}/order/{order_hash}", "Error fetching order")
 
     async def post_order(self, chain: int, data: Dict[str, Any]):
-        if not self._client:
-            self._client = httpx.AsyncClient(base_url=self.base_url)
-        endpoint = f"{chain}"
-        response = await self._client.post(endpoint, json=data, headers=self.headers)
+        response = await self._send("POST", chain, "post", f"{chain}", json=data)
         if response.status_code not in (200, 201):
             raise HTTPException(
                 status_code=response.status_code, detail=f"Error posting order: {response.json().get("message")}"
@@ -63,9 +138,6 @@ class LimitOrderAPIClient:
         return response
 
     async def get_orders_count(self, chain: int, statuses: List[int], taker_asset: str = None, maker_asset: str = None):
-        if not self._client:
-            self._client = httpx.AsyncClient(base_url=self.base_url)
-        endpoint = f"{chain}/count"
         params = {}
         if statuses:
             params["statuses"] = ','.join(map(str, statuses))
@@ -76,19 +148,9 @@ class LimitOrderAPIClient:
         if maker_asset:
             params["makerAsset"] = maker_asset
 
-        url = f"{self.base_url}{endpoint}"
-        response = await self._client.get(url, params=params, headers=self.headers)
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=f"Error fetching order count: {response.text}")
-        return response.json()
+        return await self._request("GET", chain, "count", f"{chain}/count", "Error fetching order count", params=params)
 
     async def get_unique_active_pairs(self, chain: int = 1, page: int = 1, limit: int = 100):
-        if not self._client:
-            self._client = httpx.AsyncClient(base_url=self.base_url)
-        endpoint = f"{chain}/unique-active-pairs"
         params = {"page": page, "limit": limit}
-        url = f"{self.base_url}{endpoint}"
-        response = await self._client.get(url, params=params, headers=self.headers)
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=f"Error fetching unique active pairs: {response.text}")
-        return response.json()
+        return await self._request("GET", chain, "unique-active-pairs", f"{chain}/unique-active-pairs",
+                                   "Error fetching unique active pairs", params=params)
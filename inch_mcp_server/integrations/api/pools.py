@@ -0,0 +1,66 @@
+"""Connection pools isolated per chain or priority class."""
+
+from typing import Optional
+
+import httpx
+
+from inch_mcp_server.config import PoolConfig
+
+
+class UpstreamPool:
+    """One ``httpx.AsyncClient`` with its own connection limit, timeouts and saturation counters.
+
+    Giving each chain (or group of chains) a separate pool means a degraded
+    chain can only exhaust its own connections and time out within its own
+    budget, while requests for other chains keep getting connections.
+    """
+
+    def __init__(self, name: str, config: PoolConfig, base_url: str,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.name = name
+        self.config = config
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+            ),
+            timeout=httpx.Timeout(config.timeout, pool=config.pool_timeout),
+            transport=transport,
+        )
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+        self.timeouts = 0
+        self.pool_timeouts = 0
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.requests += 1
+        try:
+            return await self.client.request(method, url, **kwargs)
+        except httpx.PoolTimeout:
+            self.pool_timeouts += 1
+            raise
+        except httpx.TimeoutException:
+            self.timeouts += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    def snapshot(self) -> dict:
+        """Pool counters; ``saturation`` above 1 means requests are waiting for a connection."""
+        return {
+            "pool": self.name,
+            "maxConnections": self.config.max_connections,
+            "inFlight": self.in_flight,
+            "peakInFlight": self.peak_in_flight,
+            "saturation": round(self.in_flight / self.config.max_connections, 3),
+            "requests": self.requests,
+            "timeouts": self.timeouts,
+            "poolTimeouts": self.pool_timeouts,
+        }
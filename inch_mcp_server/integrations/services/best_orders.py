@@ -0,0 +1,178 @@
+"""Per-pair sorted index of active orders for top-k best order queries."""
+
+import asyncio
+import time
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from inch_mcp_server.core.models import BestOrdersResponse
+from inch_mcp_server.core.order_batch import OrderBatch, OrderView
+from inch_mcp_server.integrations.api.limit_order_api_client import LimitOrderAPIClient
+from inch_mcp_server.utils.logger_setup import setup_logger
+from inch_mcp_server.utils.ttl_cache import TTLCache
+
+logger = setup_logger("services.best_orders")
+
+PAGE_LIMIT = 100
+
+PairKey = Tuple[int, str, str]
+
+
+def _price(order: dict) -> Optional[float]:
+    """Taker asset paid per maker asset unit (the order's ``makerRate``), or None for inactive orders."""
+    if order.get("orderInvalidReason") is not None or int(order["remainingMakerAmount"]) <= 0:
+        return None
+    making = int(order["data"]["makingAmount"])
+    if making <= 0:
+        return None
+    return int(order["data"]["takingAmount"]) / making
+
+
+class PairBook:
+    """Active orders of one pair kept sorted by price, cheapest first.
+
+    Orders live in an ``OrderBatch``; ``_keys`` is a sorted list of
+    ``(price, row)`` so the best ``k`` are a slice and an upsert or removal is
+    a binary search plus one list shift. Removed rows stay in the batch as
+    tombstones until they outnumber the live ones, then the batch is compacted.
+    """
+
+    __slots__ = ("batch", "_keys", "_prices", "loaded_at")
+
+    def __init__(self, orders: Iterable[dict] = ()):
+        self.batch = OrderBatch()
+        self._keys: List[Tuple[float, int]] = []
+        self._prices: Dict[int, float] = {}
+        self.loaded_at = time.monotonic()
+        for order in orders:
+            self.upsert(order)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.loaded_at
+
+    def upsert(self, order: dict) -> None:
+        """Insert or replace an order; inactive orders are dropped from the book."""
+        self.discard(order["orderHash"])
+        price = _price(order)
+        if price is None:
+            return
+        row = self.batch.append(order)
+        self._prices[row] = price
+        insort(self._keys, (price, row))
+
+    def discard(self, order_hash: str) -> bool:
+        """Remove an order by hash, returning whether it was in the book."""
+        row = self.batch.index_of(order_hash)
+        price = self._prices.pop(row, None) if row is not None else None
+        if price is None:
+            return False
+        del self._keys[bisect_left(self._keys, (price, row))]
+        if len(self.batch) > 64 and len(self.batch) > 2 * len(self._keys):
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        live = [self.batch[row].to_dict() for _, row in self._keys]
+        self.batch = OrderBatch()
+        self._keys, self._prices = [], {}
+        for order in live:
+            self.upsert(order)
+
+    def top(self, k: int) -> List[OrderView]:
+        return [self.batch[row] for _, row in self._keys[:k]]
+
+
+class BestOrdersIndex:
+    """Sorted books of active orders per chain and pair, kept current incrementally.
+
+    A book is loaded from ``/all`` on first use and reloaded after ``ttl``.
+    In between, orders seen by address syncs and hash lookups are upserted into
+    loaded books and orders that disappear are removed, so queries return the
+    top ``k`` as a slice without rescanning or refetching.
+    """
+
+    def __init__(self, api_client: LimitOrderAPIClient, ttl: float = 60.0, max_orders: int = 2000,
+                 max_pairs: int = 512):
+        self.api_client = api_client
+        self.max_orders = max_orders
+        self._books: TTLCache[PairBook] = TTLCache(maxsize=max_pairs, ttl=ttl)
+        self._loads: Dict[PairKey, asyncio.Task] = {}
+
+    @staticmethod
+    def _key(chain: int, maker_asset: str, taker_asset: str) -> PairKey:
+        return chain, maker_asset.lower(), taker_asset.lower()
+
+    async def _load(self, chain: int, maker_asset: str, taker_asset: str) -> PairBook:
+        started = time.monotonic()
+        orders = []
+        page = 1
+        while len(orders) < self.max_orders:
+            batch = await self.api_client.get_orders_by_pair(chain, maker_asset, taker_asset, page, PAGE_LIMIT)
+            orders.extend(batch)
+            if len(batch) < PAGE_LIMIT:
+                break
+            page += 1
+        book = PairBook(orders[:self.max_orders])
+        logger.info("Loaded best orders book for chain {} pair {}/{}: {} active of {} orders in {:.2f}s".format(
+            chain, maker_asset, taker_asset, len(book), len(orders), time.monotonic() - started))
+        return book
+
+    async def get_book(self, chain: int, maker_asset: str, taker_asset: str) -> PairBook:
+        """Return the pair's book, loading it at most once per TTL."""
+        key = self._key(chain, maker_asset, taker_asset)
+        book = self._books.get(key)
+        if book is not None:
+            return book
+        task = self._loads.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(*key))
+            self._loads[key] = task
+            task.add_done_callback(lambda _: self._loads.pop(key, None))
+        book = await asyncio.shield(task)
+        if self._books.get(key) is None:
+            self._books.set(key, book)
+        return book
+
+    def load(self, chain: int, maker_asset: str, taker_asset: str, orders: List[dict]) -> None:
+        """Replace a pair's book with a complete set of its active orders fetched elsewhere."""
+        self._books.set(self._key(chain, maker_asset, taker_asset), PairBook(orders))
+
+    def apply(self, chain: int, orders: Iterable[dict]) -> int:
+        """Upsert synced orders into books that are already loaded; returns how many were applied."""
+        applied = 0
+        for order in orders:
+            book = self._books.get(self._key(chain, order["data"]["makerAsset"], order["data"]["takerAsset"]))
+            if book is not None:
+                book.upsert(order)
+                applied += 1
+        return applied
+
+    def discard(self, chain: int, order_hashes: Iterable[str]) -> int:
+        """Remove orders that are no longer active from every loaded book of the chain."""
+        hashes = list(order_hashes)
+        removed = 0
+        for (book_chain, _, _), book in self._books.items():
+            if book_chain == chain:
+                removed += sum(book.discard(order_hash) for order_hash in hashes)
+        return removed
+
+    async def best(self, chain: int, maker_asset: str, taker_asset: str, k: int) -> BestOrdersResponse:
+        """Return the ``k`` cheapest active orders selling ``maker_asset`` for ``taker_asset``.
+
+        Raises:
+            ValueError: If ``k`` is not positive
+        """
+        if k <= 0:
+            raise ValueError("k must be a positive integer")
+        book = await self.get_book(chain, maker_asset, taker_asset)
+        return BestOrdersResponse(
+            makerAsset=maker_asset.lower(),
+            takerAsset=taker_asset.lower(),
+            activeOrders=len(book),
+            indexAgeSeconds=round(book.age, 3),
+            orders=[view.to_model() for view in book.top(k)],
+        )
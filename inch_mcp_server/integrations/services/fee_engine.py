@@ -0,0 +1,130 @@
+"""Local fee computation backed by cached ``/fee-info`` parameters."""
+
+import asyncio
+from typing import Dict, List, Tuple
+
+from inch_mcp_server.core.models import FeeAmounts, FeeExtension, FeeInfoDTO, FeeQuote, FeeQuotesResponse
+from inch_mcp_server.integrations.api.limit_order_api_client import LimitOrderAPIClient
+from inch_mcp_server.utils.logger_setup import setup_logger
+from inch_mcp_server.utils.ttl_cache import TTLCache
+
+logger = setup_logger("services.fee_engine")
+
+BPS_BASE = 10_000
+
+FeeKey = Tuple[int, str, str]
+
+
+def compute_fee_quote(fee_info: FeeInfoDTO, amounts: FeeAmounts) -> FeeQuote:
+    """Compute fee amounts for one order size from pair fee parameters.
+
+    The fee is charged on the taking side and rounded up, as the protocol does
+    when it adds the fee to the taking amount. Whitelisted resolvers get
+    ``whitelistDiscountPercent`` off the base rate.
+    """
+    whitelisted_bps = fee_info.feeBps * (100 - fee_info.whitelistDiscountPercent) / 100
+    return FeeQuote(
+        makerAmount=amounts.makerAmount,
+        takerAmount=amounts.takerAmount,
+        feeBps=fee_info.feeBps,
+        feeAmount=-(-amounts.takerAmount * fee_info.feeBps // BPS_BASE),
+        whitelistedFeeBps=whitelisted_bps,
+        whitelistedFeeAmount=-(-amounts.takerAmount * fee_info.feeBps * (100 - fee_info.whitelistDiscountPercent)
+                               // (BPS_BASE * 100)),
+    )
+
+
+class _FeeEntry:
+    __slots__ = ("fee_info", "hits")
+
+    def __init__(self, fee_info: FeeInfoDTO):
+        self.fee_info = fee_info
+        self.hits = 0
+
+
+class FeeEngine:
+    """Caches fee parameters per chain and pair and quotes arbitrary amounts locally.
+
+    ``feeBps``, the whitelist, the discount and the extension address do not
+    depend on order size, so one upstream call serves every amount for a pair
+    until the entry expires. Every ``verify_every``-th cache hit re-fetches the
+    parameters in the background with the caller's amounts; a mismatch replaces
+    the entry so changes upstream are picked up before the TTL runs out.
+    """
+
+    def __init__(self, api_client: LimitOrderAPIClient, ttl: float = 300.0, verify_every: int = 50,
+                 maxsize: int = 10_000):
+        self.api_client = api_client
+        self.verify_every = verify_every
+        self._entries: TTLCache[_FeeEntry] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._fetches: Dict[FeeKey, asyncio.Task] = {}
+        self._verifications: Dict[FeeKey, asyncio.Task] = {}
+
+    @staticmethod
+    def _key(chain: int, fee_extension: FeeExtension) -> FeeKey:
+        return chain, fee_extension.makerAsset.lower(), fee_extension.takerAsset.lower()
+
+    async def _fetch(self, chain: int, fee_extension: FeeExtension) -> FeeInfoDTO:
+        fee_info = await self.api_client.get_fee_info(chain, fee_extension.model_dump(mode="json"))
+        return FeeInfoDTO(**fee_info)
+
+    async def get_fee_info(self, chain: int, fee_extension: FeeExtension) -> FeeInfoDTO:
+        """Return fee parameters for the pair, fetching them at most once per TTL."""
+        key = self._key(chain, fee_extension)
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.hits += 1
+            if self.verify_every and entry.hits % self.verify_every == 0:
+                self._start_verification(key, chain, fee_extension)
+            return entry.fee_info
+
+        task = self._fetches.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(chain, fee_extension))
+            self._fetches[key] = task
+            task.add_done_callback(lambda _: self._fetches.pop(key, None))
+        fee_info = await asyncio.shield(task)
+        if self._entries.get(key) is None:
+            self._entries.set(key, _FeeEntry(fee_info))
+        return fee_info
+
+    def _start_verification(self, key: FeeKey, chain: int, fee_extension: FeeExtension) -> None:
+        if key in self._verifications:
+            return
+        task = asyncio.create_task(self._verify(key, chain, fee_extension))
+        self._verifications[key] = task
+        task.add_done_callback(lambda _: self._verifications.pop(key, None))
+
+    async def _verify(self, key: FeeKey, chain: int, fee_extension: FeeExtension) -> None:
+        try:
+            fresh = await self._fetch(chain, fee_extension)
+        except Exception as e:
+            logger.warning("Fee parameter verification failed for {}: {}".format(key, e))
+            return
+        entry = self._entries.get(key)
+        if entry is not None and entry.fee_info != fresh:
+            logger.info("Fee parameters changed for {}: {} -> {}".format(key, entry.fee_info, fresh))
+            self._entries.set(key, _FeeEntry(fresh))
+
+    def invalidate(self, chain: int, maker_asset: str, taker_asset: str) -> None:
+        """Drop cached parameters for a pair."""
+        self._entries.pop((chain, maker_asset.lower(), taker_asset.lower()))
+
+    async def quote(self, chain: int, maker_asset: str, taker_asset: str,
+                    amounts: List[FeeAmounts]) -> FeeQuotesResponse:
+        """Quote fees for many order sizes of one pair with at most one upstream call."""
+        if not amounts:
+            raise ValueError("At least one amount pair is required")
+        fee_extension = FeeExtension(
+            makerAsset=maker_asset,
+            takerAsset=taker_asset,
+            makerAmount=amounts[0].makerAmount,
+            takerAmount=amounts[0].takerAmount,
+        )
+        fee_info = await self.get_fee_info(chain, fee_extension)
+        return FeeQuotesResponse(
+            makerAsset=maker_asset,
+            takerAsset=taker_asset,
+            feeInfo=fee_info,
+            quotes=[compute_fee_quote(fee_info, item) for item in amounts],
+        )
@@ -1,102 +1,533 @@
-from typing import List
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 from uuid import uuid4
 
 from fastapi_async_sqlalchemy import db
-from sqlalchemy import delete, select
+from sqlalchemy import ARRAY, String, all_, any_, bindparam, delete, insert, select, update
+from starlette.exceptions import HTTPException
 
-from inch_mcp_server.database import LimitOrder
+from inch_mcp_server.config import settings
+from inch_mcp_server.database import LimitOrder, require_writable_schema, schema_writable
+from inch_mcp_server.utils import validate_evm_address
+from inch_mcp_server.utils.deadline import DeadlineExceeded, within_deadline
 from inch_mcp_server.utils.logger_setup import setup_logger
-from inch_mcp_server.core.models import FeeExtension, FeeInfoDTO, GetLimitOrdersV4Response, PostLimitOrderV4Request, LimitOrderV4Response, GetLimitOrdersCountV4Response, GetActiveUniquePairsResponse
+from inch_mcp_server.core.models import BulkOrderResult, BulkPostOrdersResponse, FeeAmounts, FeeExtension, GetLimitOrdersV4Response, PostLimitOrderV4Request, LimitOrderV4Response, LimitOrderV4Status, GetLimitOrdersCountV4Response, GetActiveUniquePairsResponse, TokenPairFilter, OrdersPage, PaginationMeta, TokenPair
 from inch_mcp_server.integrations.api.limit_order_api_client import LimitOrderAPIClient
+from inch_mcp_server.integrations.services.best_orders import BestOrdersIndex
+from inch_mcp_server.integrations.services.fee_engine import FeeEngine
+from inch_mcp_server.integrations.services.order_cache import OrderCache
+from inch_mcp_server.integrations.services.order_counter import OrderCounter
+from inch_mcp_server.integrations.services.order_verifier import OrderVerifier
+from inch_mcp_server.integrations.services.order_watcher import OrderWatcher
+from inch_mcp_server.integrations.services.orderbook_depth import compute_orderbook_depth
+from inch_mcp_server.integrations.services.pair_index import PairIndex
+from inch_mcp_server.integrations.services.snapshots import SnapshotStore
+from inch_mcp_server.integrations.services.write_behind import INSERT, UPDATE_STATUS, WriteBehindQueue
 
 logger = setup_logger("services")
 
+PAIR_PAGE_LIMIT = 100
+
 
 class LimitOrderService:
     """Service for handling limit order operations using the 1inch API client."""
     
-    def __init__(self, api_client: LimitOrderAPIClient):
+    def __init__(self, api_client: LimitOrderAPIClient, pair_index: PairIndex = None, fee_engine: FeeEngine = None,
+                 order_cache: OrderCache = None, best_orders: BestOrdersIndex = None,
+                 order_counter: OrderCounter = None, snapshots: SnapshotStore = None,
+                 order_watcher: OrderWatcher = None, order_verifier: OrderVerifier = None,
+                 write_behind: WriteBehindQueue = None):
         """Initialize the service with an API client.
         
         Args:
             api_client: LimitOrderAPIClient instance (injected dependency).
+            pair_index: Shared PairIndex instance; a private one is created if omitted.
+            fee_engine: Shared FeeEngine instance; a private one is created if omitted.
+            order_cache: Shared OrderCache instance; a private in-memory one is created if omitted.
+            best_orders: Shared BestOrdersIndex instance; a private one is created if omitted.
+            order_counter: Shared OrderCounter instance; a private one is created if omitted.
+            snapshots: Shared SnapshotStore for pagination cursors; a private one is created if omitted.
+            order_watcher: Shared OrderWatcher polling subscribed orders; a private one is created if omitted.
+            order_verifier: Shared OrderVerifier checking order hashes before posting; a default one is created if omitted.
+            write_behind: Shared WriteBehindQueue for ``limit_orders`` writes; writes go to the database inline if omitted.
         """
         self.api_client = api_client
+        self.pair_index = pair_index or PairIndex(api_client)
+        self.fee_engine = fee_engine or FeeEngine(api_client)
+        self.order_cache = order_cache or OrderCache()
+        self.best_orders = best_orders or BestOrdersIndex(api_client)
+        self.order_counter = order_counter or OrderCounter(api_client)
+        self.snapshots = snapshots or SnapshotStore()
+        self.order_watcher = order_watcher or OrderWatcher(api_client, self.order_cache)
+        self.order_verifier = order_verifier or OrderVerifier()
+        self.write_behind = write_behind
 
     async def fetch_and_store_orders(self, chain: int, address: str):
-        """Fetch orders from API and synchronize with database."""
-        orders = await self.api_client.get_orders_by_address(chain, address)
-        orders = [GetLimitOrdersV4Response(**order) for order in orders]
+        """Fetch orders from API and synchronize with database.
+
+        Only order hashes are read back and the database does the set difference:
+        one query returns which fetched hashes are stored, and stored hashes that
+        upstream no longer lists are streamed through a server-side cursor and
+        deleted ``ORDER_SYNC_BATCH_SIZE`` at a time, so memory does not grow with
+        the account's history.
+        """
+        raw_orders = await self.api_client.get_orders_by_address(chain, address)
+        orders = [GetLimitOrdersV4Response(**order) for order in raw_orders]
+        self.best_orders.apply(chain, raw_orders)
         logger.info("Fetched {} orders".format(len(orders)))
-        retrieved_hashes = {order.orderHash for order in orders}
-        logger.info("retrieved from api: {}".format(retrieved_hashes))
-        query = select(LimitOrder).where((LimitOrder.blockchain_id == chain) & (LimitOrder.address == address.lower()))
-        result = (await db.session.scalars(query)).all()
-        stored_hashes = {order.order_hash for order in result}
-        logger.info("retrieved from db: {}".format(stored_hashes))
-        hashes_to_delete = list(stored_hashes - retrieved_hashes)
-        hashes_to_return = list(retrieved_hashes & stored_hashes)
-        logger.info("created: {}".format(hashes_to_return))
-        logger.info("outdated: {}".format(hashes_to_delete))
-        if hashes_to_delete:
-            await db.session.execute(delete(LimitOrder).where(LimitOrder.order_hash.in_(hashes_to_delete)))
+        retrieved_hashes = [order.orderHash for order in orders]
+        dialect = db.session.get_bind().dialect.name
+        owned = (LimitOrder.blockchain_id == chain) & (LimitOrder.address == address.lower())
+
+        query = select(LimitOrder.order_hash).where(owned & self._order_hash_in(dialect, retrieved_hashes))
+        stored_hashes = set((await within_deadline(db.session.scalars(query))).all())
+        outdated = 0
+        if self.write_behind is not None:
+            # Orders posted or removed moments ago may still be waiting in the write-behind queue
+            stored_hashes = self.write_behind.overlay_hashes(chain, address, stored_hashes)
+            outdated += await self._delete_stored_orders(chain, list(stored_hashes.difference(retrieved_hashes)))
+            stored_hashes.intersection_update(retrieved_hashes)
+
+        if not schema_writable():
+            # Read-only while the schema is being migrated: report matches, leave outdated rows for a later sync
+            logger.info("Synced {} orders of {}: {} stored (read-only)".format(len(orders), address, len(stored_hashes)))
+            return [order for order in orders if order.orderHash in stored_hashes]
+
+        batch_size = settings.order_sync_batch_size
+        query = (
+            select(LimitOrder.order_hash)
+            .where(owned & self._order_hash_in(dialect, retrieved_hashes, matching=False))
+            .execution_options(yield_per=batch_size)
+        )
+        result = await within_deadline(db.session.stream_scalars(query))
+        try:
+            while batch := await within_deadline(result.fetchmany(batch_size)):
+                outdated += await self._delete_stored_orders(chain, batch)
+        finally:
+            await result.close()
+        if outdated and self.write_behind is None:
             await db.session.commit()
-        orders = [order for order in orders if order.orderHash in hashes_to_return]
-        return orders
+
+        logger.info("Synced {} orders of {}: {} stored, {} outdated".format(
+            len(orders), address, len(stored_hashes), outdated))
+        return [order for order in orders if order.orderHash in stored_hashes]
+
+    @staticmethod
+    def _order_hash_in(dialect: str, order_hashes: List[str], matching: bool = True):
+        """``order_hash`` (not) among ``order_hashes``; one array parameter on Postgres instead of one per hash."""
+        if dialect == "postgresql":
+            hashes = bindparam("order_hashes", order_hashes, type_=ARRAY(String))
+            return LimitOrder.order_hash == any_(hashes) if matching else LimitOrder.order_hash != all_(hashes)
+        return LimitOrder.order_hash.in_(order_hashes) if matching else LimitOrder.order_hash.not_in(order_hashes)
+
+    async def _delete_stored_orders(self, chain: int, order_hashes: List[str]) -> int:
+        """Delete stored orders (queued when write-behind is on; the caller commits otherwise)."""
+        if not order_hashes:
+            return 0
+        self.best_orders.discard(chain, order_hashes)
+        if self.write_behind is not None:
+            await self.write_behind.delete(chain, order_hashes)
+        else:
+            await within_deadline(db.session.execute(
+                delete(LimitOrder).where((LimitOrder.blockchain_id == chain) & LimitOrder.order_hash.in_(order_hashes))
+            ))
+        return len(order_hashes)
+
+    async def fetch_orders_page(self, chain: int, address: str, limit: int, cursor: str = None) -> OrdersPage:
+        """Page through an address's orders with continuation cursors.
+
+        The first call syncs orders as ``fetch_and_store_orders`` does and, when the
+        result spans more than one page, keeps it newest first in a short-lived
+        snapshot; calls with ``cursor`` are served from that snapshot without
+        touching upstream or the database.
+        """
+        query = ("orders", chain, address.lower())
+        if cursor:
+            snapshot_id, offset = self.snapshots.resolve(cursor, query)
+            items, next_cursor, total = self.snapshots.page(snapshot_id, offset, limit)
+        else:
+            orders = await self.fetch_and_store_orders(chain, address)
+            orders.sort(key=lambda order: (order.createDateTime, order.orderHash), reverse=True)
+            items, next_cursor, total = self.snapshots.first_page(query, orders, 0, limit)
+        return OrdersPage(items=items, totalItems=total, nextCursor=next_cursor)
 
     async def retrieve_order_fee(self, chain: int, fee_extension: FeeExtension):
-        """Retrieve fee information for a limit order."""
-        fee_info = await self.api_client.get_fee_info(chain, fee_extension.model_dump(mode="json"))
-        fee_info = FeeInfoDTO(**fee_info)
+        """Retrieve fee information for a limit order (cached per chain and pair)."""
+        fee_info = await self.fee_engine.get_fee_info(chain, fee_extension)
         logger.info("for {} and fee ext {} got fee info {}".format(chain, fee_extension, fee_info))
         return fee_info
 
-    async def fetch_order_by_hash(self, chain: int, order_hash: str):
-        """Fetch a specific order by its hash."""
+    async def quote_order_fees(self, chain: int, maker_asset: str, taker_asset: str, amounts: List[FeeAmounts]):
+        """Compute fees locally for many order sizes of one pair."""
+        quotes = await self.fee_engine.quote(chain, maker_asset, taker_asset, amounts)
+        logger.info("Quoted {} fee amounts for chain {} pair {}/{}".format(len(amounts), chain, maker_asset, taker_asset))
+        return quotes
+
+    async def fetch_order_by_hash(self, chain: int, order_hash: str, refresh_status: bool = False):
+        """Fetch a specific order by its hash.
+
+        An order whose parts are both in memory with a fresh status is returned
+        straight away. Orders we hold in ``limit_orders`` are served from the database
+        while their stored status is younger than ``order_status_max_age_seconds``.
+        Otherwise the immutable part of an order is cached permanently and its status
+        for a short TTL, so repeat lookups either cost nothing or only refresh the status.
+
+        Args:
+            chain: Blockchain chain ID
+            order_hash: Order hash to look up
+            refresh_status: Always merge in live status from upstream; it is written back only to orders we hold
+        """
         try:
-            raw_order = await self.api_client.get_order_by_hash(chain, order_hash)
-            logger.info("Raw API response for hash {}: {}".format(order_hash, raw_order))
-            order = LimitOrderV4Response.model_validate(raw_order)
-            logger.info("Successfully validated order with hash: {}".format(order_hash))
+            if not refresh_status:
+                # The in-memory status is at most order_status_ttl_seconds old, fresher than any stored one
+                order = self.order_cache.get_fresh(chain, order_hash)
+                if order is not None:
+                    return order
+
+            stored = None
+            # A queued write makes the stored row stale (or about to exist), so skip it and ask upstream
+            pending = self.write_behind.last_operation(chain, order_hash) if self.write_behind is not None else None
+            if pending is None:
+                # Read even when refreshing: the row decides whether the new status is written back
+                stored, order = await self._read_stored_order(chain, order_hash)
+                if order is not None and not refresh_status:
+                    logger.info("Served order with hash {} from database".format(order_hash))
+                    return order
+
+            immutable = await self.order_cache.get_immutable(chain, order_hash)
+            if immutable is not None:
+                status = None if refresh_status else self.order_cache.get_status(chain, order_hash)
+                if status is None:
+                    raw_order = await self.api_client.get_order_by_hash(chain, order_hash)
+                    status = LimitOrderV4Status.model_validate(raw_order)
+                    self.order_cache.put_status(chain, order_hash, status)
+                    logger.info("Refreshed status for cached order with hash: {}".format(order_hash))
+                order = self.order_cache.compose(immutable, status)
+            else:
+                raw_order = await self.api_client.get_order_by_hash(chain, order_hash)
+                logger.info("Raw API response for hash {}: {}".format(order_hash, raw_order))
+                order = LimitOrderV4Response.model_validate(raw_order)
+                logger.info("Successfully validated order with hash: {}".format(order_hash))
+                await self.order_cache.put_order(chain, order)
+
+            # Only orders we hold (or are about to) get their status written back
+            if stored is not None or pending in (INSERT, UPDATE_STATUS):
+                await self._store_order_status(chain, order)
+            self.best_orders.apply(chain, [order.model_dump(mode="json", exclude={"id"})])
             return order
         except Exception as e:
             logger.error("Failed to fetch/validate order with hash {}: {}".format(order_hash, str(e)))
             raise
 
+    async def _read_stored_order(self, chain: int, order_hash: str):
+        """Look an order up in ``limit_orders`` by hash.
+
+        Returns:
+            tuple: (stored row or None, response built from it if its status is fresh enough, else None)
+        """
+        try:
+            query = (
+                select(LimitOrder)
+                .where((LimitOrder.blockchain_id == chain) & (LimitOrder.order_hash == order_hash))
+                .limit(1)
+            )
+            row = (await within_deadline(db.session.scalars(query))).first()
+        except Exception as e:
+            # Upstream can still answer; a database outage must not break lookups
+            logger.warning("Database lookup for order {} failed: {}".format(order_hash, e))
+            return None, None
+        if row is None or row.status is None or row.status_updated_at is None:
+            return row, None
+        updated_at = row.status_updated_at
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        age = (datetime.now(timezone.utc) - updated_at).total_seconds()
+        if age > settings.order_status_max_age_seconds:
+            return row, None
+        order = LimitOrderV4Response.model_validate({**row.status, **row.data})
+        return row, order
+
+    async def _store_order_status(self, chain: int, order: LimitOrderV4Response) -> None:
+        """Write the latest non-immutable fields back to stored rows of this order."""
+        if not schema_writable():
+            return
+        status = order.model_dump(mode="json", exclude={"orderHash", "signature", "data", "id"})
+        updated_at = datetime.now(timezone.utc)
+        try:
+            if self.write_behind is not None:
+                await self.write_behind.update_status(chain, order.orderHash, status, updated_at)
+                return
+            await within_deadline(db.session.execute(
+                update(LimitOrder)
+                .where((LimitOrder.blockchain_id == chain) & (LimitOrder.order_hash == order.orderHash))
+                .values(status=status, status_updated_at=updated_at)
+            ))
+            await db.session.commit()
+        except Exception as e:
+            logger.warning("Failed to store status for order {}: {}".format(order.orderHash, e))
+            if self.write_behind is None:
+                await db.session.rollback()
+
     async def post_order(self, chain: int, order_data: PostLimitOrderV4Request):
-        """Post a new limit order."""
+        """Post a new limit order after verifying its hash locally.
+
+        The upstream response gains ``persisted``, false when the order was accepted
+        upstream but could not be stored (or queued for storing) here.
+
+        Raises:
+            OrderVerificationError: If ``orderHash`` (or the signer, when enabled) does not match the order data
+            SchemaNotReady: If the database schema is being migrated and the order could not be stored
+        """
+        require_writable_schema()
+        self.order_verifier.verify(chain, order_data)
         logger.info("posting for {} order {}".format(chain, order_data))
         response = await self.api_client.post_order(chain, order_data.model_dump(mode="json"))
-        entry = LimitOrder(
-            id=uuid4(),
-            blockchain_id=chain,
-            address=order_data.data.maker.lower(),
-            order_hash=order_data.orderHash,
-            data=order_data.model_dump(mode="json"),
-        )
+        row = {
+            "id": uuid4(),
+            "blockchain_id": chain,
+            "address": order_data.data.maker.lower(),
+            "order_hash": order_data.orderHash,
+            "data": order_data.model_dump(mode="json"),
+        }
         logger.info("storing to db for {} with {} order {}".format(chain, order_data.orderHash, order_data))
-        db.session.add(entry)
-        await db.session.commit()
-        return response.json()
+        persisted = True
+        try:
+            if self.write_behind is not None:
+                await self.write_behind.insert([row])
+            else:
+                db.session.add(LimitOrder(**row))
+                await db.session.commit()
+        except Exception as e:
+            # The order is live upstream either way, e.g. when the write-behind queue stays full past the deadline
+            logger.error("Failed to store posted order {} for chain {}: {}".format(order_data.orderHash, chain, e))
+            if self.write_behind is None:
+                await db.session.rollback()
+            persisted = False
+        result = response.json()
+        if isinstance(result, dict):
+            result["persisted"] = persisted
+        return result
+
+    async def post_orders(self, chain: int, orders: List[PostLimitOrderV4Request]) -> BulkPostOrdersResponse:
+        """Post many signed orders and store the accepted ones with a single batched insert.
+
+        Orders are verified locally first; the rest are posted with at most
+        ``BULK_POST_CONCURRENCY`` in flight, on top of the upstream adaptive limiter
+        and API key pool. A failed post does not affect the others, and the result
+        of every order is reported in input order.
+
+        Raises:
+            ValueError: If the batch is empty or larger than ``BULK_POST_MAX_ORDERS``
+            SchemaNotReady: If the database schema is being migrated and orders could not be stored
+        """
+        require_writable_schema()
+        if not orders:
+            raise ValueError("orders must be a non-empty list")
+        if len(orders) > settings.bulk_post_max_orders:
+            raise ValueError("Bulk submission is limited to {} orders, got {}".format(
+                settings.bulk_post_max_orders, len(orders)))
+
+        started = time.monotonic()
+        results: List[Optional[BulkOrderResult]] = [None] * len(orders)
+        seen = set()
+        for index, error in enumerate(self.order_verifier.verify_many(chain, orders)):
+            order_hash = orders[index].orderHash.lower()
+            if error is None and order_hash in seen:
+                error = "duplicate of an earlier order in this batch"
+            seen.add(order_hash)
+            if error is not None:
+                results[index] = BulkOrderResult(orderHash=orders[index].orderHash, status="rejected",
+                                                 error=error)
+
+        semaphore = asyncio.Semaphore(settings.bulk_post_concurrency)
+
+        async def post(index: int) -> None:
+            order = orders[index]
+            async with semaphore:
+                try:
+                    await self.api_client.post_order(chain, order.model_dump(mode="json"))
+                except HTTPException as e:
+                    retryable = e.status_code == 429 or e.status_code >= 500
+                    results[index] = BulkOrderResult(
+                        orderHash=order.orderHash, status="failed" if retryable else "rejected",
+                        statusCode=e.status_code, error=e.detail,
+                    )
+                    return
+                except Exception as e:
+                    results[index] = BulkOrderResult(
+                        orderHash=order.orderHash, status="failed", error=str(e) or type(e).__name__
+                    )
+                    return
+            results[index] = BulkOrderResult(orderHash=order.orderHash, status="accepted")
+
+        await asyncio.gather(*(post(index) for index, result in enumerate(results) if result is None))
+
+        accepted = [orders[index] for index, result in enumerate(results) if result.status == "accepted"]
+        persisted = True
+        if accepted:
+            rows = [
+                {
+                    "id": uuid4(),
+                    "blockchain_id": chain,
+                    "address": order.data.maker.lower(),
+                    "order_hash": order.orderHash,
+                    "data": order.model_dump(mode="json"),
+                }
+                for order in accepted
+            ]
+            try:
+                if self.write_behind is not None:
+                    await self.write_behind.insert(rows)
+                else:
+                    await db.session.execute(insert(LimitOrder), rows)
+                    await db.session.commit()
+            except Exception as e:
+                # The orders are live upstream either way; report them as accepted
+                logger.error("Failed to store {} posted orders for chain {}: {}".format(len(rows), chain, e))
+                if self.write_behind is None:
+                    await db.session.rollback()
+                persisted = False
+
+        counts = {
+            status: sum(1 for result in results if result.status == status)
+            for status in ("accepted", "rejected", "failed")
+        }
+        logger.info("Bulk posted {} orders for chain {} in {:.2f}s: {}".format(
+            len(orders), chain, time.monotonic() - started, counts))
+        return BulkPostOrdersResponse(persisted=persisted, results=results, **counts)
 
     async def fetch_orders_count(self, chain: int, statuses: List[int], taker_asset: str = None, maker_asset: str = None):
-        """Fetch count of orders matching specified criteria."""
+        """Fetch count of orders matching specified criteria (cached briefly per filter combination)."""
         try:
-            count_response = await self.api_client.get_orders_count(chain, statuses, taker_asset, maker_asset)
-            logger.info("Fetched order count for chain {}, statuses {}: {}".format(chain, statuses, count_response))
-            count_data = GetLimitOrdersCountV4Response.model_validate(count_response)
-            return count_data
+            count = await self.order_counter.count(chain, statuses, taker_asset, maker_asset)
+            logger.info("Fetched order count for chain {}, statuses {}: {}".format(chain, statuses, count))
+            return GetLimitOrdersCountV4Response(count=count)
         except Exception as e:
             logger.error("Failed to fetch order count for chain {}, statuses {}: {}".format(chain, statuses, str(e)))
             raise
 
-    async def fetch_unique_active_pairs(self, chain: int = 1, page: int = 1, limit: int = 100):
-        """Fetch unique active trading pairs."""
+    async def fetch_orders_count_matrix(self, chain: int, pairs: List[TokenPairFilter], status_sets: List[List[int]]):
+        """Count orders for every combination of asset pair filters and status sets in one call.
+
+        Raises:
+            ValueError: If pairs or status sets are empty or invalid, or there are more than ``ORDER_COUNT_MAX_CELLS`` cells
+        """
+        if not pairs or not status_sets:
+            raise ValueError("pairs and statusSets must both be non-empty")
+        if any(not statuses or any(status not in [1, 2, 3] for status in statuses) for statuses in status_sets):
+            raise ValueError("Each status set must be a non-empty list of integers (1, 2, or 3)")
+        for pair in pairs:
+            validate_evm_address(pair.makerAsset, "makerAsset", required=False)
+            validate_evm_address(pair.takerAsset, "takerAsset", required=False)
+        if len(pairs) * len(status_sets) > settings.order_count_max_cells:
+            raise ValueError("Count matrix is limited to {} cells, got {}".format(
+                settings.order_count_max_cells, len(pairs) * len(status_sets)))
+        return await self.order_counter.count_matrix(chain, pairs, status_sets)
+
+    async def fetch_unique_active_pairs(self, chain: int = 1, page: int = 1, limit: int = 100, cursor: str = None):
+        """Fetch unique active trading pairs.
+
+        Pages are cut from a snapshot of the cached pair index in stable order rather
+        than forwarded upstream. The response carries ``nextCursor``; passing it back
+        continues from the same snapshot, in which case ``page`` is ignored.
+        """
+        query = ("pairs", chain)
         try:
-            pairs_response = await self.api_client.get_unique_active_pairs(chain, page, limit)
-            logger.info("Fetched unique active pairs for chain {}, page {}, limit {}: {}".format(chain, page, limit, pairs_response))
-            pairs_data = GetActiveUniquePairsResponse.model_validate(pairs_response)
-            return pairs_data
+            if cursor:
+                snapshot_id, offset = self.snapshots.resolve(cursor, query)
+                items, next_cursor, total = self.snapshots.page(snapshot_id, offset, limit)
+            else:
+                index = await self.pair_index.get(chain)
+                offset = (page - 1) * limit
+                items, next_cursor, total = self.snapshots.first_page(query, index.sorted_pairs(), offset, limit)
+            logger.info("Served unique active pairs for chain {}, offset {}, limit {}: {} of {}".format(
+                chain, offset, limit, len(items), total))
+            return GetActiveUniquePairsResponse(
+                items=[TokenPair(makerAsset=maker, takerAsset=taker) for maker, taker in items],
+                meta=PaginationMeta(
+                    totalItems=total,
+                    currentPage=offset // limit + 1,
+                    itemsPerPage=limit,
+                    totalPages=(total + limit - 1) // limit,
+                ),
+                nextCursor=next_cursor,
+            )
         except Exception as e:
             logger.error("Failed to fetch unique active pairs for chain {}, page {}, limit {}: {}".format(chain, page, limit, str(e)))
             raise
+
+    async def search_token_pairs(self, chain: int, token: str):
+        """Find every active pair that trades against a token, using the cached pair index."""
+        index = await self.pair_index.get(chain)
+        token = token.lower()
+        return {
+            "token": token,
+            "asMakerAsset": index.takers_for(token),
+            "asTakerAsset": index.makers_for(token),
+            "indexedPairs": index.pair_count,
+            "indexAgeSeconds": round(index.age, 3),
+        }
+
+    async def fetch_active_orders_by_pair(self, chain: int, maker_asset: str, taker_asset: str,
+                                          max_orders: int = 1000) -> List[dict]:
+        """Fetch raw active orders selling ``maker_asset`` for ``taker_asset``, up to ``max_orders``."""
+        orders, _ = await self._fetch_active_orders_by_pair(chain, maker_asset, taker_asset, max_orders)
+        return orders
+
+    async def _fetch_active_orders_by_pair(self, chain: int, maker_asset: str, taker_asset: str,
+                                           max_orders: int = 1000) -> Tuple[List[dict], bool]:
+        """Page through active orders of one direction, stopping early at the deadline.
+
+        Returns:
+            tuple: (orders fetched so far, whether paging finished before the deadline)
+        """
+        orders = []
+        page = 1
+        complete = True
+        while len(orders) < max_orders:
+            try:
+                batch = await self.api_client.get_orders_by_pair(chain, maker_asset, taker_asset, page, PAIR_PAGE_LIMIT)
+            except DeadlineExceeded:
+                logger.warning("Deadline reached after {} pages of pair {}/{} on chain {}".format(
+                    page - 1, maker_asset, taker_asset, chain))
+                complete = False
+                break
+            orders.extend(batch)
+            if len(batch) < PAIR_PAGE_LIMIT:
+                break
+            page += 1
+        logger.info("Fetched {} active orders for chain {} pair {}/{}".format(len(orders), chain, maker_asset, taker_asset))
+        return orders[:max_orders], complete
+
+    async def get_orderbook_depth(self, chain: int, base_asset: str, quote_asset: str, top_k: int = 10,
+                                  max_orders: int = 1000, base_decimals: int = 0, quote_decimals: int = 0,
+                                  precision: int = 6):
+        """Aggregate both directions of a pair into best rates and cumulative depth levels.
+
+        When the deadline cuts paging short the depth is built from the pages
+        fetched so far and marked ``partial``.
+        """
+        (asks, asks_complete), (bids, bids_complete) = await asyncio.gather(
+            self._fetch_active_orders_by_pair(chain, base_asset, quote_asset, max_orders),
+            self._fetch_active_orders_by_pair(chain, quote_asset, base_asset, max_orders),
+        )
+        # A side shorter than max_orders is the pair's complete book; reuse it for best-order queries
+        if asks_complete and len(asks) < max_orders:
+            self.best_orders.load(chain, base_asset, quote_asset, asks)
+        if bids_complete and len(bids) < max_orders:
+            self.best_orders.load(chain, quote_asset, base_asset, bids)
+        depth = compute_orderbook_depth(
+            base_asset.lower(), quote_asset.lower(), asks, bids,
+            base_decimals=base_decimals, quote_decimals=quote_decimals, top_k=top_k, precision=precision,
+        )
+        depth.partial = not (asks_complete and bids_complete)
+        return depth
+
+    async def get_best_orders(self, chain: int, maker_asset: str, taker_asset: str, k: int = 10):
+        """Return the ``k`` cheapest active orders selling ``maker_asset`` for ``taker_asset``."""
+        best = await self.best_orders.best(chain, maker_asset, taker_asset, k)
+        logger.info("Selected {} best of {} active orders for chain {} pair {}/{}".format(
+            len(best.orders), best.activeOrders, chain, maker_asset, taker_asset))
+        return best
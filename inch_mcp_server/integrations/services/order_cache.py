@@ -0,0 +1,149 @@
+"""Split cache for orders by hash: permanent immutable part, short-lived status."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+from inch_mcp_server.core.models import LimitOrderV4Data, LimitOrderV4Response, LimitOrderV4Status
+from inch_mcp_server.utils.logger_setup import setup_logger
+from inch_mcp_server.utils.ttl_cache import TTLCache
+
+logger = setup_logger("services.order_cache")
+
+IMMUTABLE_FIELDS = ("signature", "orderHash", "createDateTime", "data", "makerRate", "takerRate", "isMakerContract")
+
+OrderKey = Tuple[int, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS immutable_orders (
+    chain INTEGER NOT NULL,
+    order_hash TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (chain, order_hash)
+) WITHOUT ROWID
+"""
+
+
+class ImmutableOrderStore:
+    """SQLite file holding the never-changing part of orders so it survives restarts.
+
+    The file (and its directory) is only created when the store is first used,
+    so building the service at import time does not touch the filesystem.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, chain: int, order_hash: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT payload FROM immutable_orders WHERE chain = ? AND order_hash = ?", (chain, order_hash)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, chain: int, order_hash: str, payload: dict) -> None:
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR IGNORE INTO immutable_orders (chain, order_hash, payload) VALUES (?, ?, ?)",
+                (chain, order_hash, json.dumps(payload, separators=(",", ":"))),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class OrderCache:
+    """Cache for ``fetch_order_by_hash`` split along what can change.
+
+    The signature, order data, rates and creation time never change once an
+    order exists, so they are kept forever: hot entries in memory, everything
+    in an on-disk SQLite store. Only ``LimitOrderV4Status`` fields are cached
+    with a short TTL; once it lapses a refresh only parses and stores those
+    fields instead of re-validating the whole payload.
+    """
+
+    def __init__(self, path: str = ":memory:", status_ttl: float = 5.0, memory_size: int = 10_000):
+        self.store = ImmutableOrderStore(path)
+        self._immutable: TTLCache[dict] = TTLCache(maxsize=memory_size, ttl=float("inf"))
+        self._status: TTLCache[LimitOrderV4Status] = TTLCache(maxsize=memory_size, ttl=status_ttl)
+
+    @staticmethod
+    def _key(chain: int, order_hash: str) -> OrderKey:
+        return chain, order_hash.lower()
+
+    async def get_immutable(self, chain: int, order_hash: str) -> Optional[dict]:
+        """Return the immutable fields (with ``data`` as a model) or None if never seen."""
+        key = self._key(chain, order_hash)
+        immutable = self._immutable.get(key)
+        if immutable is None:
+            payload = await asyncio.to_thread(self.store.get, *key)
+            if payload is None:
+                return None
+            payload["data"] = LimitOrderV4Data.model_validate(payload["data"])
+            immutable = payload
+            self._immutable.set(key, immutable)
+        return immutable
+
+    def get_fresh(self, chain: int, order_hash: str) -> Optional[LimitOrderV4Response]:
+        """Return the order if both its parts are in memory and its status is still fresh, without any I/O."""
+        key = self._key(chain, order_hash)
+        immutable = self._immutable.get(key)
+        if immutable is None:
+            return None
+        status = self._status.get(key)
+        return None if status is None else self.compose(immutable, status)
+
+    def get_status(self, chain: int, order_hash: str) -> Optional[LimitOrderV4Status]:
+        """Return the cached status if it is still fresh."""
+        return self._status.get(self._key(chain, order_hash))
+
+    def put_status(self, chain: int, order_hash: str, status: LimitOrderV4Status) -> None:
+        self._status.set(self._key(chain, order_hash), status)
+
+    async def put_order(self, chain: int, order: LimitOrderV4Response) -> None:
+        """Store a freshly validated order: immutable part permanently, status with TTL."""
+        key = self._key(chain, order.orderHash)
+        immutable = {field: getattr(order, field) for field in IMMUTABLE_FIELDS}
+        self._immutable.set(key, immutable)
+        self.put_status(chain, order.orderHash, LimitOrderV4Status.model_construct(
+            remainingMakerAmount=order.remainingMakerAmount,
+            makerBalance=order.makerBalance,
+            makerAllowance=order.makerAllowance,
+            orderInvalidReason=order.orderInvalidReason,
+        ))
+        payload = dict(immutable, data=order.data.model_dump(mode="json"))
+        await asyncio.to_thread(self.store.put, *key, payload)
+
+    @staticmethod
+    def compose(immutable: dict, status: LimitOrderV4Status) -> LimitOrderV4Response:
+        """Assemble a response from already validated parts without re-validating them."""
+        return LimitOrderV4Response.model_construct(
+            **immutable,
+            remainingMakerAmount=status.remainingMakerAmount,
+            makerBalance=status.makerBalance,
+            makerAllowance=status.makerAllowance,
+            orderInvalidReason=status.orderInvalidReason,
+            id=None,
+        )
+
+    def close(self) -> None:
+        self.store.close()
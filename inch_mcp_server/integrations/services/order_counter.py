@@ -0,0 +1,104 @@
+"""Cached, deduplicated and concurrency-limited order counts."""
+
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from inch_mcp_server.core.models import GetLimitOrdersCountV4Response, OrderCountMatrixResponse, OrderCountRow, TokenPairFilter
+from inch_mcp_server.integrations.api.limit_order_api_client import LimitOrderAPIClient
+from inch_mcp_server.utils.deadline import DeadlineExceeded, within_deadline
+from inch_mcp_server.utils.logger_setup import setup_logger
+from inch_mcp_server.utils.ttl_cache import TTLCache
+
+logger = setup_logger("services.order_counter")
+
+CountKey = Tuple[int, Tuple[int, ...], Optional[str], Optional[str]]
+
+
+class OrderCounter:
+    """Answers ``/count`` queries through a short-lived cache.
+
+    Identical queries are normalized (sorted statuses, lowercase assets) so
+    they share one cache entry and one in-flight request, and at most
+    ``concurrency`` upstream calls run at a time across all callers, which
+    keeps large matrices inside the API rate budget.
+    """
+
+    def __init__(self, api_client: LimitOrderAPIClient, ttl: float = 10.0, concurrency: int = 8,
+                 maxsize: int = 10_000):
+        self.api_client = api_client
+        self._counts: TTLCache[int] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._fetches: Dict[CountKey, asyncio.Task] = {}
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    @staticmethod
+    def _key(chain: int, statuses: Iterable[int], taker_asset: str = None, maker_asset: str = None) -> CountKey:
+        return (
+            chain,
+            tuple(sorted(set(statuses))),
+            taker_asset.lower() if taker_asset else None,
+            maker_asset.lower() if maker_asset else None,
+        )
+
+    async def _fetch(self, key: CountKey) -> int:
+        chain, statuses, taker_asset, maker_asset = key
+        async with self._semaphore:
+            response = await self.api_client.get_orders_count(chain, list(statuses), taker_asset, maker_asset)
+        count = GetLimitOrdersCountV4Response.model_validate(response).count
+        self._counts.set(key, count)
+        return count
+
+    async def count(self, chain: int, statuses: Iterable[int], taker_asset: str = None,
+                    maker_asset: str = None) -> int:
+        """Return the number of orders matching the filters, from cache when fresh."""
+        key = self._key(chain, statuses, taker_asset, maker_asset)
+        count = self._counts.get(key)
+        if count is not None:
+            return count
+        task = self._fetches.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key))
+            self._fetches[key] = task
+            task.add_done_callback(lambda _: self._fetches.pop(key, None))
+        return await within_deadline(asyncio.shield(task))
+
+    async def count_matrix(self, chain: int, pairs: List[TokenPairFilter],
+                           status_sets: List[List[int]]) -> OrderCountMatrixResponse:
+        """Count every (pair, status set) combination with one upstream call per distinct query.
+
+        A failed cell is returned as ``None`` with its error listed, so one bad
+        combination does not discard the rest of the table. Cells still missing
+        when the deadline passes are returned the same way and mark the table ``partial``.
+        """
+        started = time.monotonic()
+        cells = [
+            [self._key(chain, statuses, pair.takerAsset, pair.makerAsset) for statuses in status_sets]
+            for pair in pairs
+        ]
+        unique = list(dict.fromkeys(key for row in cells for key in row))
+        results = await asyncio.gather(*(self.count(*key) for key in unique), return_exceptions=True)
+        by_key = dict(zip(unique, results))
+
+        rows, errors = [], {}
+        partial = any(isinstance(result, DeadlineExceeded) for result in results)
+        for pair, row in zip(pairs, cells):
+            counts = []
+            for key in row:
+                result = by_key[key]
+                if isinstance(result, Exception):
+                    errors[key] = str(result)
+                    counts.append(None)
+                else:
+                    counts.append(result)
+            rows.append(OrderCountRow(makerAsset=pair.makerAsset, takerAsset=pair.takerAsset, counts=counts))
+
+        logger.info("Counted {} cells ({} distinct queries) for chain {} in {:.2f}s".format(
+            len(pairs) * len(status_sets), len(unique), chain, time.monotonic() - started))
+        return OrderCountMatrixResponse(
+            statusSets=[list(statuses) for statuses in status_sets],
+            rows=rows,
+            distinctQueries=len(unique),
+            partial=partial,
+            errors=["statuses={} takerAsset={} makerAsset={}: {}".format(key[1], key[2], key[3], error)
+                    for key, error in errors.items()],
+        )
@@ -0,0 +1,183 @@
+"""Local EIP-712 verification of limit order v4 hashes and signatures."""
+
+from typing import Dict, List, Optional, Sequence
+
+from inch_mcp_server.core.models import LimitOrderV4Data, PostLimitOrderV4Request
+from inch_mcp_server.utils.keccak import keccak256, keccak256_many
+from inch_mcp_server.utils.logger_setup import setup_logger
+from inch_mcp_server.utils.secp256k1 import recover_address
+
+logger = setup_logger("services.order_verifier")
+
+DOMAIN_NAME = "1inch Aggregation Router"
+DOMAIN_VERSION = "6"
+ROUTER_ADDRESS = "0x111111125421ca6dc452d289314280a0f8842a65"
+
+DOMAIN_TYPEHASH = keccak256(b"EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+ORDER_TYPEHASH = keccak256(
+    b"Order(uint256 salt,address maker,address receiver,address makerAsset,address takerAsset,"
+    b"uint256 makingAmount,uint256 takingAmount,uint256 makerTraits)"
+)
+
+HAS_EXTENSION_FLAG = 1 << 249
+_UINT160_MASK = (1 << 160) - 1
+
+
+class OrderVerificationError(ValueError):
+    """Raised when an order's hash, extension or signature does not match its data."""
+
+
+def domain_separator(name: str, version: str, chain_id: int, verifying_contract: str) -> bytes:
+    """EIP-712 domain separator for ``EIP712Domain(name, version, chainId, verifyingContract)``."""
+    return keccak256(
+        DOMAIN_TYPEHASH
+        + keccak256(name.encode())
+        + keccak256(version.encode())
+        + chain_id.to_bytes(32, "big")
+        + _address(verifying_contract, "verifyingContract").to_bytes(32, "big")
+    )
+
+
+def _uint(value: Optional[str], field: str) -> int:
+    """Parse a decimal or ``0x`` hex uint256 string; empty values are zero."""
+    if value is None or value in ("", "0x"):
+        return 0
+    try:
+        number = int(value, 16) if value.startswith(("0x", "0X")) else int(value)
+    except (TypeError, ValueError):
+        raise OrderVerificationError("{} is not an integer: {!r}".format(field, value))
+    if not 0 <= number < 1 << 256:
+        raise OrderVerificationError("{} is out of uint256 range".format(field))
+    return number
+
+
+def _address(value: Optional[str], field: str) -> int:
+    if value is None:
+        return 0
+    if len(value) != 42 or not value.startswith(("0x", "0X")):
+        raise OrderVerificationError("{} is not a 20-byte address: {!r}".format(field, value))
+    try:
+        return int(value[2:], 16)
+    except ValueError:
+        raise OrderVerificationError("{} is not a hex address: {!r}".format(field, value))
+
+
+def _bytes(value: Optional[str], field: str) -> bytes:
+    if not value:
+        return b""
+    try:
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    except ValueError:
+        raise OrderVerificationError("{} is not hex bytes".format(field))
+
+
+def encode_order(data: LimitOrderV4Data) -> bytes:
+    """ABI-encode ``typeHash || Order`` fields, the preimage of the order's EIP-712 struct hash."""
+    words = (
+        _uint(data.salt, "salt"),
+        _address(data.maker, "maker"),
+        _address(data.receiver, "receiver"),
+        _address(data.makerAsset, "makerAsset"),
+        _address(data.takerAsset, "takerAsset"),
+        _uint(data.makingAmount, "makingAmount"),
+        _uint(data.takingAmount, "takingAmount"),
+        _uint(data.makerTraits, "makerTraits"),
+    )
+    return ORDER_TYPEHASH + b"".join(word.to_bytes(32, "big") for word in words)
+
+
+class OrderVerifier:
+    """Recomputes limit order v4 hashes locally so malformed orders never reach upstream.
+
+    The hash is ``keccak256(0x1901 || domainSeparator(chain) || keccak256(typeHash || order))``
+    with the 1inch Aggregation Router v6 domain; separators are computed once per
+    chain. ``verify_many`` hashes a whole batch through ``keccak256_many``, which
+    permutes equally sized messages together. Besides the hash, the extension is
+    checked against the salt as the protocol does on fill, and with
+    ``check_signature`` the signer recovered from ``signature`` must be the maker
+    (leave it off when makers may be contracts signing via EIP-1271).
+    """
+
+    def __init__(self, router_address: str = ROUTER_ADDRESS, router_addresses: Dict[int, str] = None,
+                 check_signature: bool = False):
+        self.router_address = router_address
+        self.router_addresses = router_addresses or {}
+        self.check_signature = check_signature
+        self._separators: Dict[int, bytes] = {}
+
+    def domain_separator(self, chain: int) -> bytes:
+        separator = self._separators.get(chain)
+        if separator is None:
+            contract = self.router_addresses.get(chain, self.router_address)
+            separator = self._separators[chain] = domain_separator(DOMAIN_NAME, DOMAIN_VERSION, chain, contract)
+        return separator
+
+    def order_hash(self, chain: int, data: LimitOrderV4Data) -> str:
+        """Return the ``0x``-prefixed EIP-712 hash of an order on ``chain``."""
+        struct_hash = keccak256(encode_order(data))
+        return "0x" + keccak256(b"\x19\x01" + self.domain_separator(chain) + struct_hash).hex()
+
+    @staticmethod
+    def _check_extension(data: LimitOrderV4Data, extension_hash: Optional[bytes]) -> Optional[str]:
+        has_flag = bool(_uint(data.makerTraits, "makerTraits") & HAS_EXTENSION_FLAG)
+        if extension_hash is None:
+            return "makerTraits has the extension flag but the order has no extension" if has_flag else None
+        if not has_flag:
+            return "order has an extension but makerTraits lacks the extension flag"
+        if int.from_bytes(extension_hash, "big") & _UINT160_MASK != _uint(data.salt, "salt") & _UINT160_MASK:
+            return "salt does not commit to the extension hash"
+        return None
+
+    def verify_many(self, chain: int, orders: Sequence[PostLimitOrderV4Request],
+                    check_signature: bool = None) -> List[Optional[str]]:
+        """Verify a batch of orders for ``chain``.
+
+        Returns:
+            list: One entry per order, None if it is valid or the reason it was rejected
+        """
+        check_signature = self.check_signature if check_signature is None else check_signature
+        errors: List[Optional[str]] = [None] * len(orders)
+        encoded: Dict[int, bytes] = {}
+        extensions: Dict[int, bytes] = {}
+        for index, order in enumerate(orders):
+            try:
+                encoded[index] = encode_order(order.data)
+                extension = _bytes(order.data.extension, "extension")
+                if extension:
+                    extensions[index] = extension
+            except OrderVerificationError as e:
+                errors[index] = str(e)
+
+        separator = self.domain_separator(chain)
+        indexes = list(encoded)
+        struct_hashes = keccak256_many([encoded[i] for i in indexes])
+        digests = dict(zip(indexes, keccak256_many([b"\x19\x01" + separator + h for h in struct_hashes])))
+        extension_hashes = dict(zip(extensions, keccak256_many(list(extensions.values()))))
+
+        for index in indexes:
+            order = orders[index]
+            digest = digests[index]
+            if "0x" + digest.hex() != order.orderHash.lower():
+                errors[index] = "orderHash does not match the order data (expected 0x{})".format(digest.hex())
+                continue
+            errors[index] = self._check_extension(order.data, extension_hashes.get(index))
+            if errors[index] is None and check_signature:
+                try:
+                    signer = recover_address(digest, order.signature)
+                except ValueError as e:
+                    errors[index] = "invalid signature: {}".format(e)
+                    continue
+                if signer != order.data.maker.lower():
+                    errors[index] = "signature was made by {}, not the maker".format(signer)
+        return errors
+
+    def verify(self, chain: int, order: PostLimitOrderV4Request, check_signature: bool = None) -> None:
+        """Verify one order.
+
+        Raises:
+            OrderVerificationError: If the hash, extension or signature does not match
+        """
+        error = self.verify_many(chain, [order], check_signature)[0]
+        if error is not None:
+            logger.info("Rejected order {} locally: {}".format(order.orderHash, error))
+            raise OrderVerificationError(error)
@@ -0,0 +1,198 @@
+"""Shared poller that tracks status changes of watched orders and maker addresses."""
+
+import asyncio
+import contextvars
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from inch_mcp_server.core.models import LimitOrderV4Status
+from inch_mcp_server.integrations.api.limit_order_api_client import LimitOrderAPIClient
+from inch_mcp_server.integrations.services.order_cache import OrderCache
+from inch_mcp_server.utils.logger_setup import setup_logger
+
+logger = setup_logger("services.order_watcher")
+
+ORDER = "order"
+MAKER = "maker"
+
+# ("order", chain, order hash) or ("maker", chain, address), lowercase
+WatchTarget = Tuple[str, int, str]
+ChangeListener = Callable[[WatchTarget, dict], Awaitable[None]]
+
+
+def _status(raw_order: dict) -> dict:
+    return LimitOrderV4Status.model_validate(raw_order).model_dump()
+
+
+def _diff_status(old: dict, new: dict) -> dict:
+    return {field: {"old": old.get(field), "new": value} for field, value in new.items() if old.get(field) != value}
+
+
+def _diff_maker(old: Dict[str, dict], new: Dict[str, dict]) -> dict:
+    changed = {}
+    for order_hash in old.keys() & new.keys():
+        fields = _diff_status(old[order_hash], new[order_hash])
+        if fields:
+            changed[order_hash] = fields
+    change = {"added": sorted(new.keys() - old.keys()), "removed": sorted(old.keys() - new.keys()), "changed": changed}
+    return change if any(change.values()) else {}
+
+
+class _Watch:
+    __slots__ = ("state", "version", "last_change", "updated_at")
+
+    def __init__(self, state):
+        self.state = state
+        self.version = 1
+        self.last_change: dict = {}
+        self.updated_at = datetime.now(timezone.utc)
+
+
+class OrderWatcher:
+    """Polls every watched order and maker address once per interval, however many watchers share it.
+
+    Each cycle fetches each watched address once per chain, takes the status of
+    watched orders that appear in those results from there, and fetches only the
+    remaining orders by hash, at most ``concurrency`` requests at a time. Only the
+    mutable status fields are compared; listeners are called with the diff when
+    something changed. The loop starts with the first watch and stops when the
+    last one is removed.
+    """
+
+    def __init__(self, api_client: LimitOrderAPIClient, order_cache: OrderCache = None, interval: float = 5.0,
+                 concurrency: int = 8):
+        self.api_client = api_client
+        self.order_cache = order_cache
+        self.interval = interval
+        self.concurrency = concurrency
+        self._watches: Dict[WatchTarget, _Watch] = {}
+        self._listeners: List[ChangeListener] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        self._listeners.append(listener)
+
+    @property
+    def targets(self) -> List[WatchTarget]:
+        return list(self._watches)
+
+    @staticmethod
+    def target(kind: str, chain: int, value: str) -> WatchTarget:
+        return kind, chain, value.lower()
+
+    async def watch(self, target: WatchTarget) -> None:
+        """Start tracking a target; its baseline state is fetched before returning."""
+        if target not in self._watches:
+            self._watches[target] = _Watch(await self._fetch(target))
+        if self._task is None or self._task.done():
+            # A fresh context so the loop does not inherit the subscribing call's deadline
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    def unwatch(self, target: WatchTarget) -> None:
+        self._watches.pop(target, None)
+        if not self._watches and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def read(self, target: WatchTarget) -> dict:
+        """Return the tracked state of a target, or a one-off fresh read if it is not watched."""
+        watch = self._watches.get(target)
+        if watch is None:
+            watch = _Watch(await self._fetch(target))
+        kind, chain, value = target
+        return {
+            "chain": chain,
+            ("orderHash" if kind == ORDER else "address"): value,
+            ("status" if kind == ORDER else "orders"): watch.state,
+            "version": watch.version,
+            "lastChange": watch.last_change,
+            "updatedAt": watch.updated_at.isoformat(),
+        }
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _fetch(self, target: WatchTarget):
+        kind, chain, value = target
+        if kind == ORDER:
+            return await self._fetch_order(chain, value)
+        return await self._fetch_maker(chain, value)
+
+    async def _fetch_order(self, chain: int, order_hash: str) -> dict:
+        status = LimitOrderV4Status.model_validate(await self.api_client.get_order_by_hash(chain, order_hash))
+        if self.order_cache is not None:
+            self.order_cache.put_status(chain, order_hash, status)
+        return status.model_dump()
+
+    async def _fetch_maker(self, chain: int, address: str) -> Dict[str, dict]:
+        orders = await self.api_client.get_orders_by_address(chain, address)
+        return {order["orderHash"].lower(): _status(order) for order in orders}
+
+    async def poll_once(self) -> int:
+        """Run one polling cycle and return the number of targets that changed."""
+        started = time.monotonic()
+        targets = list(self._watches)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(target: WatchTarget):
+            async with semaphore:
+                return await self._fetch(target)
+
+        makers = [target for target in targets if target[0] == MAKER]
+        maker_results = await asyncio.gather(*(fetch(target) for target in makers), return_exceptions=True)
+        fresh: Dict[WatchTarget, object] = dict(zip(makers, maker_results))
+
+        covered: Dict[Tuple[int, str], dict] = {}
+        for (_, chain, _), result in fresh.items():
+            if not isinstance(result, Exception):
+                covered.update({(chain, order_hash): status for order_hash, status in result.items()})
+        remaining: Set[WatchTarget] = set()
+        for target in targets:
+            if target[0] == ORDER:
+                status = covered.get((target[1], target[2]))
+                if status is None:
+                    remaining.add(target)
+                else:
+                    fresh[target] = status
+        order_results = await asyncio.gather(*(fetch(target) for target in remaining), return_exceptions=True)
+        fresh.update(zip(remaining, order_results))
+
+        changes = 0
+        for target, result in fresh.items():
+            watch = self._watches.get(target)
+            if watch is None:  # unwatched while polling
+                continue
+            if isinstance(result, Exception):
+                logger.warning("Polling {} failed: {}".format(target, result))
+                continue
+            change = _diff_status(watch.state, result) if target[0] == ORDER else _diff_maker(watch.state, result)
+            if not change:
+                continue
+            watch.state, watch.last_change = result, change
+            watch.version += 1
+            watch.updated_at = datetime.now(timezone.utc)
+            changes += 1
+            for listener in self._listeners:
+                try:
+                    await listener(target, change)
+                except Exception as e:
+                    logger.warning("Change listener failed for {}: {}".format(target, e))
+
+        logger.info("Polled {} watched targets ({} upstream calls) in {:.2f}s, {} changed".format(
+            len(targets), len(makers) + len(remaining), time.monotonic() - started, changes))
+        return changes
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error("Order watcher cycle failed: {}".format(e))
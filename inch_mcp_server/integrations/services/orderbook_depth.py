@@ -0,0 +1,87 @@
+"""Vectorized best-rate and cumulative depth aggregation over raw orders."""
+
+from typing import List, Sequence
+
+import numpy as np
+
+from inch_mcp_server.core.models import DepthLevel, OrderbookDepthResponse, OrderbookSide
+
+
+def _scaled(values: Sequence[str], decimals: int) -> np.ndarray:
+    """Parse big-integer amount strings into float64 token units.
+
+    float() parses decimal integer strings of any length directly; the precision
+    lost beyond 2**53 is far below anything that matters for ranking rates.
+    """
+    return np.asarray(values, dtype=np.float64) * 10.0 ** -decimals
+
+
+def _side_arrays(orders: List[dict], give_decimals: int, get_decimals: int, is_bid: bool):
+    """Build (rate, base amount, quote amount) arrays for one side of the book.
+
+    For asks makers give the base asset, for bids they give the quote asset;
+    rates are always quote units per base unit.
+    """
+    making = _scaled([order["data"]["makingAmount"] for order in orders], give_decimals)
+    taking = _scaled([order["data"]["takingAmount"] for order in orders], get_decimals)
+    remaining = _scaled([order["remainingMakerAmount"] for order in orders], give_decimals)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if is_bid:
+            rate = making / taking
+            return rate, remaining / rate, remaining
+        rate = taking / making
+        return rate, remaining, remaining * rate
+
+
+def _aggregate(rate, amount, quote, descending: bool, top_k: int, precision: int) -> OrderbookSide:
+    """Sort by rate, merge orders whose rates agree to ``precision`` significant digits, keep the top ``top_k``."""
+    mask = (amount > 0) & np.isfinite(rate) & (rate > 0)
+    rate, amount, quote = rate[mask], amount[mask], quote[mask]
+    if not len(rate):
+        return OrderbookSide(totalAmount=0.0, totalQuoteAmount=0.0, orderCount=0, levels=[])
+    order = np.argsort(-rate if descending else rate, kind="stable")
+    rate, amount, quote = rate[order], amount[order], quote[order]
+    factor = 10.0 ** (precision - 1 - np.floor(np.log10(rate)))
+    bucket = np.round(rate * factor) / factor
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    counts = np.diff(np.r_[starts, len(rate)])
+    level_amount = np.add.reduceat(amount, starts)
+    level_quote = np.add.reduceat(quote, starts)
+    cumulative_amount = np.cumsum(level_amount)
+    cumulative_quote = np.cumsum(level_quote)
+    rows = zip(bucket[starts][:top_k].tolist(), level_amount[:top_k].tolist(), level_quote[:top_k].tolist(),
+               counts[:top_k].tolist(), cumulative_amount[:top_k].tolist(), cumulative_quote[:top_k].tolist())
+    levels = [
+        DepthLevel(rate=r, amount=a, quoteAmount=q, orderCount=c, cumulativeAmount=ca, cumulativeQuoteAmount=cq)
+        for r, a, q, c, ca, cq in rows
+    ]
+    return OrderbookSide(bestRate=float(rate[0]), totalAmount=float(amount.sum()), totalQuoteAmount=float(quote.sum()),
+                         orderCount=len(rate), levels=levels)
+
+
+def compute_orderbook_depth(base_asset: str, quote_asset: str, asks: List[dict], bids: List[dict],
+                            base_decimals: int = 0, quote_decimals: int = 0, top_k: int = 10,
+                            precision: int = 6) -> OrderbookDepthResponse:
+    """Aggregate raw orders of both directions of a pair into depth levels.
+
+    Args:
+        base_asset: Token the asks sell (makerAsset of ``asks``)
+        quote_asset: Token the asks want (takerAsset of ``asks``)
+        asks: Raw orders selling ``base_asset`` for ``quote_asset``
+        bids: Raw orders selling ``quote_asset`` for ``base_asset``
+        base_decimals: Decimals used to scale base amounts (0 keeps raw units)
+        quote_decimals: Decimals used to scale quote amounts (0 keeps raw units)
+        top_k: Number of levels returned per side
+        precision: Significant digits of the rate used to merge orders into one level
+
+    Returns:
+        OrderbookDepthResponse: Best rate, totals and top levels with cumulative depth for each side
+    """
+    ask_arrays = _side_arrays(asks, base_decimals, quote_decimals, is_bid=False)
+    bid_arrays = _side_arrays(bids, quote_decimals, base_decimals, is_bid=True)
+    return OrderbookDepthResponse(
+        baseAsset=base_asset,
+        quoteAsset=quote_asset,
+        asks=_aggregate(*ask_arrays, descending=False, top_k=top_k, precision=precision),
+        bids=_aggregate(*bid_arrays, descending=True, top_k=top_k, precision=precision),
+    )
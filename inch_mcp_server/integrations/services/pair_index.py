@@ -0,0 +1,155 @@
+"""In-memory index of unique active token pairs per chain."""
+
+import asyncio
+import time
+from array import array
+from typing import Dict, List, Optional
+
+from inch_mcp_server.core.models import GetActiveUniquePairsResponse
+from inch_mcp_server.integrations.api.limit_order_api_client import LimitOrderAPIClient
+from inch_mcp_server.utils.logger_setup import setup_logger
+
+logger = setup_logger("services.pair_index")
+
+PAGE_LIMIT = 100
+
+
+class ChainPairIndex:
+    """Immutable snapshot of every active pair on one chain.
+
+    Token addresses are interned once into ``addresses``; adjacency lists store
+    compact ``array('I')`` ids so a lookup is two dict hits and a list build.
+    """
+
+    __slots__ = ("chain", "addresses", "address_ids", "maker_to_takers", "taker_to_makers", "pair_count", "built_at",
+                 "_sorted_pairs")
+
+    def __init__(self, chain: int, pairs: List[tuple]):
+        self.chain = chain
+        self.addresses: List[str] = []
+        self.address_ids: Dict[str, int] = {}
+        self.maker_to_takers: Dict[int, array] = {}
+        self.taker_to_makers: Dict[int, array] = {}
+        self.built_at = time.monotonic()
+        self._sorted_pairs: Optional[List[tuple]] = None
+
+        seen = set()
+        for maker, taker in pairs:
+            maker_id = self._intern(maker)
+            taker_id = self._intern(taker)
+            if (maker_id, taker_id) in seen:
+                continue
+            seen.add((maker_id, taker_id))
+            self.maker_to_takers.setdefault(maker_id, array("I")).append(taker_id)
+            self.taker_to_makers.setdefault(taker_id, array("I")).append(maker_id)
+        self.pair_count = len(seen)
+
+    def _intern(self, address: str) -> int:
+        address = address.lower()
+        address_id = self.address_ids.get(address)
+        if address_id is None:
+            address_id = len(self.addresses)
+            self.addresses.append(address)
+            self.address_ids[address] = address_id
+        return address_id
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.built_at
+
+    def sorted_pairs(self) -> List[tuple]:
+        """All (makerAsset, takerAsset) pairs in a stable lexicographic order, built once per snapshot."""
+        if self._sorted_pairs is None:
+            self._sorted_pairs = sorted(
+                (self.addresses[maker_id], self.addresses[taker_id])
+                for maker_id, taker_ids in self.maker_to_takers.items()
+                for taker_id in taker_ids
+            )
+        return self._sorted_pairs
+
+    def takers_for(self, maker_asset: str) -> List[str]:
+        """Tokens that makers selling ``maker_asset`` want in return."""
+        address_id = self.address_ids.get(maker_asset.lower())
+        if address_id is None:
+            return []
+        return [self.addresses[i] for i in self.maker_to_takers.get(address_id, ())]
+
+    def makers_for(self, taker_asset: str) -> List[str]:
+        """Tokens offered by makers that want ``taker_asset``."""
+        address_id = self.address_ids.get(taker_asset.lower())
+        if address_id is None:
+            return []
+        return [self.addresses[i] for i in self.taker_to_makers.get(address_id, ())]
+
+
+class PairIndex:
+    """Per-chain pair index refreshed with stale-while-revalidate.
+
+    A snapshot younger than ``ttl`` is served as is. An older one is still
+    served while a single background task prefetches a fresh copy, until it
+    passes ``max_stale``, after which callers wait for the rebuild.
+    """
+
+    def __init__(self, api_client: LimitOrderAPIClient, ttl: float = 60.0, max_stale: float = 600.0,
+                 prefetch_concurrency: int = 8):
+        self.api_client = api_client
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.prefetch_concurrency = prefetch_concurrency
+        self._snapshots: Dict[int, ChainPairIndex] = {}
+        self._builds: Dict[int, asyncio.Task] = {}
+
+    async def get(self, chain: int) -> ChainPairIndex:
+        """Return the pair snapshot for ``chain``, building or refreshing it as needed."""
+        snapshot = self._snapshots.get(chain)
+        if snapshot is not None:
+            if snapshot.age < self.ttl:
+                return snapshot
+            if snapshot.age < self.max_stale:
+                self._start_build(chain)
+                return snapshot
+        return await asyncio.shield(self._start_build(chain))
+
+    def peek(self, chain: int) -> Optional[ChainPairIndex]:
+        """Return the current snapshot without triggering a fetch."""
+        return self._snapshots.get(chain)
+
+    def _start_build(self, chain: int) -> asyncio.Task:
+        task = self._builds.get(chain)
+        if task is None or task.done():
+            task = asyncio.create_task(self._build(chain))
+            task.add_done_callback(lambda t: self._log_failure(chain, t))
+            self._builds[chain] = task
+        return task
+
+    @staticmethod
+    def _log_failure(chain: int, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Failed to build pair index for chain {}: {}".format(chain, task.exception()))
+
+    async def _fetch_page(self, chain: int, page: int) -> GetActiveUniquePairsResponse:
+        response = await self.api_client.get_unique_active_pairs(chain, page, PAGE_LIMIT)
+        return GetActiveUniquePairsResponse.model_validate(response)
+
+    async def _build(self, chain: int) -> ChainPairIndex:
+        started = time.monotonic()
+        first = await self._fetch_page(chain, 1)
+        pages = [first]
+
+        semaphore = asyncio.Semaphore(self.prefetch_concurrency)
+
+        async def fetch(page: int) -> GetActiveUniquePairsResponse:
+            async with semaphore:
+                return await self._fetch_page(chain, page)
+
+        if first.meta.totalPages > 1:
+            pages += await asyncio.gather(*(fetch(page) for page in range(2, first.meta.totalPages + 1)))
+
+        snapshot = ChainPairIndex(chain, [(pair.makerAsset, pair.takerAsset) for page in pages for pair in page.items])
+        self._snapshots[chain] = snapshot
+        logger.info(
+            "Built pair index for chain {}: {} pairs, {} tokens from {} pages in {:.2f}s".format(
+                chain, snapshot.pair_count, len(snapshot.addresses), len(pages), time.monotonic() - started
+            )
+        )
+        return snapshot
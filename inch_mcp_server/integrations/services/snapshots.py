@@ -0,0 +1,77 @@
+"""Short-lived result snapshots behind opaque pagination cursors."""
+
+import base64
+import secrets
+import time
+from typing import Hashable, List, Optional, Sequence, Tuple
+
+from inch_mcp_server.utils.ttl_cache import TTLCache
+
+
+class InvalidCursorError(ValueError):
+    """Raised for cursors that are malformed, expired or belong to another query."""
+
+
+class Snapshot:
+    __slots__ = ("query", "items", "created_at")
+
+    def __init__(self, query: Hashable, items: Sequence):
+        self.query = query
+        self.items = items
+        self.created_at = time.monotonic()
+
+
+class SnapshotStore:
+    """Bounded TTL store of ordered result sets addressed by continuation cursors.
+
+    The first page of a query stores its full result once; a cursor encodes the
+    snapshot id and the next offset, so later pages are slices served from
+    memory in the same order, without re-fetching or re-sorting upstream data.
+    A cursor stays valid for ``ttl`` seconds after its snapshot was taken.
+    """
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 1024):
+        self._snapshots: TTLCache[Snapshot] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def create(self, query: Hashable, items: Sequence) -> str:
+        """Store ``items`` for ``query`` and return the snapshot id."""
+        snapshot_id = secrets.token_urlsafe(12)
+        self._snapshots.set(snapshot_id, Snapshot(query, items))
+        return snapshot_id
+
+    @staticmethod
+    def encode(snapshot_id: str, offset: int) -> str:
+        return base64.urlsafe_b64encode("{}:{}".format(snapshot_id, offset).encode()).decode().rstrip("=")
+
+    def resolve(self, cursor: str, query: Hashable) -> Tuple[str, int]:
+        """Decode a cursor issued for ``query`` into (snapshot id, offset)."""
+        try:
+            decoded = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            snapshot_id, offset = decoded.rsplit(":", 1)
+            offset = int(offset)
+        except (ValueError, UnicodeDecodeError):
+            raise InvalidCursorError("Malformed cursor")
+        snapshot = self._snapshots.get(snapshot_id)
+        if snapshot is None:
+            raise InvalidCursorError("Cursor expired; request the first page again")
+        if snapshot.query != query or offset < 0:
+            raise InvalidCursorError("Cursor does not belong to this query")
+        return snapshot_id, offset
+
+    def first_page(self, query: Hashable, items: Sequence, offset: int, limit: int) -> Tuple[List, Optional[str], int]:
+        """Like ``page`` for a fresh result; it is only stored when a next cursor has to point into it."""
+        end = offset + limit
+        next_cursor = self.encode(self.create(query, items), end) if end < len(items) else None
+        return list(items[offset:end]), next_cursor, len(items)
+
+    def page(self, snapshot_id: str, offset: int, limit: int) -> Tuple[List, Optional[str], int]:
+        """Return (items, next cursor or None, total items) for one page of a snapshot."""
+        snapshot = self._snapshots.get(snapshot_id)
+        if snapshot is None:
+            raise InvalidCursorError("Cursor expired; request the first page again")
+        end = offset + limit
+        next_cursor = self.encode(snapshot_id, end) if end < len(snapshot.items) else None
+        return list(snapshot.items[offset:end]), next_cursor, len(snapshot.items)
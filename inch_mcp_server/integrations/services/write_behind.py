@@ -0,0 +1,313 @@
+"""Write-behind buffer that moves ``limit_orders`` writes off the request path."""
+
+import asyncio
+import contextvars
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi_async_sqlalchemy import db
+from sqlalchemy import bindparam, delete, insert, update
+from sqlalchemy.exc import DisconnectionError, InterfaceError, OperationalError, TimeoutError as PoolTimeoutError
+
+from inch_mcp_server.database import LimitOrder
+from inch_mcp_server.utils.deadline import within_deadline
+from inch_mcp_server.utils.logger_setup import setup_logger
+
+logger = setup_logger("services.write_behind")
+
+INSERT = "insert"
+UPDATE_STATUS = "update_status"
+DELETE = "delete"
+
+# (chain, lowercase order hash)
+OrderKey = Tuple[int, str]
+# (kind, values): the full row for INSERT, order_hash/status/status_updated_at for UPDATE_STATUS,
+# order_hash for DELETE; order_hash keeps the caller's spelling, which is what the table holds
+Operation = Tuple[str, dict]
+
+# Failures of the connection rather than of the data; writes hitting them are kept instead of dead-lettered
+TRANSIENT_ERRORS = (OperationalError, InterfaceError, DisconnectionError, PoolTimeoutError, OSError, asyncio.TimeoutError)
+
+
+class WriteBehindQueue:
+    """Buffers inserts, status updates and deletes of stored orders and applies them in periodic transactions.
+
+    Operations are kept per ``(chain, order hash)`` in arrival order and applied
+    in waves: wave ``i`` holds the ``i``-th pending operation of every order, so
+    each order's writes land in the order they were made while every wave is
+    executed as one statement per operation kind. Consecutive status updates of
+    the same order collapse into the latest. A flush runs every
+    ``flush_interval`` seconds, or as soon as ``batch_size`` operations are
+    pending, in one transaction; a failed flush is put back and retried.
+
+    Once orders of a batch have failed ``max_attempts`` flushes, the batch is
+    written one order per transaction instead, so a single bad write cannot
+    hold everything else back. An order that still fails with anything but a
+    connection error is dropped, logged and kept in ``dead_letters``.
+
+    When ``max_pending`` operations are queued, writers wait for the next flush
+    (bounded by their deadline). ``close`` drains everything that is left.
+    """
+
+    def __init__(self, max_pending: int = 10_000, batch_size: int = 1_000, flush_interval: float = 0.5,
+                 max_attempts: int = 3, dead_letter_size: int = 1_000):
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self._pending: "OrderedDict[OrderKey, Deque[Operation]]" = OrderedDict()
+        self._addresses: Dict[OrderKey, str] = {}  # maker of orders with a pending insert
+        self._attempts: Dict[OrderKey, int] = {}  # failed flushes of orders that are pending again
+        self.dead_letters: Deque[Tuple[OrderKey, List[Operation], str]] = deque(maxlen=dead_letter_size)
+        self._size = 0
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.flushes = 0
+        self.flush_failures = 0
+        self.operations_written = 0
+        self.operations_dropped = 0
+        self.last_flush_seconds = 0.0
+
+    @property
+    def pending(self) -> int:
+        return self._size
+
+    async def _submit(self, key: OrderKey, operation: Operation) -> None:
+        if self._closed:
+            raise RuntimeError("write-behind queue is closed")
+        while self._size >= self.max_pending:
+            self._space.clear()
+            self._wakeup.set()
+            await within_deadline(self._space.wait())
+        operations = self._pending.get(key)
+        if operations is None:
+            operations = self._pending[key] = deque()
+        if operation[0] == UPDATE_STATUS and operations and operations[-1][0] == UPDATE_STATUS:
+            operations[-1] = operation
+        else:
+            operations.append(operation)
+            self._size += 1
+        if self._task is None or self._task.done():
+            # A fresh context so the flusher does not inherit the caller's deadline or database session
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+        if self._size >= self.batch_size:
+            self._wakeup.set()
+
+    async def insert(self, rows: Iterable[dict]) -> None:
+        """Queue new ``limit_orders`` rows (all columns, including ``id``)."""
+        for row in rows:
+            key = (row["blockchain_id"], row["order_hash"].lower())
+            self._addresses[key] = row["address"]
+            await self._submit(key, (INSERT, row))
+
+    async def update_status(self, chain: int, order_hash: str, status: dict, updated_at) -> None:
+        """Queue new ``status``/``status_updated_at`` values for every stored row of an order."""
+        values = {"order_hash": order_hash, "status": status, "status_updated_at": updated_at}
+        await self._submit((chain, order_hash.lower()), (UPDATE_STATUS, values))
+
+    async def delete(self, chain: int, order_hashes: Iterable[str]) -> None:
+        for order_hash in order_hashes:
+            await self._submit((chain, order_hash.lower()), (DELETE, {"order_hash": order_hash}))
+
+    def last_operation(self, chain: int, order_hash: str) -> Optional[str]:
+        """Kind of the newest pending write of an order, or None when nothing is pending."""
+        operations = self._pending.get((chain, order_hash.lower()))
+        return operations[-1][0] if operations else None
+
+    def overlay_hashes(self, chain: int, address: str, stored: Set[str]) -> Set[str]:
+        """Apply pending inserts and deletes of ``address`` to a set of order hashes read from the database."""
+        address = address.lower()
+        result = {order_hash.lower(): order_hash for order_hash in stored}
+        for (key_chain, key_hash), operations in self._pending.items():
+            if key_chain != chain:
+                continue
+            last = next(((kind, values) for kind, values in reversed(operations) if kind != UPDATE_STATUS), None)
+            if last is None:
+                continue
+            if last[0] == INSERT and self._addresses.get((key_chain, key_hash)) == address:
+                result[key_hash] = last[1]["order_hash"]
+            elif last[0] == DELETE:
+                result.pop(key_hash, None)
+        return set(result.values())
+
+    def _take(self) -> List[Tuple[OrderKey, Deque[Operation]]]:
+        taken, count = [], 0
+        while self._pending and count < self.batch_size:
+            key, operations = self._pending.popitem(last=False)
+            taken.append((key, operations))
+            count += len(operations)
+        self._size -= count
+        return taken
+
+    def _put_back(self, taken: List[Tuple[OrderKey, Deque[Operation]]]) -> None:
+        for key, operations in reversed(taken):
+            operations.extend(self._pending.pop(key, ()))
+            self._pending[key] = operations
+            self._pending.move_to_end(key, last=False)
+        self._size = sum(len(operations) for operations in self._pending.values())
+
+    @staticmethod
+    async def _apply_wave(wave: List[Tuple[OrderKey, Operation]]) -> None:
+        inserts = [values for _, (kind, values) in wave if kind == INSERT]
+        updates = [
+            {
+                "chain": chain,
+                "hash": values["order_hash"],
+                "new_status": values["status"],
+                "new_status_updated_at": values["status_updated_at"],
+            }
+            for (chain, _), (kind, values) in wave if kind == UPDATE_STATUS
+        ]
+        deletes: Dict[int, List[str]] = {}
+        for (chain, _), (kind, values) in wave:
+            if kind == DELETE:
+                deletes.setdefault(chain, []).append(values["order_hash"])
+
+        for chain, order_hashes in deletes.items():
+            await db.session.execute(
+                delete(LimitOrder).where(
+                    (LimitOrder.blockchain_id == chain) & LimitOrder.order_hash.in_(order_hashes)
+                )
+            )
+        if inserts:
+            await db.session.execute(insert(LimitOrder), inserts)
+        if updates:
+            # Core UPDATE over the table: executemany with per-row WHERE values, not ORM bulk update by primary key
+            table = LimitOrder.__table__
+            await db.session.execute(
+                update(table)
+                .where((table.c.blockchain_id == bindparam("chain")) & (table.c.order_hash == bindparam("hash")))
+                .values(status=bindparam("new_status"), status_updated_at=bindparam("new_status_updated_at")),
+                updates,
+            )
+
+    @classmethod
+    async def _write(cls, taken: List[Tuple[OrderKey, Deque[Operation]]]) -> int:
+        """Apply the operations of ``taken`` in one transaction and return the number of waves."""
+        waves: List[List[Tuple[OrderKey, Operation]]] = []
+        for key, operations in taken:
+            for depth, operation in enumerate(operations):
+                if depth == len(waves):
+                    waves.append([])
+                waves[depth].append((key, operation))
+        async with db():
+            for wave in waves:
+                await cls._apply_wave(wave)
+            await db.session.commit()
+        return len(waves)
+
+    async def _write_each(self, taken: List[Tuple[OrderKey, Deque[Operation]]]) -> int:
+        """Write every order of ``taken`` in its own transaction and return how many operations were written.
+
+        Orders failing on the connection are put back; any other failure drops the order into ``dead_letters``.
+
+        Raises:
+            Exception: The connection error, when every order was put back
+        """
+        written, retry, error = 0, [], None
+        for key, operations in taken:
+            try:
+                await self._write([(key, operations)])
+            except TRANSIENT_ERRORS as e:
+                retry.append((key, operations))
+                error = e
+                continue
+            except Exception as e:
+                self.operations_dropped += len(operations)
+                self.dead_letters.append((key, list(operations), str(e)))
+                logger.error("Write-behind dropped {} operations ({}) of order {} on chain {}: {}".format(
+                    len(operations), ", ".join(kind for kind, _ in operations), key[1], key[0], e))
+            else:
+                written += len(operations)
+            self._attempts.pop(key, None)
+        if retry:
+            self._put_back(retry)
+            logger.warning("Write-behind put {} orders back after connection errors: {}".format(len(retry), error))
+            if len(retry) == len(taken):
+                raise error
+        return written
+
+    async def flush(self) -> int:
+        """Write one batch of pending operations in a single transaction and return how many were written."""
+        taken = self._take()
+        if not taken:
+            return 0
+        started = time.monotonic()
+        count = sum(len(operations) for _, operations in taken)
+        try:
+            waves = await self._write(taken)
+        except Exception as e:
+            self.flush_failures += 1
+            for key, _ in taken:
+                self._attempts[key] = self._attempts.get(key, 0) + 1
+            attempts = max(self._attempts[key] for key, _ in taken)
+            if attempts < self.max_attempts:
+                self._put_back(taken)
+                logger.error("Write-behind flush of {} operations failed, will retry: {}".format(count, e))
+                raise
+            logger.error("Write-behind flush of {} operations failed {} times, writing orders one by one: {}".format(
+                count, attempts, e))
+            count, waves = await self._write_each(taken), None
+        else:
+            for key, _ in taken:
+                self._attempts.pop(key, None)
+        for key, _ in taken:
+            if key not in self._pending:
+                self._addresses.pop(key, None)
+        self.flushes += 1
+        self.operations_written += count
+        self.last_flush_seconds = time.monotonic() - started
+        self._space.set()
+        if waves is not None:
+            logger.info("Write-behind flushed {} operations in {} waves in {:.3f}s".format(
+                count, waves, self.last_flush_seconds))
+        return count
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                while self._pending:
+                    await self.flush()
+                    if self._size < self.batch_size:
+                        break
+            except Exception:
+                await asyncio.sleep(self.flush_interval)
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Stop the background flusher and write everything still pending."""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        deadline = time.monotonic() + timeout
+        while self._pending and time.monotonic() < deadline:
+            try:
+                await self.flush()
+            except Exception:
+                await asyncio.sleep(min(self.flush_interval, max(0.0, deadline - time.monotonic())))
+        if self._pending:
+            logger.error("Write-behind queue closed with {} operations unwritten".format(self._size))
+
+    def snapshot(self) -> dict:
+        return {
+            "pending": self._size,
+            "maxPending": self.max_pending,
+            "flushes": self.flushes,
+            "flushFailures": self.flush_failures,
+            "operationsWritten": self.operations_written,
+            "operationsDropped": self.operations_dropped,
+            "lastFlushMs": round(self.last_flush_seconds * 1000, 2),
+        }
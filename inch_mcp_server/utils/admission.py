@@ -0,0 +1,194 @@
+"""Admission control with bounded queues per class of work and queue-time shedding."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, List, Optional
+
+from inch_mcp_server.config import AdmissionConfig
+from inch_mcp_server.utils.deadline import remaining
+
+CHEAP = "cheap"
+EXPENSIVE = "expensive"
+
+# Tools and routes that sync with the database or fan out into many upstream calls
+EXPENSIVE_OPERATIONS = frozenset({
+    "get_limit_orders_by_chain_and_address",
+    "get_orders",
+    "store_order",
+    "post_limit_orders",
+    "store_orders_bulk",
+    "get_limit_orders_count_matrix",
+    "get_orders_count_matrix",
+    "get_orderbook_depth",
+})
+
+
+class Rejected(Exception):
+    """Raised instead of admitting a call the server cannot finish in time."""
+
+    def __init__(self, admission_class: str, reason: str, retry_after: float):
+        self.admission_class = admission_class
+        self.reason = reason
+        self.retry_after = max(1, math.ceil(retry_after))
+        super().__init__("Server overloaded ({} calls: {}), retry after {}s".format(
+            admission_class, reason, self.retry_after))
+
+
+class _Waiter:
+    __slots__ = ("future", "enqueued_at", "deadline")
+
+    def __init__(self, future: asyncio.Future, deadline: Optional[float]):
+        self.future = future
+        self.enqueued_at = time.monotonic()
+        self.deadline = deadline
+
+
+class AdmissionQueue:
+    """``concurrency`` slots and a queue of at most ``queue_size`` waiting calls.
+
+    A call is rejected at once when the queue is full, or when the expected
+    wait plus the average service time does not fit in its deadline. A waiter
+    is shed when it has queued for ``max_queue_seconds`` or when, at hand-over,
+    its remaining deadline is shorter than the average service time. While a
+    standing queue exists (more waiters than slots) the newest waiter is served
+    first: the oldest ones are the likeliest to miss their deadline anyway, and
+    serving fresh work keeps completed-in-time calls high under overload.
+    """
+
+    def __init__(self, name: str, concurrency: int = 32, queue_size: int = 64, max_queue_seconds: float = 2.0,
+                 smoothing: float = 0.2):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.max_queue_seconds = max_queue_seconds
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self.avg_service = 0.0
+        self.admitted = 0
+        self.rejected = 0
+        self.shed = 0
+        self.completed = 0
+        self._waiters: Deque[_Waiter] = deque()
+
+    @classmethod
+    def from_config(cls, name: str, config: AdmissionConfig) -> "AdmissionQueue":
+        return cls(name, config.concurrency, config.queue_size, config.max_queue_seconds)
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def expected_wait(self) -> float:
+        """Seconds a call arriving now is expected to wait for a slot."""
+        if self.in_flight < self.concurrency and not self._waiters:
+            return 0.0
+        return (len(self._waiters) + 1) * self.avg_service / self.concurrency
+
+    def _reject(self, reason: str) -> Rejected:
+        self.rejected += 1
+        return Rejected(self.name, reason, self.expected_wait() + self.avg_service)
+
+    async def acquire(self) -> float:
+        """Wait for a slot and return the time it was granted, or raise ``Rejected``."""
+        if self.in_flight < self.concurrency and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return time.monotonic()
+        if len(self._waiters) >= self.queue_size:
+            raise self._reject("queue full")
+        left = remaining()
+        if left is not None and self.expected_wait() + self.avg_service > left:
+            raise self._reject("cannot finish before the deadline")
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), None if left is None else time.monotonic() + left)
+        self._waiters.append(waiter)
+        timeout = self.max_queue_seconds if left is None else min(self.max_queue_seconds, left)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            self._drop(waiter)
+            self.shed += 1
+            raise Rejected(self.name, "queued too long", self.expected_wait() + self.avg_service)
+        except asyncio.CancelledError:
+            self._drop(waiter)
+            raise
+        self.admitted += 1
+        return time.monotonic()
+
+    def _drop(self, waiter: _Waiter) -> None:
+        if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+            self.release(None)  # slot was handed over just before the waiter gave up
+        else:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+            waiter.future.cancel()
+
+    def release(self, started: Optional[float]) -> None:
+        """Return a slot; ``started`` is the time returned by ``acquire`` (None if the call never ran)."""
+        self.in_flight -= 1
+        if started is not None:
+            service = time.monotonic() - started
+            self.avg_service = service if not self.completed else (
+                self.avg_service + self.smoothing * (service - self.avg_service))
+            self.completed += 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.concurrency:
+            lifo = len(self._waiters) > self.concurrency
+            waiter = self._waiters.pop() if lifo else self._waiters.popleft()
+            if waiter.future.done():
+                continue
+            now = time.monotonic()
+            if waiter.deadline is not None and waiter.deadline - now < self.avg_service:
+                self.shed += 1
+                waiter.future.set_exception(
+                    Rejected(self.name, "cannot finish before the deadline", self.expected_wait() + self.avg_service))
+                continue
+            self.in_flight += 1
+            waiter.future.set_result(None)
+
+    def snapshot(self) -> dict:
+        return {
+            "class": self.name,
+            "concurrency": self.concurrency,
+            "inFlight": self.in_flight,
+            "queued": self.queued,
+            "avgServiceMs": round(self.avg_service * 1000, 2),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "shed": self.shed,
+            "completed": self.completed,
+        }
+
+
+class AdmissionController:
+    """Routes each tool call or REST request to the admission queue of its class."""
+
+    def __init__(self, queues: Dict[str, AdmissionQueue], classes: Dict[str, str] = None):
+        self.queues = queues
+        self.classes = classes or {}
+
+    def classify(self, operation: str) -> str:
+        admission_class = self.classes.get(operation)
+        if admission_class in self.queues:
+            return admission_class
+        return EXPENSIVE if operation in EXPENSIVE_OPERATIONS else CHEAP
+
+    @asynccontextmanager
+    async def admit(self, operation: str) -> AsyncIterator[None]:
+        """Hold a slot of the operation's class for the duration of the block; raises ``Rejected`` when shed."""
+        queue = self.queues[self.classify(operation)]
+        started = await queue.acquire()
+        try:
+            yield
+        finally:
+            queue.release(started)
+
+    def snapshot(self) -> List[dict]:
+        return [queue.snapshot() for _, queue in sorted(self.queues.items())]
@@ -0,0 +1,73 @@
+"""Request deadlines propagated through a context variable."""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Absolute time.monotonic() by which the current tool call or request must finish
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when work is started or still running after the current deadline."""
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Run the enclosed block under a budget of ``seconds``; nested budgets can only shorten it."""
+    if seconds is None:
+        yield
+        return
+    current = _deadline.get()
+    new = time.monotonic() + seconds
+    token = _deadline.set(new if current is None else min(current, new))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None when no deadline is set."""
+    current = _deadline.get()
+    return None if current is None else current - time.monotonic()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check_deadline() -> None:
+    """Raise DeadlineExceeded if the current deadline has passed."""
+    if expired():
+        raise DeadlineExceeded("Deadline exceeded")
+
+
+async def within_deadline(awaitable: Awaitable[T]) -> T:
+    """Await ``awaitable``, cancelling it and raising DeadlineExceeded when the deadline passes."""
+    left = remaining()
+    if left is None:
+        return await awaitable
+    if left <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded("Deadline exceeded")
+    try:
+        return await asyncio.wait_for(awaitable, left)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded("Deadline exceeded after {:.2f}s budget".format(left))
+
+
+def requested_budget(value, default: float, maximum: float) -> float:
+    """Budget for a call: ``value`` (from a header or request metadata) if it is a positive number, capped at
+    ``maximum``, otherwise ``default``."""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return default
+    return min(seconds, maximum) if seconds > 0 else default
@@ -0,0 +1,141 @@
+"""Keccak-256 as used by Ethereum, for single messages and vectorized batches."""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+try:
+    from Crypto.Hash import keccak as _pycryptodome_keccak
+except ImportError:  # pycryptodome is a dependency; this fallback covers platforms without its wheels
+    _pycryptodome_keccak = None
+
+RATE = 136  # bytes absorbed per permutation for a 256-bit capacity of 512
+_MASK = (1 << 64) - 1
+
+_ROUND_CONSTANTS = (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+)
+
+# Rotation offset of lane (x, y), indexed [x][y]
+_ROTATIONS = (
+    (0, 36, 3, 41, 18),
+    (1, 44, 10, 45, 2),
+    (62, 6, 43, 15, 61),
+    (28, 55, 25, 21, 56),
+    (27, 20, 39, 8, 14),
+)
+
+# For the rho and pi steps: lane x + 5y moves to lane y + 5(2x + 3y) after rotating by _ROTATIONS[x][y]
+_PI = tuple((x + 5 * y, y + 5 * ((2 * x + 3 * y) % 5), _ROTATIONS[x][y]) for x in range(5) for y in range(5))
+# (source, target, column, left shift, right shift) for the pure-Python permutation
+_PI_STEPS = tuple((source, target, source % 5, rotation, (64 - rotation) % 64) for source, target, rotation in _PI)
+
+
+def _pad(data: bytes) -> bytes:
+    """Keccak multi-rate padding (0x01 ... 0x80), not the SHA-3 domain byte."""
+    padding = RATE - len(data) % RATE
+    if padding == 1:
+        return data + b"\x81"
+    return data + b"\x01" + b"\x00" * (padding - 2) + b"\x80"
+
+
+def _permute(state: List[int]) -> None:
+    mask = _MASK
+    pi = _PI_STEPS
+    b = [0] * 25
+    for round_constant in _ROUND_CONSTANTS:
+        c0 = state[0] ^ state[5] ^ state[10] ^ state[15] ^ state[20]
+        c1 = state[1] ^ state[6] ^ state[11] ^ state[16] ^ state[21]
+        c2 = state[2] ^ state[7] ^ state[12] ^ state[17] ^ state[22]
+        c3 = state[3] ^ state[8] ^ state[13] ^ state[18] ^ state[23]
+        c4 = state[4] ^ state[9] ^ state[14] ^ state[19] ^ state[24]
+        d = (
+            c4 ^ (((c1 << 1) | (c1 >> 63)) & mask),
+            c0 ^ (((c2 << 1) | (c2 >> 63)) & mask),
+            c1 ^ (((c3 << 1) | (c3 >> 63)) & mask),
+            c2 ^ (((c4 << 1) | (c4 >> 63)) & mask),
+            c3 ^ (((c0 << 1) | (c0 >> 63)) & mask),
+        )
+        for source, target, x, left, right in pi:
+            lane = state[source] ^ d[x]
+            b[target] = ((lane << left) | (lane >> right)) & mask
+        for y in (0, 5, 10, 15, 20):
+            b0, b1, b2, b3, b4 = b[y], b[y + 1], b[y + 2], b[y + 3], b[y + 4]
+            state[y] = b0 ^ (~b1 & b2)
+            state[y + 1] = b1 ^ (~b2 & b3)
+            state[y + 2] = b2 ^ (~b3 & b4)
+            state[y + 3] = b3 ^ (~b4 & b0)
+            state[y + 4] = b4 ^ (~b0 & b1)
+        state[0] ^= round_constant
+
+
+def _keccak256_python(data: bytes) -> bytes:
+    state = [0] * 25
+    padded = _pad(data)
+    for offset in range(0, len(padded), RATE):
+        block = padded[offset:offset + RATE]
+        for i in range(RATE // 8):
+            state[i] ^= int.from_bytes(block[8 * i:8 * i + 8], "little")
+        _permute(state)
+    return b"".join(lane.to_bytes(8, "little") for lane in state[:4])
+
+
+def keccak256(data: bytes) -> bytes:
+    """Return the 32-byte Keccak-256 digest of ``data``."""
+    if _pycryptodome_keccak is not None:
+        return _pycryptodome_keccak.new(data=data, digest_bits=256).digest()
+    return _keccak256_python(data)
+
+
+def _keccak256_numpy(padded: Sequence[bytes]) -> List[bytes]:
+    """Hash equally sized padded messages with one permutation per block across the whole batch."""
+    count = len(padded)
+    blocks = np.frombuffer(b"".join(padded), dtype="<u8").reshape(count, -1, RATE // 8)
+    state = np.zeros((25, count), dtype=np.uint64)
+    shifts = [np.uint64(r) for r in range(65)]
+    constants = [np.uint64(rc) for rc in _ROUND_CONSTANTS]
+    b = np.empty_like(state)
+    for block in range(blocks.shape[1]):
+        state[:RATE // 8] ^= blocks[:, block, :].T
+        for round_constant in constants:
+            c = state[0:5] ^ state[5:10] ^ state[10:15] ^ state[15:20] ^ state[20:25]
+            d = np.roll(c, 1, axis=0) ^ ((np.roll(c, -1, axis=0) << shifts[1]) | (np.roll(c, -1, axis=0) >> shifts[63]))
+            state ^= np.tile(d, (5, 1))
+            for source, target, rotation in _PI:
+                lane = state[source]
+                b[target] = (lane << shifts[rotation]) | (lane >> shifts[64 - rotation]) if rotation else lane
+            b5 = b.reshape(5, 5, count)
+            state = (b5 ^ (~np.roll(b5, -1, axis=1) & np.roll(b5, -2, axis=1))).reshape(25, count)
+            state[0] ^= round_constant
+    digests = np.ascontiguousarray(state[:4].T).astype("<u8").tobytes()
+    return [digests[32 * i:32 * i + 32] for i in range(count)]
+
+
+def keccak256_many(messages: Sequence[bytes], min_batch: int = 32) -> List[bytes]:
+    """Return the Keccak-256 digest of every message, in order.
+
+    Without pycryptodome, messages that pad to the same number of
+    blocks are permuted together as columns of one ``(25, n)`` lane array, so
+    the per-round Python overhead is paid once per group instead of once per
+    message. Groups smaller than ``min_batch`` are hashed one by one.
+    """
+    if _pycryptodome_keccak is not None or len(messages) < min_batch:
+        return [keccak256(message) for message in messages]
+    groups: Dict[int, List[int]] = {}
+    padded = [_pad(message) for message in messages]
+    for index, message in enumerate(padded):
+        groups.setdefault(len(message), []).append(index)
+    digests: List[bytes] = [b""] * len(messages)
+    for indexes in groups.values():
+        if len(indexes) < min_batch:
+            hashed = [_keccak256_python(messages[i]) for i in indexes]
+        else:
+            hashed = _keccak256_numpy([padded[i] for i in indexes])
+        for index, digest in zip(indexes, hashed):
+            digests[index] = digest
+    return digests
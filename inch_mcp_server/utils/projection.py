@@ -0,0 +1,113 @@
+"""Field projection for model responses of MCP tools and REST routes."""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union, get_args
+
+from pydantic import BaseModel
+
+# Presets name a set of dotted paths; paths a model does not have are skipped.
+PRESETS: Dict[str, Tuple[str, ...]] = {
+    # Every order field except the long signature, extension and makerTraits hex blobs
+    "compact": (
+        "id", "orderHash", "createDateTime", "remainingMakerAmount", "makerBalance", "makerAllowance",
+        "data.makerAsset", "data.takerAsset", "data.maker", "data.receiver", "data.makingAmount",
+        "data.takingAmount", "data.salt", "makerRate", "takerRate", "isMakerContract", "orderInvalidReason",
+    ),
+}
+
+FieldsArg = Union[str, Iterable[str], None]
+
+
+def parse_fields(fields: FieldsArg) -> Optional[Tuple[str, ...]]:
+    """Normalize a comma-separated string or list of field names; None or empty means all fields."""
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    names = tuple(name.strip() for name in fields if name and name.strip())
+    return names or None
+
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Return the model class inside an annotation such as ``Model``, ``Optional[Model]`` or ``list[Model]``."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = _nested_model(arg)
+        if model is not None:
+            return model
+    return None
+
+
+def _add_path(include: dict, model: Type[BaseModel], path: str, strict: bool) -> None:
+    node, current = include, model
+    parts = path.split(".")
+    for depth, part in enumerate(parts):
+        field = current.model_fields.get(part) if current is not None else None
+        if field is None:
+            if strict:
+                raise ValueError("Unknown field '{}'. Valid fields: {}".format(
+                    path, ", ".join(list(model.model_fields) + sorted(PRESETS))))
+            return
+        if depth == len(parts) - 1:
+            node[part] = True
+            return
+        child = node.get(part)
+        if child is True:  # the whole sub-model is already included
+            return
+        node = node.setdefault(part, {})
+        current = _nested_model(field.annotation)
+
+
+@lru_cache(maxsize=256)
+def build_include(model: Type[BaseModel], fields: Tuple[str, ...]) -> dict:
+    """Translate field names, dotted paths (``data.makerAsset``) and preset names into a ``model_dump`` include."""
+    include: dict = {}
+    for name in fields:
+        if name in PRESETS:
+            for path in PRESETS[name]:
+                _add_path(include, model, path, strict=False)
+        else:
+            _add_path(include, model, name, strict=True)
+    return include
+
+
+def validate_fields(model: Type[BaseModel], fields: FieldsArg) -> Optional[Tuple[str, ...]]:
+    """Parse ``fields`` and check them against ``model``, raising ValueError for unknown names."""
+    names = parse_fields(fields)
+    if names is not None:
+        build_include(model, names)
+    return names
+
+
+def project(value: Union[BaseModel, List[BaseModel]], fields: FieldsArg = None,
+            items: Optional[str] = None) -> Union[dict, List[dict]]:
+    """Dump a model or list of models keeping only the requested fields.
+
+    Unrequested fields are never serialized, so long hex blobs cost nothing
+    when they are projected away.
+
+    Args:
+        value: Model instance or list of instances of one model class
+        fields: Field names, dotted paths or preset names; None dumps everything
+        items: Name of a list field of ``value`` whose items the projection applies to
+            (e.g. ``orders``); the other top-level fields are kept as they are
+
+    Returns:
+        dict or list of dicts with the projected fields
+    """
+    names = parse_fields(fields)
+    if isinstance(value, list):
+        if names is None or not value:
+            return [item.model_dump() for item in value]
+        include = build_include(type(value[0]), names)
+        return [item.model_dump(include=include) for item in value]
+
+    if names is None:
+        return value.model_dump()
+    model = type(value)
+    if items is None:
+        return value.model_dump(include=build_include(model, names))
+    include = {name: True for name in model.model_fields if name != items}
+    include[items] = {"__all__": build_include(_nested_model(model.model_fields[items].annotation), names)}
+    return value.model_dump(include=include)
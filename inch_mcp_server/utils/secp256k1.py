@@ -0,0 +1,129 @@
+"""Ethereum signer recovery (``ecrecover``) over secp256k1."""
+
+from typing import Optional, Tuple
+
+from inch_mcp_server.utils.keccak import keccak256
+
+try:
+    import coincurve
+except ImportError:  # coincurve is a dependency; this fallback covers platforms without its wheels
+    coincurve = None
+
+P = 2 ** 256 - 2 ** 32 - 977
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+G = (
+    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+)
+
+# Jacobian point (X, Y, Z) with affine x = X / Z^2, y = Y / Z^3; Z == 0 is the point at infinity
+JacobianPoint = Tuple[int, int, int]
+
+
+def _double(point: JacobianPoint) -> JacobianPoint:
+    x, y, z = point
+    if not y or not z:
+        return 0, 0, 0
+    ysq = y * y % P
+    s = 4 * x * ysq % P
+    m = 3 * x * x % P
+    nx = (m * m - 2 * s) % P
+    ny = (m * (s - nx) - 8 * ysq * ysq) % P
+    return nx, ny, 2 * y * z % P
+
+
+def _add(p: JacobianPoint, q: JacobianPoint) -> JacobianPoint:
+    if not p[2]:
+        return q
+    if not q[2]:
+        return p
+    x1, y1, z1 = p
+    x2, y2, z2 = q
+    z1z1, z2z2 = z1 * z1 % P, z2 * z2 % P
+    u1, u2 = x1 * z2z2 % P, x2 * z1z1 % P
+    s1, s2 = y1 * z2 * z2z2 % P, y2 * z1 * z1z1 % P
+    if u1 == u2:
+        return _double(p) if s1 == s2 else (0, 0, 0)
+    h, r = (u2 - u1) % P, (s2 - s1) % P
+    hh = h * h % P
+    hhh = h * hh % P
+    v = u1 * hh % P
+    nx = (r * r - hhh - 2 * v) % P
+    ny = (r * (v - nx) - s1 * hhh) % P
+    return nx, ny, h * z1 * z2 % P
+
+
+def _multiply_add(a: int, p: JacobianPoint, b: int, q: JacobianPoint) -> JacobianPoint:
+    """``a*p + b*q`` with one shared double-and-add pass (Shamir's trick)."""
+    pq = _add(p, q)
+    result = (0, 0, 0)
+    for bit in range(max(a.bit_length(), b.bit_length()) - 1, -1, -1):
+        result = _double(result)
+        step = ((a >> bit) & 1, (b >> bit) & 1)
+        if step == (1, 1):
+            result = _add(result, pq)
+        elif step == (1, 0):
+            result = _add(result, p)
+        elif step == (0, 1):
+            result = _add(result, q)
+    return result
+
+
+def _to_affine(point: JacobianPoint) -> Optional[Tuple[int, int]]:
+    x, y, z = point
+    if not z:
+        return None
+    z_inv = pow(z, -1, P)
+    z_inv2 = z_inv * z_inv % P
+    return x * z_inv2 % P, y * z_inv2 * z_inv % P
+
+
+def split_signature(signature: str) -> Tuple[int, int, int]:
+    """Parse a 65-byte ``r || s || v`` or 64-byte EIP-2098 ``r || vs`` hex signature into ``(r, s, recovery id)``.
+
+    Raises:
+        ValueError: If the signature is not valid hex of either length or ``v`` is out of range
+    """
+    raw = bytes.fromhex(signature[2:] if signature.startswith("0x") else signature)
+    if len(raw) == 65:
+        r, s, v = int.from_bytes(raw[:32], "big"), int.from_bytes(raw[32:64], "big"), raw[64]
+        if v >= 27:
+            v -= 27
+    elif len(raw) == 64:
+        r, vs = int.from_bytes(raw[:32], "big"), int.from_bytes(raw[32:], "big")
+        s, v = vs & ((1 << 255) - 1), vs >> 255
+    else:
+        raise ValueError("signature must be 64 or 65 bytes, got {}".format(len(raw)))
+    if v not in (0, 1):
+        raise ValueError("signature has an invalid recovery id")
+    return r, s, v
+
+
+def recover_address(message_hash: bytes, signature: str) -> str:
+    """Return the lowercase address that signed ``message_hash``, rejecting malleable (high-s) signatures.
+
+    Raises:
+        ValueError: If the signature is malformed or does not recover to a point on the curve
+    """
+    r, s, v = split_signature(signature)
+    if not (0 < r < N and 0 < s <= N // 2):
+        raise ValueError("signature r/s values are out of range")
+    if coincurve is not None:
+        compact = r.to_bytes(32, "big") + s.to_bytes(32, "big") + bytes([v])
+        public_key = coincurve.PublicKey.from_signature_and_message(compact, message_hash, hasher=None)
+        return "0x" + keccak256(public_key.format(compressed=False)[1:])[-20:].hex()
+
+    y_squared = (pow(r, 3, P) + 7) % P
+    y = pow(y_squared, (P + 1) // 4, P)
+    if y * y % P != y_squared:
+        raise ValueError("signature does not correspond to a curve point")
+    if y % 2 != v:
+        y = P - y
+    e = int.from_bytes(message_hash, "big")
+    r_inv = pow(r, -1, N)
+    # Q = r^-1 (s*R - e*G) = (-e * r^-1) G + (s * r^-1) R
+    point = _to_affine(_multiply_add((-e * r_inv) % N, (G[0], G[1], 1), s * r_inv % N, (r, y, 1)))
+    if point is None:
+        raise ValueError("signature recovers to the point at infinity")
+    public_key = point[0].to_bytes(32, "big") + point[1].to_bytes(32, "big")
+    return "0x" + keccak256(public_key)[-20:].hex()
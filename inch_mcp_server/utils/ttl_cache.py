@@ -0,0 +1,57 @@
+"""Bounded in-memory cache with per-entry time-to-live."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """LRU cache whose entries also expire ``ttl`` seconds after being set.
+
+    Expired entries are dropped lazily on access and the least recently used
+    entry is evicted when the cache is full, so no background task is needed.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, V]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Optional[V]:
+        """Return the value for ``key`` or ``default`` if it is missing or expired."""
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds (the cache default if omitted)."""
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Optional[V]:
+        """Remove ``key`` and return its value, expired or not."""
+        item = self._data.pop(key, _MISSING)
+        return default if item is _MISSING else item[1]
+
+    def items(self) -> Iterator[Tuple[Hashable, V]]:
+        """Iterate over live entries without touching their recency."""
+        now = time.monotonic()
+        return ((key, value) for key, (expires_at, value) in list(self._data.items()) if expires_at > now)
+
+    def clear(self) -> None:
+        self._data.clear()
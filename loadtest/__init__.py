@@ -0,0 +1 @@
+"""Local orderbook stand-in and load generator for the 1inch MCP server."""
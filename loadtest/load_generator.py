@@ -0,0 +1,221 @@
+"""Closed-loop load generator for the REST routes and the MCP HTTP app.
+
+Each concurrency level runs ``N`` workers for ``--duration`` seconds. Every
+worker repeatedly picks a scenario from the weighted mix, so REST and MCP
+traffic hit the server at the same time. Throughput, p50/p95/p99 latency and
+error rate are reported per scenario and for the whole level.
+
+Usage:
+    python -m loadtest.load_generator --target http://localhost:8000 --concurrency 1,8,32,128 --duration 15
+    python -m loadtest.load_generator --scenarios rest.order_by_hash,mcp.order_by_hash --output sweep.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from fastmcp import Client
+from fastmcp.client.transports import StreamableHttpTransport
+
+from loadtest.payloads import random_hex
+
+CHAIN = 1
+
+Scenario = Callable[[random.Random, httpx.AsyncClient, Optional[Client]], Awaitable[bool]]
+
+
+async def rest_order_by_hash(rng, http, mcp) -> bool:
+    response = await http.get(f"/orders/{random_hex(rng, 32)}", params={"chain": CHAIN})
+    return response.status_code == 200
+
+
+async def rest_fee(rng, http, mcp) -> bool:
+    params = {
+        "makerAsset": random_hex(rng, 20),
+        "takerAsset": random_hex(rng, 20),
+        "makerAmount": rng.randint(1, 10**20),
+        "takerAmount": rng.randint(1, 10**20),
+    }
+    response = await http.get(f"/orders/fee/{CHAIN}", params=params)
+    return response.status_code == 200
+
+
+async def rest_count(rng, http, mcp) -> bool:
+    # The route declares ``statuses: List[int]`` without Query(), so FastAPI reads it from the body
+    response = await http.request("GET", f"/orders/count/{CHAIN}", json=[rng.choice([1, 2, 3])])
+    return response.status_code == 200
+
+
+async def rest_unique_pairs(rng, http, mcp) -> bool:
+    response = await http.get(f"/orders/unique-active-pairs/{CHAIN}", params={"page": rng.randint(1, 15)})
+    return response.status_code == 200
+
+
+async def rest_orders_by_address(rng, http, mcp) -> bool:
+    # Goes through the database diff; needs a reachable Postgres behind the server
+    response = await http.get("/orders", params={"chain": CHAIN, "address": random_hex(rng, 20)})
+    return response.status_code == 200
+
+
+async def mcp_order_by_hash(rng, http, mcp) -> bool:
+    result = await mcp.call_tool(
+        "get_limit_order_by_hash", {"chain": CHAIN, "order_hash": random_hex(rng, 32)}, raise_on_error=False
+    )
+    return not result.is_error
+
+
+async def mcp_fee_info(rng, http, mcp) -> bool:
+    arguments = {
+        "chain": CHAIN,
+        "maker_asset": random_hex(rng, 20),
+        "taker_asset": random_hex(rng, 20),
+        "maker_amount": rng.randint(1, 10**18),
+        "taker_amount": rng.randint(1, 10**18),
+    }
+    result = await mcp.call_tool("get_limit_order_fee_info", arguments, raise_on_error=False)
+    return not result.is_error
+
+
+async def mcp_unique_pairs(rng, http, mcp) -> bool:
+    result = await mcp.call_tool(
+        "get_unique_active_token_pairs", {"chain": CHAIN, "page": rng.randint(1, 15)}, raise_on_error=False
+    )
+    return not result.is_error
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "rest.order_by_hash": rest_order_by_hash,
+    "rest.fee": rest_fee,
+    "rest.count": rest_count,
+    "rest.unique_pairs": rest_unique_pairs,
+    "rest.orders_by_address": rest_orders_by_address,
+    "mcp.order_by_hash": mcp_order_by_hash,
+    "mcp.fee_info": mcp_fee_info,
+    "mcp.unique_pairs": mcp_unique_pairs,
+}
+
+DEFAULT_MIX = {
+    "rest.order_by_hash": 3,
+    "rest.fee": 2,
+    "rest.count": 1,
+    "rest.unique_pairs": 1,
+    "mcp.order_by_hash": 3,
+    "mcp.fee_info": 2,
+    "mcp.unique_pairs": 1,
+}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> dict:
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "throughput_rps": len(values) / elapsed if elapsed else 0.0,
+        "error_rate": errors / len(values) if values else 0.0,
+        "p50_ms": percentile(values, 0.50) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+        "p99_ms": percentile(values, 0.99) * 1000,
+        "mean_ms": statistics.fmean(values) * 1000 if values else 0.0,
+    }
+
+
+async def run_level(target: str, mcp_path: str, concurrency: int, duration: float, mix: Dict[str, int]) -> dict:
+    """Run one concurrency level and return per-scenario and total summaries."""
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    needs_mcp = any(name.startswith("mcp.") for name in names)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=target, timeout=60, limits=limits) as http:
+        start = time.perf_counter()
+        stop_at = start + duration
+
+        async def worker(worker_id: int):
+            rng = random.Random(worker_id)
+            mcp = Client(StreamableHttpTransport(f"{target}{mcp_path}")) if needs_mcp else None
+            if mcp:
+                await mcp.__aenter__()
+            try:
+                while time.perf_counter() < stop_at:
+                    name = rng.choices(names, weights)[0]
+                    began = time.perf_counter()
+                    try:
+                        ok = await SCENARIOS[name](rng, http, mcp)
+                    except Exception:
+                        ok = False
+                    latencies[name].append(time.perf_counter() - began)
+                    if not ok:
+                        errors[name] += 1
+            finally:
+                if mcp:
+                    await mcp.__aexit__(None, None, None)
+
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    scenarios = {name: summarize(latencies[name], errors[name], elapsed) for name in names if latencies[name]}
+    all_latencies = [value for values in latencies.values() for value in values]
+    total = summarize(all_latencies, sum(errors.values()), elapsed)
+    return {"concurrency": concurrency, "total": total, "scenarios": scenarios}
+
+
+def print_level(level: dict) -> None:
+    print(f"\n== concurrency {level['concurrency']} ==")
+    print(f"{'scenario':<26} {'reqs':>7} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>8}")
+    rows = list(level["scenarios"].items()) + [("TOTAL", level["total"])]
+    for name, summary in rows:
+        print(
+            f"{name:<26} {summary['requests']:>7} {summary['throughput_rps']:>9.1f} {summary['p50_ms']:>9.1f} "
+            f"{summary['p95_ms']:>9.1f} {summary['p99_ms']:>9.1f} {summary['error_rate']:>7.1%}"
+        )
+
+
+async def sweep(args: argparse.Namespace) -> List[dict]:
+    if args.scenarios:
+        mix = {name: DEFAULT_MIX.get(name, 1) for name in args.scenarios.split(",")}
+    else:
+        mix = dict(DEFAULT_MIX)
+    unknown = set(mix) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    levels = []
+    for concurrency in (int(value) for value in args.concurrency.split(",")):
+        level = await run_level(args.target.rstrip("/"), args.mcp_path, concurrency, args.duration, mix)
+        print_level(level)
+        levels.append(level)
+    return levels
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for the 1inch MCP server")
+    parser.add_argument("--target", default="http://localhost:8000", help="Base URL of the MCP server")
+    parser.add_argument("--mcp-path", default="/mcp-server/mcp/", help="Path of the mounted MCP HTTP app")
+    parser.add_argument("--concurrency", default="1,4,16,64", help="Comma-separated concurrency sweep")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per concurrency level")
+    parser.add_argument("--scenarios", default=None, help=f"Comma-separated subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--output", default=None, help="Write the sweep results to this JSON file")
+    args = parser.parse_args()
+
+    levels = asyncio.run(sweep(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(levels, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
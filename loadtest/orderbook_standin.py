@@ -0,0 +1,252 @@
+"""Local ASGI stand-in for the 1inch ``orderbook/v4.0`` API.
+
+Serves deterministic synthetic data for every endpoint ``LimitOrderAPIClient``
+calls, with injectable latency, 5xx errors and 429s so the MCP server can be
+load-tested without spending real API quota.
+
+Usage:
+    python -m loadtest.orderbook_standin --port 8080 --latency-ms 40 --jitter-ms 20 --throttle-rate 0.01
+
+Then start the server against it:
+    INCH_API_BASE_URL=http://localhost:8080/orderbook/v4.0/ 1inch-mcp
+
+Fault settings can be changed while running via ``POST /_standin/config``.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+import uvicorn
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from loadtest.payloads import make_order, make_token_universe
+
+ORDERS_PER_ADDRESS = 20
+TOKENS_PER_CHAIN = 200
+PAIRS_PER_CHAIN = 1500
+ORDERS_PER_PAIR = 400
+
+
+@dataclass
+class FaultConfig:
+    """Failure and latency injection applied to every orderbook request."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    rate_limit_rps: float = 0.0
+
+
+class RateLimiter:
+    """Token bucket mimicking the upstream per-key requests-per-second limit."""
+
+    def __init__(self, rps: float):
+        self.rps = rps
+        self.tokens = rps
+        self.updated = time.monotonic()
+
+    def allow(self) -> bool:
+        if self.rps <= 0:
+            return True
+        now = time.monotonic()
+        self.tokens = min(self.rps, self.tokens + (now - self.updated) * self.rps)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+def _seed(*parts) -> int:
+    return int.from_bytes(hashlib.blake2b(":".join(map(str, parts)).encode(), digest_size=8).digest(), "big")
+
+
+class SyntheticOrderbook:
+    """Lazily generated, deterministic per-chain order data."""
+
+    def __init__(self):
+        self._tokens: Dict[int, List[str]] = {}
+        self._pairs: Dict[int, List[dict]] = {}
+        self._by_address: Dict[tuple, List[dict]] = {}
+        self._by_hash: Dict[tuple, dict] = {}
+        self._by_pair: Dict[tuple, List[dict]] = {}
+
+    def tokens(self, chain: int) -> List[str]:
+        if chain not in self._tokens:
+            self._tokens[chain] = make_token_universe(random.Random(_seed("tokens", chain)), TOKENS_PER_CHAIN)
+        return self._tokens[chain]
+
+    def pairs(self, chain: int) -> List[dict]:
+        if chain not in self._pairs:
+            rng = random.Random(_seed("pairs", chain))
+            tokens = self.tokens(chain)
+            pairs = set()
+            while len(pairs) < PAIRS_PER_CHAIN:
+                pairs.add(tuple(rng.sample(tokens, 2)))
+            self._pairs[chain] = [{"makerAsset": maker, "takerAsset": taker} for maker, taker in sorted(pairs)]
+        return self._pairs[chain]
+
+    def orders_for_address(self, chain: int, address: str) -> List[dict]:
+        key = (chain, address.lower())
+        if key not in self._by_address:
+            rng = random.Random(_seed("address", *key))
+            orders = [make_order(rng, self.tokens(chain), address.lower()) for _ in range(ORDERS_PER_ADDRESS)]
+            for order in orders:
+                self._by_hash[(chain, order["orderHash"])] = order
+            self._by_address[key] = orders
+        return self._by_address[key]
+
+    def orders_for_pair(self, chain: int, maker_asset: str, taker_asset: str) -> List[dict]:
+        key = (chain, maker_asset.lower(), taker_asset.lower())
+        if key not in self._by_pair:
+            rng = random.Random(_seed("pair", *key))
+            # Rates cluster around a pair-specific mid price, like a real book
+            mid = 10 ** rng.uniform(-3, 3)
+            orders = []
+            for _ in range(rng.randint(0, ORDERS_PER_PAIR)):
+                order = make_order(rng, self.tokens(chain))
+                making = rng.randint(10**15, 10**21)
+                taking = int(making * mid * rng.uniform(0.95, 1.05))
+                order["data"].update(makerAsset=key[1], takerAsset=key[2], makingAmount=str(making),
+                                     takingAmount=str(taking))
+                order["remainingMakerAmount"] = str(rng.randint(0, making))
+                order["makerRate"] = "{:.18f}".format(taking / making)
+                order["takerRate"] = "{:.18f}".format(making / taking) if taking else "0"
+                self._by_hash[(chain, order["orderHash"])] = order
+                orders.append(order)
+            self._by_pair[key] = orders
+        return self._by_pair[key]
+
+    def order_by_hash(self, chain: int, order_hash: str) -> dict:
+        key = (chain, order_hash.lower())
+        if key not in self._by_hash:
+            order = make_order(random.Random(_seed("order", *key)), self.tokens(chain))
+            order["orderHash"] = order_hash.lower()
+            self._by_hash[key] = order
+        return self._by_hash[key]
+
+    def add_order(self, chain: int, payload: dict) -> None:
+        order = make_order(random.Random(_seed("post", chain, payload["orderHash"])), self.tokens(chain))
+        order.update(orderHash=payload["orderHash"], signature=payload["signature"], data=payload["data"])
+        order["remainingMakerAmount"] = payload["data"]["makingAmount"]
+        self._by_hash[(chain, payload["orderHash"].lower())] = order
+        self._by_address.setdefault((chain, payload["data"]["maker"].lower()), []).append(order)
+
+
+def create_app(faults: Optional[FaultConfig] = None) -> FastAPI:
+    """Build the stand-in ASGI app."""
+    faults = faults or FaultConfig()
+    book = SyntheticOrderbook()
+    limiter = RateLimiter(faults.rate_limit_rps)
+    stats = {"requests": 0, "errors": 0, "throttled": 0}
+
+    app = FastAPI(title="1inch orderbook stand-in", docs_url=None, redoc_url=None)
+    router = APIRouter(prefix="/orderbook/v4.0/{chain}")
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        if not request.url.path.startswith("/orderbook/"):
+            return await call_next(request)
+        stats["requests"] += 1
+        delay = faults.latency_ms + random.uniform(0, faults.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if not limiter.allow() or random.random() < faults.throttle_rate:
+            stats["throttled"] += 1
+            return JSONResponse({"statusCode": 429, "message": "Too Many Requests"}, status_code=429,
+                                headers={"Retry-After": "1"})
+        if random.random() < faults.error_rate:
+            stats["errors"] += 1
+            return JSONResponse({"statusCode": 500, "message": "Injected failure"}, status_code=500)
+        return await call_next(request)
+
+    @router.get("/address/{address}")
+    async def orders_by_address(chain: int, address: str, page: int = 1, limit: int = 100):
+        orders = book.orders_for_address(chain, address)
+        return orders[(page - 1) * limit: page * limit]
+
+    @router.get("/all")
+    async def orders_by_pair(chain: int, makerAsset: str, takerAsset: str, page: int = 1, limit: int = 100):
+        orders = book.orders_for_pair(chain, makerAsset, takerAsset)
+        return orders[(page - 1) * limit: page * limit]
+
+    @router.get("/order/{order_hash}")
+    async def order_by_hash(chain: int, order_hash: str):
+        return book.order_by_hash(chain, order_hash)
+
+    @router.get("/fee-info")
+    async def fee_info(chain: int, makerAsset: str, takerAsset: str, makerAmount: int, takerAmount: int):
+        rng = random.Random(_seed("fee", chain, makerAsset.lower(), takerAsset.lower()))
+        return {
+            "whitelist": {},
+            "feeBps": rng.choice([0, 0, 5, 10, 25]),
+            "whitelistDiscountPercent": rng.choice([0, 50]),
+            "protocolFeeReceiver": "0x90cbe4bdd538d6e9b379bff5fe72c3d67a521de5",
+            "extensionAddress": "0xc0dfdb9e7a392c3dbbe7c6fbe8fbc1789c9fe05e",
+        }
+
+    @router.get("/count")
+    async def count(chain: int, statuses: str = "1,2,3", takerAsset: str = None, makerAsset: str = None):
+        return {"count": random.Random(_seed("count", chain, statuses, takerAsset, makerAsset)).randint(0, 5000)}
+
+    @router.get("/unique-active-pairs")
+    async def unique_active_pairs(chain: int, page: int = 1, limit: int = 100):
+        pairs = book.pairs(chain)
+        total_pages = (len(pairs) + limit - 1) // limit
+        return {
+            "items": pairs[(page - 1) * limit: page * limit],
+            "meta": {"totalItems": len(pairs), "currentPage": page, "itemsPerPage": limit, "totalPages": total_pages},
+        }
+
+    @router.post("")
+    async def post_order(chain: int, request: Request):
+        book.add_order(chain, await request.json())
+        return {"success": True}
+
+    app.include_router(router)
+
+    @app.get("/_standin/config")
+    async def get_config():
+        return {"faults": asdict(faults), "stats": stats}
+
+    @app.post("/_standin/config")
+    async def update_config(changes: dict):
+        for name, value in changes.items():
+            if hasattr(faults, name):
+                setattr(faults, name, float(value))
+        limiter.rps = limiter.tokens = faults.rate_limit_rps
+        return {"faults": asdict(faults)}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the 1inch orderbook v4.0 API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed latency added to every request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform random extra latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a 500 response")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Probability of a random 429 response")
+    parser.add_argument("--rate-limit-rps", type=float, default=0.0, help="Return 429 above this rate (0 = off)")
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rate_limit_rps=args.rate_limit_rps,
+    )
+    uvicorn.run(create_app(faults), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Synthetic orders shaped like 1inch orderbook v4 responses, shared by the load tools and the benchmarks."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def random_hex(rng: random.Random, n_bytes: int) -> str:
+    """Return a 0x-prefixed hex string with ``n_bytes`` random bytes."""
+    return "0x" + rng.randbytes(n_bytes).hex()
+
+
+def make_token_universe(rng: random.Random, size: int = 50) -> List[str]:
+    """Build a fixed list of token addresses to draw order pairs from."""
+    return [random_hex(rng, 20) for _ in range(size)]
+
+
+def make_order(rng: random.Random, tokens: List[str], maker: str = None) -> dict:
+    """Build one order in the shape returned by ``GET /{chain}/address/{address}``."""
+    maker_asset, taker_asset = rng.sample(tokens, 2)
+    making = rng.randint(10**15, 10**24)
+    taking = rng.randint(10**6, 10**22)
+    remaining = rng.randint(0, making)
+    created = datetime(2025, 8, 1, tzinfo=timezone.utc) + timedelta(seconds=rng.randint(0, 10**7))
+    return {
+        "signature": random_hex(rng, 65),
+        "orderHash": random_hex(rng, 32),
+        "createDateTime": created.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "remainingMakerAmount": str(remaining),
+        "makerBalance": str(rng.randint(0, 10**25)),
+        "makerAllowance": str(rng.randint(0, 2**256 - 1)),
+        "data": {
+            "makerAsset": maker_asset,
+            "takerAsset": taker_asset,
+            "maker": maker or random_hex(rng, 20),
+            "receiver": ZERO_ADDRESS,
+            "makingAmount": str(making),
+            "takingAmount": str(taking),
+            "salt": str(rng.getrandbits(256)),
+            "extension": random_hex(rng, rng.randint(0, 256)) if rng.random() < 0.5 else "0x",
+            "makerTraits": random_hex(rng, 32),
+        },
+        "makerRate": "{:.18f}".format(taking / making),
+        "takerRate": "{:.18f}".format(making / taking),
+        "isMakerContract": False,
+        "orderInvalidReason": None,
+    }
@@ -0,0 +1,17 @@
+"""Test setup shared by the suite.
+
+Importing the package builds ``Settings()``, which needs the Postgres
+connection variables; the tests never connect, so placeholders are set
+before any test module imports it. Values from the environment win.
+"""
+
+import os
+
+for name, value in {
+    "POSTGRES_USER": "test",
+    "POSTGRES_PASSWORD": "test",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DB": "test",
+}.items():
+    os.environ.setdefault(name, value)
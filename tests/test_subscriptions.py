@@ -0,0 +1,46 @@
+"""Resource subscriptions rely on FastMCP internals; these tests fail if an upgrade moves them."""
+
+import pytest
+from fastmcp import FastMCP
+
+from inch_mcp_server.handlers.subscriptions import ResourceSubscriptions, low_level_server
+
+
+class StubWatcher:
+    def __init__(self):
+        self.listeners = []
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+
+def _server_with_resource():
+    mcp = FastMCP("test")
+
+    @mcp.resource("limit-order://{chain}/order/{order_hash}")
+    def order(chain: int, order_hash: str) -> str:
+        return order_hash
+
+    return mcp
+
+
+def test_low_level_server_is_reachable():
+    mcp = FastMCP("test")
+    assert low_level_server(mcp) is mcp._mcp_server
+
+
+def test_missing_low_level_server_fails_loudly():
+    with pytest.raises(RuntimeError):
+        low_level_server(object())
+
+
+def test_subscribe_capability_is_advertised():
+    mcp = _server_with_resource()
+    server = low_level_server(mcp)
+    assert server.create_initialization_options().capabilities.resources.subscribe is False
+
+    watcher = StubWatcher()
+    subscriptions = ResourceSubscriptions(mcp, watcher)
+
+    assert server.create_initialization_options().capabilities.resources.subscribe is True
+    assert watcher.listeners == [subscriptions.notify]